@@ -0,0 +1,137 @@
+# ==========================================
+# SkillGapAI - Synthetic Benchmark Corpus
+# Resume-like TXT, DOCX, text-layer PDF and scanned PDF documents
+# ==========================================
+#
+# Usage: python benchmarks/corpus.py OUTPUT_DIR [--pages 1 10 50 200] [--seed 0]
+#
+# Every document is generated from the same seeded page text, so one size
+# in all four formats holds identical content. Skills are drawn from the
+# shipped taxonomy at roughly the density of a real CV. Scanned PDFs are
+# rasterised pages with no text layer, so they go through OCR. Needs fpdf,
+# python-docx and Pillow for the binary formats.
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from skillgap_core.taxonomy import get_taxonomy  # noqa: E402
+
+LINES_PER_PAGE = 40
+FORMATS = ("txt", "docx", "pdf", "scanned.pdf")
+
+FILLER = (
+    "Led a cross-functional team to deliver the quarterly roadmap on schedule",
+    "Designed and maintained services handling millions of requests per day",
+    "Worked closely with stakeholders to gather requirements and plan releases",
+    "Reduced infrastructure costs by consolidating legacy batch jobs",
+    "Mentored junior engineers and reviewed code across several repositories",
+    "Improved reporting accuracy for the finance and operations teams",
+)
+
+
+def page_lines(pages, seed=0):
+    """Deterministic resume-like text: LINES_PER_PAGE lines per page"""
+    rng = random.Random(seed)
+    skills = [name for names in get_taxonomy().categories.values() for name in names]
+    lines = []
+    for page in range(pages):
+        lines.append(f"Experience - Position {page + 1}")
+        for _ in range(LINES_PER_PAGE - 1):
+            sentence = rng.choice(FILLER)
+            if rng.random() < 0.6:
+                sentence += f" using {rng.choice(skills)}"
+                if rng.random() < 0.4:
+                    sentence += f" and {rng.choice(skills)}"
+            lines.append(sentence + ".")
+    return lines
+
+
+def write_txt(lines, path):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines))
+
+
+def write_docx(lines, path):
+    import docx
+
+    document = docx.Document()
+    for line in lines:
+        document.add_paragraph(line)
+    document.save(path)
+
+
+def write_pdf(lines, path):
+    from fpdf import FPDF
+
+    pdf = FPDF()
+    pdf.set_auto_page_break(False)
+    pdf.set_font("Arial", size=9)
+    for start in range(0, len(lines), LINES_PER_PAGE):
+        pdf.add_page()
+        for line in lines[start:start + LINES_PER_PAGE]:
+            pdf.cell(0, 6.5, txt=line.encode("latin-1", "replace").decode("latin-1"), ln=True)
+    pdf.output(path)
+
+
+def write_scanned_pdf(lines, path, dpi=150):
+    """Render each page to a grayscale PNG and place the images in a PDF, one per page"""
+    from fpdf import FPDF
+    from PIL import Image, ImageDraw, ImageFont
+
+    width, height = int(8.27 * dpi), int(11.69 * dpi)
+    font = ImageFont.load_default()
+    pdf = FPDF()
+    pdf.set_auto_page_break(False)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for page, start in enumerate(range(0, len(lines), LINES_PER_PAGE)):
+            image = Image.new("L", (width, height), 255)
+            draw = ImageDraw.Draw(image)
+            for row, line in enumerate(lines[start:start + LINES_PER_PAGE]):
+                draw.text((dpi // 2, dpi // 2 + row * dpi // 4), line, fill=0, font=font)
+            image_path = os.path.join(tmp_dir, f"page-{page}.png")
+            image.save(image_path)
+            pdf.add_page()
+            pdf.image(image_path, x=0, y=0, w=210, h=297)
+        pdf.output(path)
+
+
+WRITERS = {
+    "txt": write_txt,
+    "docx": write_docx,
+    "pdf": write_pdf,
+    "scanned.pdf": write_scanned_pdf,
+}
+
+
+def generate(output_dir, pages=(1, 10, 50, 200), formats=FORMATS, seed=0):
+    """Write resume-<pages>p.<format> files; returns {(format, pages): path}"""
+    os.makedirs(output_dir, exist_ok=True)
+    paths = {}
+    for count in pages:
+        lines = page_lines(count, seed)
+        for fmt in formats:
+            path = os.path.join(output_dir, f"resume-{count}p.{fmt}")
+            if not os.path.exists(path):
+                WRITERS[fmt](lines, path)
+            paths[(fmt, count)] = path
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("output_dir")
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 10, 50, 200])
+    parser.add_argument("--formats", nargs="+", default=list(FORMATS), choices=FORMATS)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    for (fmt, count), path in sorted(generate(args.output_dir, args.pages, args.formats, args.seed).items()):
+        print(f"{fmt:<12} {count:>4} pages  {os.path.getsize(path):>10} bytes  {path}")
+
+
+if __name__ == "__main__":
+    main()
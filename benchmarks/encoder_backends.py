@@ -0,0 +1,98 @@
+# ==========================================
+# SkillGapAI - Encoder Backend Benchmark
+# Throughput of torch / ONNX / int8 encoders and how far their cosines drift
+# ==========================================
+#
+# Usage: python benchmarks/encoder_backends.py [--backends torch onnx onnx-int8] [--pairs 2000]
+#
+# Skill pairs come from the taxonomy: aliases with their skill, skills that
+# share a category, and random cross-category pairs, so the set covers the
+# matched, partial and missing bands. Every backend's cosine for each pair
+# is compared with the fp32 torch reference, including how often the
+# Milestone 3 verdict (matched / partial / missing) changes.
+
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from skillgap_core.encoders import BACKENDS, create_encoder  # noqa: E402
+from skillgap_core.semantic import DEFAULT_MODEL, MATCH_THRESHOLD, PARTIAL_THRESHOLD  # noqa: E402
+from skillgap_core.taxonomy import get_taxonomy  # noqa: E402
+
+
+def skill_pairs(limit, seed=0):
+    """Alias, same-category and random skill pairs from the taxonomy"""
+    rng = random.Random(seed)
+    taxonomy = get_taxonomy()
+    pairs = [(alias, canonical) for alias, canonical in taxonomy.aliases.items() if alias != canonical]
+    for names in taxonomy.categories.values():
+        pairs.extend((a, b) for i, a in enumerate(names) for b in names[i + 1:])
+    skills = [name for names in taxonomy.categories.values() for name in names]
+    pairs.extend((rng.choice(skills), rng.choice(skills)) for _ in range(len(pairs)))
+    rng.shuffle(pairs)
+    return pairs[:limit]
+
+
+def pair_cosines(encoder, pairs):
+    left = np.asarray(encoder.encode([a for a, _ in pairs]), dtype=np.float32)
+    right = np.asarray(encoder.encode([b for _, b in pairs]), dtype=np.float32)
+    left /= np.linalg.norm(left, axis=1, keepdims=True)
+    right /= np.linalg.norm(right, axis=1, keepdims=True)
+    return (left * right).sum(axis=1)
+
+
+def verdicts(cosines):
+    return (cosines < MATCH_THRESHOLD).astype(np.int8) + (cosines < PARTIAL_THRESHOLD)
+
+
+def throughput(encoder, strings, batch_size, repeat):
+    encoder.encode(strings[:batch_size], batch_size=batch_size)  # warm-up
+    started = time.perf_counter()
+    for _ in range(repeat):
+        encoder.encode(strings, batch_size=batch_size)
+    return len(strings) * repeat / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--model", default=DEFAULT_MODEL)
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS), choices=BACKENDS)
+    parser.add_argument("--pairs", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    pairs = skill_pairs(args.pairs)
+    strings = sorted({s for pair in pairs for s in pair})
+    print(f"model {args.model}: {len(pairs)} skill pairs, {len(strings)} distinct strings\n")
+
+    reference = None
+    print(f"{'backend':<10} {'load s':>7} {'strings/s':>10} {'mean |dcos|':>12} {'max |dcos|':>11} {'verdict agree':>14}")
+    for backend in ["torch"] + [b for b in args.backends if b != "torch"]:
+        started = time.perf_counter()
+        try:
+            encoder = create_encoder(args.model, backend)
+        except Exception as e:
+            print(f"{backend:<10} unavailable: {e}")
+            continue
+        load_seconds = time.perf_counter() - started
+        rate = throughput(encoder, strings, args.batch_size, args.repeat)
+        cosines = pair_cosines(encoder, pairs)
+
+        if reference is None:
+            reference = cosines
+            print(f"{backend:<10} {load_seconds:>7.2f} {rate:>10.0f} {'reference':>12}")
+            continue
+        drift = np.abs(cosines - reference)
+        agree = (verdicts(cosines) == verdicts(reference)).mean() * 100
+        print(f"{backend:<10} {load_seconds:>7.2f} {rate:>10.0f} {drift.mean():>12.4f} {drift.max():>11.4f} {agree:>13.1f}%")
+
+
+if __name__ == "__main__":
+    main()
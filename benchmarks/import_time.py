@@ -0,0 +1,66 @@
+# ==========================================
+# SkillGapAI - Import-Time Benchmark
+# Cold import cost of skillgap_core versus the old eager import block
+# ==========================================
+#
+# Usage: python benchmarks/import_time.py [--runs 7]
+#
+# Each measurement runs in a fresh interpreter so nothing is already in
+# sys.modules. "eager" is the import block skillgap_app.py used to run on
+# every start (minus streamlit itself); modules that are not installed here
+# are skipped and listed.
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from importlib.util import find_spec
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+EAGER_MODULES = ["PyPDF2", "docx", "matplotlib.pyplot", "fitz", "pytesseract", "PIL.Image", "fpdf", "sentence_transformers"]
+
+SNIPPETS = {
+    "skillgap_core": "import skillgap_core",
+    "skillgap_core + taxonomy": "import skillgap_core; skillgap_core.get_taxonomy()",
+}
+
+
+def time_import(code):
+    """Wall time in ms for a fresh interpreter to run ``code``, minus bare start-up"""
+    script = f"import time; t = time.perf_counter(); {code}; print((time.perf_counter() - t) * 1000)"
+    out = subprocess.run([sys.executable, "-c", script], cwd=PROJECT_DIR, capture_output=True, text=True, check=True)
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def heavy_modules_loaded(code):
+    """Which of EAGER_MODULES end up in sys.modules after ``code`` runs"""
+    names = repr([m for m in EAGER_MODULES])
+    script = f"import sys; {code}; print([m for m in {names} if m in sys.modules])"
+    out = subprocess.run([sys.executable, "-c", script], cwd=PROJECT_DIR, capture_output=True, text=True, check=True)
+    return out.stdout.strip().splitlines()[-1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=7)
+    args = parser.parse_args()
+
+    installed = [m for m in EAGER_MODULES if find_spec(m.split('.')[0]) is not None]
+    missing = sorted(set(EAGER_MODULES) - set(installed))
+    snippets = dict(SNIPPETS)
+    if installed:
+        snippets["eager (old skillgap_app)"] = "; ".join(f"import {m}" for m in installed)
+
+    print(f"{'import':<28} {'median ms':>10} {'min ms':>8}")
+    for label, code in snippets.items():
+        samples = [time_import(code) for _ in range(args.runs)]
+        print(f"{label:<28} {statistics.median(samples):>10.1f} {min(samples):>8.1f}")
+    print(f"\nheavy modules loaded by 'import skillgap_core': {heavy_modules_loaded(SNIPPETS['skillgap_core'])}")
+    if missing:
+        print(f"not installed, skipped in eager set: {', '.join(missing)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+# ==========================================
+# SkillGapAI - Lexical Pipeline Benchmark
+# Extraction, skill matching, gap analysis and Word report, with baselines
+# ==========================================
+#
+# Usage:
+#   python benchmarks/lexical.py --save benchmarks/baseline.json
+#   python benchmarks/lexical.py --compare benchmarks/baseline.json [--tolerance 0.2]
+#   python benchmarks/lexical.py --pages 1 10 --stages pdf txt extract_skills
+#
+# Each stage runs on the synthetic corpus (benchmarks/corpus.py) at every
+# page count and reports p50 / p99 latency, pages per second and peak RSS.
+# Peak RSS (ru_maxrss, which also sees native allocations such as PyMuPDF's
+# and Tesseract's) comes from one extra run of the stage in a fresh
+# subprocess, reported both as the process peak and as the growth over the
+# peak after imports and input setup. Parse and OCR caches live in a
+# throw-away cache directory and are cleared before every run unless
+# --warm is given.
+#
+# --compare exits with status 1 when any stage's p50 is slower than the
+# baseline by more than --tolerance (a fraction) and by at least
+# --min-delta-ms, so it can gate CI.
+
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+
+# Keep the benchmark's caches away from the app's
+os.environ.setdefault("SKILLGAP_CACHE_DIR", tempfile.mkdtemp(prefix="skillgap-bench-"))
+
+from benchmarks.corpus import generate  # noqa: E402
+from skillgap_core.analysis import calculate_skill_gap, extract_job_title, extract_skills  # noqa: E402
+from skillgap_core.extraction import extract_text_from_docx, extract_text_from_pdf, extract_text_from_txt  # noqa: E402
+from skillgap_core.ocr import get_ocr_cache  # noqa: E402
+from skillgap_core.parse_cache import get_parse_cache  # noqa: E402
+from skillgap_core.reports import generate_word_report  # noqa: E402
+
+PEAK_RSS_RUN = """
+import json, sys
+sys.path.insert(0, {bench_dir!r})
+from lexical import clear_caches, stage_inputs
+from semantic import peak_rss_mb
+paths = {{(fmt, {pages!r}): path for fmt, path in {paths!r}.items()}}
+run = stage_inputs({stage!r}, paths, {pages!r})
+if not {warm!r}:
+    clear_caches()
+setup = peak_rss_mb()
+run()
+print(json.dumps({{"peak_rss_mb": peak_rss_mb(), "setup_rss_mb": setup}}))
+"""
+
+JOB_DESCRIPTION = (
+    "Senior Data Engineer\n"
+    "We need Python, SQL, Apache Spark, Airflow, AWS, Docker, Kubernetes, "
+    "machine learning, communication, leadership and problem solving."
+)
+
+
+def clear_caches():
+    get_parse_cache().clear()
+    ocr_cache = get_ocr_cache()
+    if ocr_cache is not None:
+        ocr_cache.clear()
+
+
+def stage_inputs(stage, paths, pages):
+    """Return a zero-argument callable that runs ``stage`` once for this page count"""
+    def read(fmt):
+        with open(paths[(fmt, pages)], 'rb') as f:
+            return f.read()
+
+    if stage == "pdf":
+        data = read("pdf")
+        return lambda: extract_text_from_pdf(io.BytesIO(data))
+    if stage == "scanned_pdf":
+        data = read("scanned.pdf")
+        return lambda: extract_text_from_pdf(io.BytesIO(data))
+    if stage == "docx":
+        data = read("docx")
+        return lambda: extract_text_from_docx(io.BytesIO(data))
+    if stage == "txt":
+        data = read("txt")
+        return lambda: extract_text_from_txt(io.BytesIO(data))
+
+    text = read("txt").decode('utf-8')
+    if stage == "extract_skills":
+        return lambda: extract_skills(text)
+    resume_skills = extract_skills(text)
+    job_skills = extract_skills(JOB_DESCRIPTION)
+    if stage == "calculate_skill_gap":
+        return lambda: calculate_skill_gap(resume_skills, job_skills)
+    if stage == "generate_word_report":
+        gap = calculate_skill_gap(resume_skills, job_skills)
+        title = extract_job_title(JOB_DESCRIPTION)
+        return lambda: generate_word_report(title, resume_skills, job_skills, gap)
+    raise ValueError(f"Unknown stage '{stage}'")
+
+
+STAGES = ("pdf", "scanned_pdf", "docx", "txt", "extract_skills", "calculate_skill_gap", "generate_word_report")
+CORPUS_FORMATS = {"pdf": "pdf", "scanned_pdf": "scanned.pdf", "docx": "docx"}
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def measure(run, runs, warm):
+    """Time ``runs`` calls; returns the result dict"""
+    samples = []
+    for _ in range(runs):
+        if not warm:
+            clear_caches()
+        started = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - started) * 1000)
+
+    return {
+        'runs': runs,
+        'p50_ms': round(statistics.median(samples), 3),
+        'p99_ms': round(percentile(samples, 0.99), 3),
+        'mean_ms': round(statistics.fmean(samples), 3),
+    }
+
+
+def peak_rss(stage, paths, pages, warm):
+    """Run ``stage`` once in a fresh subprocess; returns its peak RSS and the growth over setup, in MB"""
+    code = PEAK_RSS_RUN.format(
+        bench_dir=os.path.dirname(os.path.abspath(__file__)), stage=stage, pages=pages, warm=warm,
+        paths={fmt: path for (fmt, count), path in paths.items() if count == pages},
+    )
+    out = subprocess.run([sys.executable, "-c", code], cwd=PROJECT_DIR, capture_output=True, text=True)
+    if out.returncode:
+        raise RuntimeError(out.stderr.strip().splitlines()[-1] if out.stderr else f"{stage} memory run failed")
+    rss = json.loads(out.stdout.strip().splitlines()[-1])
+    if rss['peak_rss_mb'] is None:
+        return {'peak_rss_mb': None, 'stage_rss_mb': None}
+    return {'peak_rss_mb': rss['peak_rss_mb'], 'stage_rss_mb': round(rss['peak_rss_mb'] - rss['setup_rss_mb'], 1)}
+
+
+def run_suite(stages, page_counts, runs, warm, corpus_dir):
+    formats = {"txt"} | {CORPUS_FORMATS[s] for s in stages if s in CORPUS_FORMATS}
+    paths = generate(corpus_dir, page_counts, sorted(formats))
+    results = {}
+    for stage in stages:
+        for pages in page_counts:
+            # OCR is slow enough that a couple of runs is plenty at large sizes
+            stage_runs = max(1, min(runs, 3)) if stage == "scanned_pdf" and pages > 10 else runs
+            result = measure(stage_inputs(stage, paths, pages), stage_runs, warm)
+            result.update(peak_rss(stage, paths, pages, warm))
+            result['pages_per_s'] = round(pages / (result['p50_ms'] / 1000), 2) if result['p50_ms'] else 0.0
+            results[f"{stage}/{pages}p"] = result
+            print(f"{stage + '/' + str(pages) + 'p':<28} p50 {result['p50_ms']:>10.2f} ms  "
+                  f"p99 {result['p99_ms']:>10.2f} ms  {result['pages_per_s']:>9.1f} pages/s  "
+                  f"peak RSS {result['peak_rss_mb']} MB (+{result['stage_rss_mb']} MB)", flush=True)
+    return results
+
+
+def compare(results, baseline, tolerance, min_delta_ms=1.0):
+    """Print the p50 change per stage; return the names that regressed past ``tolerance``.
+
+    Stages that got slower by less than ``min_delta_ms`` never count, so
+    sub-millisecond stages do not fail the gate on timer noise.
+    """
+    regressions = []
+    print(f"\n{'stage':<28} {'baseline':>10} {'now':>10} {'change':>8}")
+    for name, result in results.items():
+        before = baseline['stages'].get(name)
+        if before is None:
+            continue
+        change = result['p50_ms'] / before['p50_ms'] - 1 if before['p50_ms'] else 0.0
+        slower_ms = result['p50_ms'] - before['p50_ms']
+        flag = "  REGRESSION" if change > tolerance and slower_ms > min_delta_ms else ""
+        print(f"{name:<28} {before['p50_ms']:>10.2f} {result['p50_ms']:>10.2f} {change:>+7.1%}{flag}")
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--stages", nargs="+", default=list(STAGES), choices=STAGES)
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 10, 50, 200])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--warm", action="store_true", help="keep parse / OCR caches between runs")
+    parser.add_argument("--corpus", default=os.path.join(tempfile.gettempdir(), "skillgap-bench-corpus"))
+    parser.add_argument("--save", help="write results as a JSON baseline")
+    parser.add_argument("--compare", help="baseline JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed p50 slowdown, e.g. 0.2 = 20%%")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0, help="ignore slowdowns smaller than this")
+    args = parser.parse_args()
+
+    results = run_suite(args.stages, args.pages, args.runs, args.warm, args.corpus)
+    report = {
+        'meta': {
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'runs': args.runs,
+            'warm': args.warm,
+        },
+        'stages': results,
+    }
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nbaseline written to {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance, args.min_delta_ms)
+        if regressions:
+            print(f"\n{len(regressions)} stage(s) regressed by more than {args.tolerance:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
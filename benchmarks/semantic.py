@@ -0,0 +1,211 @@
+# ==========================================
+# SkillGapAI - Semantic Matcher Benchmark
+# Encoder cold start, encode throughput, similarity + classification scaling
+# ==========================================
+#
+# Usage:
+#   python benchmarks/semantic.py [--backend torch|onnx|onnx-int8] [--sizes 5 50 500 5000]
+#   python benchmarks/semantic.py --match-threshold 0.75 --partial-threshold 0.45 --json out.json
+#
+# Runs fully offline (HF_HUB_OFFLINE / TRANSFORMERS_OFFLINE are set), so the
+# model must already be in the local Hugging Face cache; run the app once,
+# or pass --online the first time. Reports:
+#   * cold start: a fresh interpreter importing skillgap_core and loading
+#     the encoder, with that process's peak RSS
+#   * encode throughput (strings/s) by batch size and skill-string length
+#   * similarity matrix and classify_matches / classify_embeddings time as
+#     the resume and JD lists grow, with the verdict counts at the chosen
+#     thresholds
+#   * peak RSS of this process at the end
+# The embedding cache is bypassed so the model itself is measured.
+
+import argparse
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+
+COLD_START = """
+import json, sys, time
+started = time.perf_counter()
+from skillgap_core.encoders import create_encoder
+encoder = create_encoder({model!r}, {backend!r})
+loaded = time.perf_counter()
+encoder.encode(["python"])
+first = time.perf_counter()
+sys.path.insert(0, {bench_dir!r})
+from semantic import peak_rss_mb
+print(json.dumps({{"load_s": loaded - started, "first_encode_s": first - loaded, "peak_rss_mb": peak_rss_mb()}}))
+"""
+
+CONTEXT = ("production", "large-scale", "cloud", "enterprise", "real-time", "distributed", "open-source",
+           "advanced", "applied", "modern")
+FILLER = ("designed and shipped data products with", "owned the migration of reporting pipelines to",
+          "mentored engineers on best practices for", "built internal tooling and dashboards around")
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB (None where unsupported)"""
+    try:
+        import resource
+    except ImportError:
+        try:
+            import psutil
+            return round(psutil.Process().memory_info().peak_wset / (1024 * 1024), 1)
+        except Exception:
+            return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def skill_strings(count, length, seed=0):
+    """``count`` distinct skill strings: short (taxonomy names), medium or long phrases"""
+    from skillgap_core.taxonomy import get_taxonomy
+
+    rng = random.Random(seed)
+    skills = sorted({name for names in get_taxonomy().categories.values() for name in names})
+    # Short strings start with the plain names, then "cloud python" / "python sql" variants
+    strings = set(skills[:count]) if length == "short" else set()
+    while len(strings) < count:
+        skill = rng.choice(skills)
+        if length == "short":
+            if rng.random() < 0.5:
+                text = f"{rng.choice(CONTEXT)} {skill}"
+            else:
+                text = f"{skill} {rng.choice(skills)}"
+        elif length == "medium":
+            text = f"{rng.choice(CONTEXT)} {skill} and {rng.choice(skills)} experience"
+        else:
+            text = " ".join(f"{rng.choice(FILLER)} {rng.choice(skills)}" for _ in range(4))
+        strings.add(text)
+    return sorted(strings)
+
+
+def cold_start(model, backend):
+    code = COLD_START.format(model=model, backend=backend, bench_dir=os.path.dirname(os.path.abspath(__file__)))
+    out = subprocess.run([sys.executable, "-c", code], cwd=PROJECT_DIR, capture_output=True, text=True)
+    if out.returncode:
+        raise RuntimeError(out.stderr.strip().splitlines()[-1] if out.stderr else "cold start failed")
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def encode_throughput(encoder, batch_sizes, lengths, count, repeat):
+    results = {}
+    for length in lengths:
+        strings = skill_strings(count, length)
+        for batch_size in batch_sizes:
+            encoder.encode(strings[:batch_size], batch_size=batch_size)  # warm-up
+            samples = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                encoder.encode(strings, batch_size=batch_size)
+                samples.append(time.perf_counter() - started)
+            rate = len(strings) / statistics.median(samples)
+            results[f"{length}/batch{batch_size}"] = round(rate, 1)
+            print(f"  {length:<7} batch {batch_size:>4}: {rate:>9.1f} strings/s", flush=True)
+    return results
+
+
+def matching_scaling(encoder, sizes, match_threshold, partial_threshold):
+    from skillgap_core.semantic import classify_embeddings, classify_matches, encode_skills
+
+    largest = max(sizes)
+    resume_all = skill_strings(largest, "short", seed=1)
+    jd_all = skill_strings(largest, "short", seed=2)
+    started = time.perf_counter()
+    resume_embeddings, jd_embeddings = encode_skills(encoder, resume_all, jd_all)
+    print(f"  embedded {2 * largest} strings in {time.perf_counter() - started:.1f}s")
+
+    results = {}
+    for size in sizes:
+        r, j = resume_embeddings[:size], jd_embeddings[:size]
+        resume_skills, jd_skills = resume_all[:size], jd_all[:size]
+
+        started = time.perf_counter()
+        similarity = r @ j.T
+        matrix_ms = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        result = classify_matches(similarity, resume_skills, jd_skills, match_threshold, partial_threshold)
+        classify_ms = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        classify_embeddings(r, j, resume_skills, jd_skills, match_threshold, partial_threshold)
+        blocked_ms = (time.perf_counter() - started) * 1000
+
+        results[str(size)] = {
+            'matrix_ms': round(matrix_ms, 3),
+            'classify_ms': round(classify_ms, 3),
+            'classify_blocked_ms': round(blocked_ms, 3),
+            'matrix_mb': round(similarity.nbytes / (1024 * 1024), 2),
+            'matched': len(result['matched']),
+            'partial': len(result['partial']),
+            'missing': len(result['missing']),
+        }
+        print(f"  {size:>5} x {size:<5} matrix {matrix_ms:>8.2f} ms  classify {classify_ms:>8.2f} ms  "
+              f"blocked {blocked_ms:>8.2f} ms  ({similarity.nbytes / (1024 * 1024):.1f} MB)  "
+              f"matched/partial/missing {len(result['matched'])}/{len(result['partial'])}/{len(result['missing'])}",
+              flush=True)
+        del similarity
+    return results
+
+
+def main():
+    from skillgap_core.semantic import DEFAULT_MODEL, MATCH_THRESHOLD, PARTIAL_THRESHOLD
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--model", default=DEFAULT_MODEL)
+    parser.add_argument("--backend", default="torch", choices=("torch", "onnx", "onnx-int8"))
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 8, 32, 128])
+    parser.add_argument("--lengths", nargs="+", default=["short", "medium", "long"], choices=("short", "medium", "long"))
+    parser.add_argument("--strings", type=int, default=512, help="strings per throughput run")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5, 50, 500, 5000])
+    parser.add_argument("--match-threshold", type=float, default=MATCH_THRESHOLD)
+    parser.add_argument("--partial-threshold", type=float, default=PARTIAL_THRESHOLD)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--online", action="store_true", help="allow downloading the model")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    if not args.online:
+        os.environ["HF_HUB_OFFLINE"] = "1"
+        os.environ["TRANSFORMERS_OFFLINE"] = "1"
+
+    from skillgap_core.encoders import create_encoder
+
+    print(f"model {args.model} on {args.backend}")
+    print("cold start (fresh interpreter):")
+    cold = cold_start(args.model, args.backend)
+    print(f"  load {cold['load_s']:.2f}s, first encode {cold['first_encode_s'] * 1000:.0f} ms, "
+          f"peak RSS {cold['peak_rss_mb']} MB")
+
+    encoder = create_encoder(args.model, args.backend)
+    print("encode throughput:")
+    throughput = encode_throughput(encoder, args.batch_sizes, args.lengths, args.strings, args.repeat)
+    print(f"similarity + classification (thresholds {args.match_threshold} / {args.partial_threshold}):")
+    scaling = matching_scaling(encoder, args.sizes, args.match_threshold, args.partial_threshold)
+    rss = peak_rss_mb()
+    print(f"peak RSS of this run: {rss} MB")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({
+                'model': args.model,
+                'backend': args.backend,
+                'thresholds': [args.match_threshold, args.partial_threshold],
+                'cold_start': cold,
+                'encode_strings_per_s': throughput,
+                'matching': scaling,
+                'peak_rss_mb': rss,
+            }, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
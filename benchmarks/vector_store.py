@@ -0,0 +1,80 @@
+# ==========================================
+# SkillGapAI - Quantized Vector Store Benchmark
+# Memory footprint, recall@k and query latency of int8 vs exact fp32 search
+# ==========================================
+#
+# Usage: python benchmarks/vector_store.py [--vectors 200000] [--dim 384] [--k 10]
+#
+# Vectors are synthetic but clustered like sentence embeddings (many near
+# neighbours per query), which is the hard case for quantization. The store
+# is written to a temporary directory and removed afterwards.
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from skillgap_core.skill_index import blocked_top_k, normalize_rows  # noqa: E402
+from skillgap_core.vector_store import QuantizedVectorStore, measure_recall  # noqa: E402
+
+
+def clustered_vectors(n, dim, clusters, seed=0):
+    rng = np.random.default_rng(seed)
+    centres = rng.standard_normal((clusters, dim)).astype(np.float32)
+    vectors = centres[rng.integers(0, clusters, n)] + 0.35 * rng.standard_normal((n, dim)).astype(np.float32)
+    return normalize_rows(vectors)
+
+
+def timed(fn, runs):
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--vectors", type=int, default=200_000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--clusters", type=int, default=2000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    vectors = clustered_vectors(args.vectors, args.dim, args.clusters)
+    queries = clustered_vectors(args.queries, args.dim, args.clusters, seed=1)
+    ids = list(range(args.vectors))
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = QuantizedVectorStore(directory)
+        started = time.perf_counter()
+        store.add(ids, vectors)
+        build_seconds = time.perf_counter() - started
+
+        report = store.memory_report()
+        recall = measure_recall(store, queries, vectors, ids, args.k)
+        exact_ms = timed(lambda: blocked_top_k(queries[:1], vectors, args.k), args.runs)
+        int8_ms = timed(lambda: store.search(queries[:1], args.k), args.runs)
+        batch_ms = timed(lambda: store.search(queries, args.k), max(1, args.runs // 2))
+
+    mb = 1024 * 1024
+    print(f"{report['vectors']} vectors x {report['dim']} dims, quantized in {build_seconds:.2f}s")
+    print(f"fp32 matrix       {report['fp32_bytes'] / mb:10.1f} MB")
+    print(f"int8 codes+scales {(report['code_bytes'] + report['scale_bytes']) / mb:10.1f} MB  "
+          f"({report['compression']}x smaller)")
+    print(f"recall@{args.k} vs exact fp32 search: {recall:.4f}")
+    print(f"1-query latency: fp32 {exact_ms:.1f} ms, int8 {int8_ms:.1f} ms; "
+          f"{args.queries}-query batch int8 {batch_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
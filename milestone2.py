@@ -1,13 +1,19 @@
 import streamlit as st
-import re
+import html
 import matplotlib.pyplot as plt
 from datetime import datetime
+from skillgap_core.incremental import IncrementalExtractor
+from skillgap_core.taxonomy import get_taxonomy
+from skillgap_core.timing import span, timed
+from ui_timing import render_timing_panel, start_page_trace
 
 # ------------------------------------------
 # PAGE CONFIGURATION
 # ------------------------------------------
 st.set_page_config(page_title="SkillGapAI — Milestone 2", page_icon="🧭", layout="wide")
 
+run_trace = start_page_trace("milestone2")
+
 # ------------------------------------------
 # CUSTOM CSS FOR DASHBOARD LOOK
 # ------------------------------------------
@@ -279,48 +285,51 @@ TEXT_COLOR = "#F9FAFB"
 MUTED = "#9CA3AF"
 
 # ------------------------------------------
-# LOAD SPACY MODEL
-# ------------------------------------------
+# SKILL TAXONOMY
 # ------------------------------------------
-# SKILL LISTS
-# ------------------------------------------
-technical_skills = [
-    "python", "java", "c++", "sql", "html", "css", "javascript", "react", "node.js",
-    "tensorflow", "pytorch", "machine learning", "data analysis", "data visualization",
-    "aws", "azure", "gcp", "power bi", "tableau", "django", "flask", "scikit-learn", "nlp"
-]
-
-soft_skills = [
-    "communication", "leadership", "teamwork", "problem solving", "time management",
-    "adaptability", "critical thinking", "creativity", "collaboration", "decision making"
-]
+# Technical and soft skills come from the shared taxonomy file; categories
+# listed under "soft_categories" there are treated as soft skills.
 
 # ------------------------------------------
 # HELPERS
 # ------------------------------------------
-def clean_text(text: str) -> str:
-    text = re.sub(r"\s+", " ", text)
-    text = re.sub(r"[^\w\s]", " ", text)
-    return text.lower().strip()
-
-def extract_skills(text):
-    text_clean = clean_text(text)
-    found_tech = [skill.title() for skill in technical_skills if skill in text_clean]
-    found_soft = [skill.title() for skill in soft_skills if skill in text_clean]
-    return list(set(found_tech)), list(set(found_soft))
-
-def highlight_text(text: str, skills):
+@st.cache_resource
+def get_extractor():
+    # Shared chunk cache: a rerun after an edit only re-scans the changed chunks
+    return IncrementalExtractor()
+
+def extract_skills(text, found=None):
+    taxonomy = get_taxonomy()
+    if found is None:
+        found = taxonomy.find(text)
+    found_tech = [skill.title() for skill in found if not taxonomy.is_soft(skill)]
+    found_soft = [skill.title() for skill in found if taxonomy.is_soft(skill)]
+    return found_tech, found_soft
+
+@timed("highlight_text")
+def highlight_text(text: str, found):
+    """Wrap every skill mention in a highlight span in one pass over the text.
+
+    ``found`` is the taxonomy.find() result for this text, whose offsets
+    point into the original string; everything else is HTML-escaped.
+    """
     if not text:
         return ""
-    highlighted = text
-    for skill in sorted(skills, key=len, reverse=True):
-        pattern = re.compile(re.escape(skill), re.IGNORECASE)
-        highlighted = pattern.sub(
-            lambda m: f"<span class='highlight'>{m.group(0)}</span>",
-            highlighted,
-        )
-    highlighted = highlighted.replace("\n", "<br>")
-    return highlighted
+    # Longest first per start, so "react native" wins over the "react" inside it
+    spans = sorted((span for hit in found.values() for span in hit['offsets']), key=lambda s: (s[0], -s[1]))
+    parts = []
+    pos = 0
+    for start, end in spans:
+        if start < pos:
+            # Overlaps a span already highlighted (e.g. "aws" inside "aws lambda")
+            if end <= pos:
+                continue
+            start = pos
+        parts.append(html.escape(text[pos:start]))
+        parts.append(f"<span class='highlight'>{html.escape(text[start:end])}</span>")
+        pos = end
+    parts.append(html.escape(text[pos:]))
+    return "".join(parts).replace("\n", "<br>")
 
 def skill_confidences(skills):
     n = len(skills)
@@ -356,11 +365,15 @@ has_any_text = bool(resume_text or jd_text)
 # Extract skills
 tech_resume, soft_resume = ([], [])
 tech_jd, soft_jd = ([], [])
+found_resume, found_jd = ({}, {})
 
+# One incremental scan per text; the offsets are reused for highlighting
 if resume_text:
-    tech_resume, soft_resume = extract_skills(resume_text)
+    found_resume = get_extractor().find(resume_text)
+    tech_resume, soft_resume = extract_skills(resume_text, found_resume)
 if jd_text:
-    tech_jd, soft_jd = extract_skills(jd_text)
+    found_jd = get_extractor().find(jd_text)
+    tech_jd, soft_jd = extract_skills(jd_text, found_jd)
 
 # Sets for comparison
 resume_all_skills = set(tech_resume + soft_resume)
@@ -427,11 +440,13 @@ with st.container():
             src_text = resume_text
             src_tech = tech_resume
             src_soft = soft_resume
+            src_found = found_resume
             src_name = "Resume"
         else:
             src_text = jd_text
             src_tech = tech_jd
             src_soft = soft_jd
+            src_found = found_jd
             src_name = "Job Description"
 
         all_src_skills = src_tech + src_soft
@@ -459,7 +474,7 @@ with st.container():
         st.markdown("##### ✏️ Highlighted Text")
 
         if src_text:
-            highlighted_html = highlight_text(src_text, all_src_skills)
+            highlighted_html = highlight_text(src_text, src_found)
             st.markdown(
                 f"<div class='highlight-box'>{highlighted_html}</div>",
                 unsafe_allow_html=True,
@@ -491,25 +506,26 @@ with st.container():
             avg_conf = round(sum(conf.values()) / len(conf)) if conf else 0
 
             if total_count > 0:
-                fig, ax = plt.subplots(figsize=(3.5, 3.5))
-                sizes = [tech_count, soft_count]
-                labels = ["Technical Skills", "Soft Skills"]
-                wedges, _ = ax.pie(
-                    sizes,
-                    labels=None,
-                    startangle=90,
-                    wedgeprops=dict(width=0.35, edgecolor="white"),
-                )
-                ax.axis("equal")
-                ax.legend(
-                    wedges,
-                    labels,
-                    loc="lower center",
-                    bbox_to_anchor=(0.5, -0.12),
-                    ncol=2,
-                    fontsize=8,
-                )
-                st.pyplot(fig, use_container_width=True)
+                with span("skill_distribution_chart"):
+                    fig, ax = plt.subplots(figsize=(3.5, 3.5))
+                    sizes = [tech_count, soft_count]
+                    labels = ["Technical Skills", "Soft Skills"]
+                    wedges, _ = ax.pie(
+                        sizes,
+                        labels=None,
+                        startangle=90,
+                        wedgeprops=dict(width=0.35, edgecolor="white"),
+                    )
+                    ax.axis("equal")
+                    ax.legend(
+                        wedges,
+                        labels,
+                        loc="lower center",
+                        bbox_to_anchor=(0.5, -0.12),
+                        ncol=2,
+                        fontsize=8,
+                    )
+                    st.pyplot(fig, use_container_width=True)
             else:
                 st.write("No skills detected yet for a chart.")
 
@@ -648,4 +664,9 @@ st.markdown(
     </div>
     """,
     unsafe_allow_html=True,
-)
\ No newline at end of file
+)
+
+# ------------------------------------------
+# STAGE TIMINGS
+# ------------------------------------------
+render_timing_panel(run_trace)
@@ -7,13 +7,18 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
-from sentence_transformers import SentenceTransformer, util
+from skillgap_core.rerank import load_cross_encoder, rerank_partials
+from skillgap_core.semantic import load_encoder, match_skills
+from skillgap_core.timing import span
+from ui_timing import render_timing_panel, start_page_trace
 
 # ------------------------------------------
 # PAGE CONFIGURATION
 # ------------------------------------------
 st.set_page_config(page_title="SkillGapAI - Milestone 3", layout="wide")
 
+run_trace = start_page_trace("milestone3")
+
 st.markdown(
     """
     <h2 style='color:white; background-color:#5B2C6F; padding:15px; border-radius:10px'>
@@ -30,10 +35,14 @@ st.markdown(
 # ------------------------------------------
 @st.cache_resource
 def load_model():
-    return SentenceTransformer('all-MiniLM-L6-v2')
+    return load_encoder()
 
 model = load_model()
 
+@st.cache_resource
+def load_reranker():
+    return load_cross_encoder()
+
 # ------------------------------------------
 # SKILL INPUT
 # ------------------------------------------
@@ -53,6 +62,8 @@ with col2:
         "Python, Data Visualization, Deep Learning, Communication, AWS"
     )
 
+use_rerank = st.checkbox("🔁 Re-check partial matches with a cross-encoder", value=False)
+
 resume_skills = [s.strip() for s in resume_skills_input.split(",") if s.strip()]
 jd_skills = [s.strip() for s in jd_skills_input.split(",") if s.strip()]
 
@@ -63,35 +74,19 @@ if resume_skills and jd_skills:
     st.markdown("---")
     st.markdown("## 🔍 Skill Gap Analysis")
 
-    # Encode skill lists
-    resume_embeddings = model.encode(resume_skills, convert_to_tensor=True)
-    jd_embeddings = model.encode(jd_skills, convert_to_tensor=True)
-
-    # Compute similarity matrix
-    similarity_matrix = util.cos_sim(resume_embeddings, jd_embeddings).cpu().numpy()
-    sim_df = pd.DataFrame(similarity_matrix, index=resume_skills, columns=jd_skills)
-
     # --------------------------------------
     # Skill Classification (Fixed Version)
     # --------------------------------------
-    matched_skills = []
-    partial_skills = []
-    missing_skills = []
-
-    for j_skill in jd_skills:
-        max_sim = float(sim_df[j_skill].max())
-
-        if max_sim >= 0.8:
-            matched_skills.append(j_skill)
-        elif 0.5 <= max_sim < 0.8:
-            partial_skills.append(j_skill)
-        else:
-            missing_skills.append(j_skill)
-
-    total_skills = len(jd_skills)
-    overall_match = round(
-        ((len(matched_skills) + 0.5 * len(partial_skills)) / total_skills) * 100, 2
-    )
+    # Exact / alias matches are settled lexically; only the rest is encoded
+    result = match_skills(model, resume_skills, jd_skills)
+    sim_df = pd.DataFrame(result['similarity'], index=resume_skills, columns=jd_skills)
+    if use_rerank:
+        # Only the borderline band is re-scored, within a fixed latency budget
+        result = rerank_partials(load_reranker(), result, resume_skills, jd_skills)
+    matched_skills = result['matched']
+    partial_skills = result['partial']
+    missing_skills = result['missing']
+    overall_match = result['overall_match']
 
     # --------------------------------------
     # VISUALIZATIONS
@@ -100,10 +95,21 @@ if resume_skills and jd_skills:
 
     with c1:
         st.markdown("### 📈 Skill Similarity Matrix (BERT-based Cosine Similarity)")
-        fig, ax = plt.subplots(figsize=(8, 5))
-        sns.heatmap(sim_df, annot=True, cmap="YlGnBu", cbar=True, fmt=".2f")
-        plt.title("Skill Similarity Heatmap")
-        st.pyplot(fig)
+        with span("similarity_heatmap"):
+            # Columns settled by an exact / alias match were never encoded:
+            # only their matching cell has a score, so mark them and draw
+            # the unscored cells grey instead of leaving them blank
+            settled = sim_df.isna().any(axis=0)
+            heat_df = sim_df.set_axis([f"{skill} (exact)" if exact else skill
+                                       for skill, exact in zip(jd_skills, settled)], axis=1)
+            fig, ax = plt.subplots(figsize=(8, 5))
+            ax.set_facecolor("#D5D8DC")
+            sns.heatmap(heat_df, annot=True, cmap="YlGnBu", cbar=True, fmt=".2f", ax=ax)
+            plt.title("Skill Similarity Heatmap")
+            st.pyplot(fig)
+        if settled.any():
+            st.caption("Grey cells were not scored: JD skills marked (exact) matched a resume skill "
+                       "exactly or by alias, so only that pair is shown (1.00) and the encoder was skipped.")
 
     with c2:
         st.markdown("### 📊 Skill Match Overview")
@@ -112,15 +118,23 @@ if resume_skills and jd_skills:
         col_b.metric("🟡 Partial Matches", len(partial_skills))
         col_c.metric("❌ Missing Skills", len(missing_skills))
         st.metric("📊 Overall Match", f"{overall_match}%")
+        cascade = result['cascade']
+        st.caption(f"⚡ {cascade['lexical_matches']} exact match(es); "
+                   f"{cascade['skipped_fraction']:.0%} of encoder calls skipped")
+        if 'rerank' in result:
+            rerank = result['rerank']
+            st.caption(f"🔁 {rerank['rescored']}/{rerank['candidates']} partial match(es) re-checked in "
+                       f"{rerank['seconds']:.2f}s: {rerank['promoted']} promoted, {rerank['demoted']} demoted")
 
         # Pie chart
         labels = ["Matched", "Partial", "Missing"]
         sizes = [len(matched_skills), len(partial_skills), len(missing_skills)]
         colors = ["#2ECC71", "#F1C40F", "#E74C3C"]
-        fig2, ax2 = plt.subplots(figsize=(3, 3))
-        ax2.pie(sizes, labels=labels, autopct="%1.1f%%", colors=colors, startangle=90)
-        ax2.axis("equal")
-        st.pyplot(fig2)
+        with span("match_overview_chart"):
+            fig2, ax2 = plt.subplots(figsize=(3, 3))
+            ax2.pie(sizes, labels=labels, autopct="%1.1f%%", colors=colors, startangle=90)
+            ax2.axis("equal")
+            st.pyplot(fig2)
 
     # --------------------------------------
     # MISSING SKILLS
@@ -140,22 +154,16 @@ if resume_skills and jd_skills:
     st.markdown("---")
     st.subheader("📋 Detailed Skill Comparison")
 
-    comp_data = []
-    for jd_skill in jd_skills:
-        max_sim = float(sim_df[jd_skill].max())
-        best_resume_skill = sim_df[jd_skill].idxmax()
-
-        comp_data.append({
-            "Job Skill": jd_skill,
-            "Closest Resume Skill": best_resume_skill,
-            "Similarity Score (%)": round(max_sim * 100, 2)
-        })
-
-    st.dataframe(pd.DataFrame(comp_data))
+    st.dataframe(pd.DataFrame(result['details']))
 
 else:
     st.info("Please enter both Resume Skills and Job Description Skills to start the analysis.")
 
+# Embedding cache hits and cross-session batching of the shared encoder
+if hasattr(model, 'stats'):
+    with st.expander("⚙️ Encoder Metrics"):
+        st.json(model.stats())
+
 # ------------------------------------------
 # FOOTER
 # ------------------------------------------
@@ -164,3 +172,8 @@ st.markdown(
     "<p style='text-align:center; color:gray;'>Milestone 3 • Skill Gap Analysis & Similarity Matching • SkillGapAI Project • Developed by Suriya Varshan</p>",
     unsafe_allow_html=True
 )
+
+# ------------------------------------------
+# STAGE TIMINGS
+# ------------------------------------------
+render_timing_panel(run_trace)
@@ -7,10 +7,14 @@ import streamlit as st
 import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
-from fpdf import FPDF
+from skillgap_core.reports import generate_pdf_report
+from skillgap_core.timing import span
+from ui_timing import render_timing_panel, start_page_trace
 
 st.set_page_config(page_title="SkillGapAI - Dashboard", layout="wide")
 
+run_trace = start_page_trace("milestone4")
+
 # -------------------------------------------
 # HEADER
 # -------------------------------------------
@@ -75,19 +79,20 @@ col4.metric("Total Skills", len(resume_skills))
 # -------------------------------------------
 st.markdown("### 📊 Resume vs Job Requirement Comparison")
 
-fig, ax = plt.subplots(figsize=(10, 4))
-x = np.arange(len(skills_df))
-width = 0.35
+with span("comparison_bar_chart"):
+    fig, ax = plt.subplots(figsize=(10, 4))
+    x = np.arange(len(skills_df))
+    width = 0.35
 
-ax.bar(x - width/2, skills_df["Resume Score"], width, label="Resume Skills")
-ax.bar(x + width/2, skills_df["Job Requirement Score"], width, label="Job Requirements")
+    ax.bar(x - width/2, skills_df["Resume Score"], width, label="Resume Skills")
+    ax.bar(x + width/2, skills_df["Job Requirement Score"], width, label="Job Requirements")
 
-ax.set_xticks(x)
-ax.set_xticklabels(skills_df["Skill"], rotation=45)
-ax.set_ylabel("Match Percentage")
-ax.legend()
+    ax.set_xticks(x)
+    ax.set_xticklabels(skills_df["Skill"], rotation=45)
+    ax.set_ylabel("Match Percentage")
+    ax.legend()
 
-st.pyplot(fig)
+    st.pyplot(fig)
 
 
 # -------------------------------------------
@@ -104,21 +109,22 @@ resume_values += resume_values[:1]
 job_values += job_values[:1]
 angles += angles[:1]
 
-fig = plt.figure(figsize=(5, 5))
-ax = plt.subplot(111, polar=True)
+with span("radar_chart"):
+    fig = plt.figure(figsize=(5, 5))
+    ax = plt.subplot(111, polar=True)
 
-ax.plot(angles, resume_values, linewidth=2, label="Current Profile")
-ax.fill(angles, resume_values, alpha=0.25)
+    ax.plot(angles, resume_values, linewidth=2, label="Current Profile")
+    ax.fill(angles, resume_values, alpha=0.25)
 
-ax.plot(angles, job_values, linewidth=2, label="Job Requirements")
-ax.fill(angles, job_values, alpha=0.25)
+    ax.plot(angles, job_values, linewidth=2, label="Job Requirements")
+    ax.fill(angles, job_values, alpha=0.25)
 
-ax.set_xticks(angles[:-1])
-ax.set_xticklabels(labels)
-ax.set_title("Role View Radar Chart")
-ax.legend(loc="upper right")
+    ax.set_xticks(angles[:-1])
+    ax.set_xticklabels(labels)
+    ax.set_title("Role View Radar Chart")
+    ax.legend(loc="upper right")
 
-st.pyplot(fig)
+    st.pyplot(fig)
 
 
 # -------------------------------------------
@@ -151,24 +157,8 @@ st.download_button(
 # PDF Report Export
 # -------------------------------------------------------
 def generate_pdf():
-    pdf = FPDF()
-    pdf.add_page()
-    pdf.set_font("Arial", size=12)
-
-    pdf.cell(200, 10, txt="SkillGapAI - Skill Gap Report", ln=True, align='C')
-    pdf.ln(10)
-
-    pdf.cell(200, 10, txt=f"Overall Match: {overall_match}%", ln=True)
-    pdf.cell(200, 10, txt=f"Matched Skills: {matched}", ln=True)
-    pdf.cell(200, 10, txt=f"Missing Skills: {missing}", ln=True)
-
-    pdf.ln(10)
-    pdf.cell(200, 10, txt="Skill Comparison:", ln=True)
-
-    for i, row in skills_df.iterrows():
-        pdf.cell(200, 10, txt=f"{row['Skill']} - Resume: {row['Resume Score']}%, Job: {row['Job Requirement Score']}%", ln=True)
-
-    return pdf.output(dest='S').encode('latin1')
+    skill_rows = skills_df[["Skill", "Resume Score", "Job Requirement Score"]].itertuples(index=False)
+    return generate_pdf_report(overall_match, matched, missing, skill_rows)
 
 
 pdf_data = generate_pdf()
@@ -185,4 +175,10 @@ st.markdown("---")
 st.markdown(
     "<p style='text-align:center; color:gray;'>Milestone 4 • Dashboard & Reporting • SkillGapAI • Developed by Suriya Varshan</p>",
     unsafe_allow_html=True
-)
\ No newline at end of file
+)
+
+
+# -------------------------------------------
+# Stage Timings
+# -------------------------------------------
+render_timing_panel(run_trace)
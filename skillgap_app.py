@@ -1,25 +1,11 @@
 import streamlit as st
-import re
-import PyPDF2
-import io
-import docx
 from datetime import datetime
-import matplotlib.pyplot as plt
-from io import BytesIO
-from docx import Document
-from docx.shared import Inches, Pt, RGBColor
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml.ns import qn
-from docx.oxml import OxmlElement
-
-# Try to import OCR libraries
-try:
-    import fitz  # PyMuPDF
-    import pytesseract
-    from PIL import Image
-    OCR_AVAILABLE = True
-except ImportError:
-    OCR_AVAILABLE = False
+from skillgap_core import extraction
+from skillgap_core.analysis import calculate_skill_gap, extract_job_title, extract_skills, get_learning_resources
+from skillgap_core.ocr import ocr_cache_stats
+from skillgap_core.parse_cache import get_parse_cache
+from skillgap_core.reports import create_skill_chart, generate_word_report
+from ui_timing import render_timing_panel, start_page_trace
 
 # Configure page
 st.set_page_config(
@@ -29,6 +15,8 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+run_trace = start_page_trace("skillgap_app")
+
 # Custom CSS
 st.markdown("""
 <style>
@@ -63,76 +51,10 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# Skill Database
-SKILL_DATABASE = {
-    'programming': ['python', 'java', 'javascript', 'c++', 'c#', 'ruby', 'php', 'swift', 'kotlin', 'go', 'rust', 'typescript', 'scala', 'r', 'matlab', 'perl'],
-    'web_development': ['html', 'css', 'react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask', 'spring', 'asp.net', 'jquery', 'bootstrap', 'tailwind', 'next.js', 'nuxt.js', 'svelte'],
-    'mobile_development': ['android', 'ios', 'react native', 'flutter', 'xamarin', 'ionic'],
-    'databases': ['sql', 'mysql', 'postgresql', 'mongodb', 'oracle', 'redis', 'cassandra', 'dynamodb', 'sqlite', 'mariadb', 'neo4j', 'elasticsearch'],
-    'data_science': ['machine learning', 'deep learning', 'data analysis', 'statistics', 'pandas', 'numpy', 'scikit-learn', 'tensorflow', 'pytorch', 'keras', 'data visualization', 'tableau', 'power bi', 'matplotlib', 'seaborn'],
-    'cloud': ['aws', 'azure', 'google cloud', 'gcp', 'docker', 'kubernetes', 'terraform', 'jenkins', 'ci/cd', 'devops', 'serverless', 'lambda'],
-    'soft_skills': ['communication', 'leadership', 'teamwork', 'problem solving', 'critical thinking', 'project management', 'agile', 'scrum', 'time management', 'collaboration', 'presentation', 'negotiation'],
-    'tools': ['git', 'github', 'gitlab', 'jira', 'confluence', 'slack', 'trello', 'postman', 'visual studio code', 'intellij', 'eclipse'],
-    'methodologies': ['agile', 'scrum', 'kanban', 'waterfall', 'lean', 'six sigma', 'test-driven development', 'behavior-driven development'],
-    'security': ['cybersecurity', 'encryption', 'penetration testing', 'oauth', 'jwt', 'ssl', 'firewall', 'vulnerability assessment']
-}
-
 def extract_text_from_pdf(pdf_file):
     """Extract text from uploaded PDF file including OCR for image-based PDFs"""
-    text = ""
-    
     try:
-        # First, try normal text extraction with PyPDF2
-        pdf_file.seek(0)
-        pdf_reader = PyPDF2.PdfReader(io.BytesIO(pdf_file.read()))
-        for page in pdf_reader.pages:
-            page_text = page.extract_text()
-            if page_text:
-                text += page_text + "\n"
-        
-        # If very little text was extracted, try OCR using PyMuPDF
-        if len(text.strip()) < 50:  # Threshold for considering PDF as image-based
-            if OCR_AVAILABLE:
-                pdf_file.seek(0)
-                
-                try:
-                    # Open PDF with PyMuPDF (fitz)
-                    pdf_document = fitz.open(stream=pdf_file.read(), filetype="pdf")
-                    ocr_text = ""
-                    
-                    # Extract images from each page and perform OCR
-                    for page_num in range(len(pdf_document)):
-                        page = pdf_document[page_num]
-                        
-                        # Try to get text first with fitz
-                        page_text = page.get_text()
-                        if page_text.strip():
-                            ocr_text += page_text + "\n"
-                        else:
-                            # If no text, render page as image and do OCR
-                            pix = page.get_pixmap(matrix=fitz.Matrix(2, 2))  # 2x zoom for better quality
-                            img_data = pix.tobytes("png")
-                            image = Image.open(io.BytesIO(img_data))
-                            
-                            # Perform OCR on the image
-                            page_text = pytesseract.image_to_string(image, lang='eng')
-                            if page_text.strip():
-                                ocr_text += page_text + "\n"
-                    
-                    pdf_document.close()
-                    
-                    if ocr_text.strip():
-                        text = ocr_text
-                        
-                except Exception as ocr_error:
-                    # Silently handle OCR errors
-                    pass
-            else:
-                # Silently handle missing OCR libraries
-                pass
-        
-        return text
-        
+        return extraction.extract_text_from_pdf(pdf_file)
     except Exception as e:
         st.error(f"Error reading PDF: {str(e)}")
         return ""
@@ -140,336 +62,11 @@ def extract_text_from_pdf(pdf_file):
 def extract_text_from_docx(docx_file):
     """Extract text from uploaded Word document"""
     try:
-        doc = docx.Document(io.BytesIO(docx_file.read()))
-        text = ""
-        for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
-        return text
+        return extraction.extract_text_from_docx(docx_file)
     except Exception as e:
         st.error(f"Error reading Word document: {str(e)}")
         return ""
 
-def extract_skills(text):
-    """Extract skills from text using NLP techniques"""
-    text_lower = text.lower()
-    words = re.findall(r'\b[a-z][a-z+#.]+\b', text_lower)
-    bigrams = [' '.join([words[i], words[i+1]]) for i in range(len(words)-1)]
-    trigrams = [' '.join([words[i], words[i+1], words[i+2]]) for i in range(len(words)-2)]
-    all_tokens = words + bigrams + trigrams
-    found_skills = {}
-    for category, skills in SKILL_DATABASE.items():
-        found_skills[category] = []
-        for skill in skills:
-            count = sum(1 for token in all_tokens if token == skill.lower())
-            if count > 0:
-                found_skills[category].append({'skill': skill, 'count': count})
-    found_skills = {k: v for k, v in found_skills.items() if v}
-    return found_skills
-
-def calculate_skill_gap(resume_skills, job_skills):
-    """Calculate the gap between resume and job description skills"""
-    resume_set = set()
-    for skills in resume_skills.values():
-        resume_set.update([s['skill'] for s in skills])
-    job_set = set()
-    for skills in job_skills.values():
-        job_set.update([s['skill'] for s in skills])
-    matching_skills = resume_set.intersection(job_set)
-    missing_skills = job_set - resume_set
-    additional_skills = resume_set - job_set
-    if len(job_set) > 0:
-        match_percentage = (len(matching_skills) / len(job_set)) * 100
-    else:
-        match_percentage = 0
-    return {
-        'matching': matching_skills,
-        'missing': missing_skills,
-        'additional': additional_skills,
-        'match_percentage': match_percentage
-    }
-
-def get_learning_resources(skill):
-    """Get learning resource recommendations for a skill"""
-    return {
-        'online_courses': f"Search for '{skill}' courses on Coursera, Udemy, or edX",
-        'documentation': f"Official {skill} documentation and tutorials",
-        'practice': f"LeetCode, HackerRank, or project-based learning for {skill}",
-        'communities': f"Join {skill} communities on Reddit, Stack Overflow, or Discord"
-    }
-
-def extract_job_title(job_text):
-    """Extract job title from job description"""
-    lines = job_text.split('\n')
-    for line in lines[:10]:
-        line = line.strip()
-        if line and len(line) < 100:
-            if any(keyword in line.lower() for keyword in ['engineer', 'developer', 'manager', 'analyst', 'designer', 'architect', 'specialist', 'consultant', 'lead', 'senior', 'junior']):
-                return line
-    return "Job Position"
-
-def create_skill_chart(gap_analysis):
-    """Create a bar chart for skill analysis"""
-    fig, ax = plt.subplots(figsize=(10, 6))
-    categories = ['Matching Skills', 'Missing Skills', 'Additional Skills']
-    values = [len(gap_analysis['matching']), len(gap_analysis['missing']), len(gap_analysis['additional'])]
-    colors = ['#2ecc71', '#e74c3c', '#3498db']
-    bars = ax.bar(categories, values, color=colors, alpha=0.7, edgecolor='black', linewidth=2)
-    for bar in bars:
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height, f'{int(height)}', ha='center', va='bottom', fontsize=12, fontweight='bold')
-    ax.set_ylabel('Number of Skills', fontsize=12, fontweight='bold')
-    ax.set_title('Skill Gap Analysis Overview', fontsize=14, fontweight='bold', pad=20)
-    ax.grid(axis='y', alpha=0.3, linestyle='--')
-    plt.tight_layout()
-    buf = BytesIO()
-    plt.savefig(buf, format='png', dpi=150, bbox_inches='tight')
-    buf.seek(0)
-    plt.close()
-    return buf
-
-def set_cell_border(cell):
-    """Set cell borders in Word document"""
-    tc = cell._tc
-    tcPr = tc.get_or_add_tcPr()
-    tcBorders = OxmlElement('w:tcBorders')
-    for edge in ('top', 'left', 'bottom', 'right'):
-        edge_element = OxmlElement(f'w:{edge}')
-        edge_element.set(qn('w:val'), 'single')
-        edge_element.set(qn('w:sz'), '12')
-        edge_element.set(qn('w:space'), '0')
-        edge_element.set(qn('w:color'), '3498db')
-        tcBorders.append(edge_element)
-    tcPr.append(tcBorders)
-
-def generate_word_report(job_title, resume_skills, job_skills, gap_analysis):
-    """Generate Word document report with borders and proper formatting"""
-    doc = Document()
-    sections = doc.sections
-    for section in sections:
-        section.top_margin = Inches(0.75)
-        section.bottom_margin = Inches(0.75)
-        section.left_margin = Inches(0.75)
-        section.right_margin = Inches(0.75)
-    
-    header = doc.add_paragraph()
-    header.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    header_run = header.add_run("🎯 SkillGapAI Analysis Report")
-    header_run.font.size = Pt(24)
-    header_run.font.bold = True
-    header_run.font.color.rgb = RGBColor(102, 126, 234)
-    
-    title_para = doc.add_paragraph()
-    title_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    title_run = title_para.add_run(job_title)
-    title_run.font.size = Pt(18)
-    title_run.font.bold = True
-    title_run.font.color.rgb = RGBColor(118, 75, 162)
-    
-    date_para = doc.add_paragraph()
-    date_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    date_run = date_para.add_run(f"Generated on: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}")
-    date_run.font.size = Pt(10)
-    date_run.font.color.rgb = RGBColor(128, 128, 128)
-    
-    doc.add_paragraph()
-    
-    heading = doc.add_paragraph()
-    heading_run = heading.add_run("📊 Match Score")
-    heading_run.font.size = Pt(16)
-    heading_run.font.bold = True
-    heading_run.font.color.rgb = RGBColor(44, 62, 80)
-    
-    metrics_table = doc.add_table(rows=2, cols=3)
-    metrics_table.style = 'Light Grid Accent 1'
-    headers = ['Overall Match', 'Matching Skills', 'Missing Skills']
-    values = [f"{gap_analysis['match_percentage']:.1f}%", str(len(gap_analysis['matching'])), str(len(gap_analysis['missing']))]
-    
-    for idx, (header, value) in enumerate(zip(headers, values)):
-        cell = metrics_table.rows[0].cells[idx]
-        cell.text = header
-        cell.paragraphs[0].runs[0].font.bold = True
-        cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
-        set_cell_border(cell)
-        
-        cell = metrics_table.rows[1].cells[idx]
-        cell.text = value
-        cell.paragraphs[0].runs[0].font.size = Pt(18)
-        cell.paragraphs[0].runs[0].font.bold = True
-        cell.paragraphs[0].runs[0].font.color.rgb = RGBColor(52, 152, 219)
-        cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
-        set_cell_border(cell)
-    
-    doc.add_paragraph()
-    
-    heading = doc.add_paragraph()
-    heading_run = heading.add_run("📄 Skills in Resume")
-    heading_run.font.size = Pt(16)
-    heading_run.font.bold = True
-    heading_run.font.color.rgb = RGBColor(44, 62, 80)
-    
-    resume_skills_list = []
-    for category, skills in resume_skills.items():
-        for skill_data in skills:
-            resume_skills_list.append(skill_data['skill'])
-    
-    skills_para = doc.add_paragraph()
-    for skill in sorted(resume_skills_list):
-        run = skills_para.add_run(f" {skill} ")
-        run.font.size = Pt(10)
-        run.font.color.rgb = RGBColor(21, 101, 192)
-        skills_para.add_run(" | ")
-    
-    doc.add_paragraph()
-    
-    heading = doc.add_paragraph()
-    heading_run = heading.add_run("💼 Skills Required in Job Description")
-    heading_run.font.size = Pt(16)
-    heading_run.font.bold = True
-    heading_run.font.color.rgb = RGBColor(44, 62, 80)
-    
-    job_skills_list = []
-    for category, skills in job_skills.items():
-        for skill_data in skills:
-            job_skills_list.append(skill_data['skill'])
-    
-    skills_para = doc.add_paragraph()
-    for skill in sorted(job_skills_list):
-        run = skills_para.add_run(f" {skill} ")
-        run.font.size = Pt(10)
-        run.font.color.rgb = RGBColor(230, 81, 0)
-        skills_para.add_run(" | ")
-    
-    doc.add_paragraph()
-    
-    heading = doc.add_paragraph()
-    heading_run = heading.add_run("✅ Matching Skills")
-    heading_run.font.size = Pt(16)
-    heading_run.font.bold = True
-    heading_run.font.color.rgb = RGBColor(44, 62, 80)
-    
-    if gap_analysis['matching']:
-        skills_para = doc.add_paragraph()
-        for skill in sorted(gap_analysis['matching']):
-            run = skills_para.add_run(f" ✓ {skill} ")
-            run.font.size = Pt(10)
-            run.font.color.rgb = RGBColor(21, 87, 36)
-            run.font.bold = True
-            skills_para.add_run(" | ")
-    else:
-        doc.add_paragraph("No matching skills found.")
-    
-    doc.add_paragraph()
-    
-    heading = doc.add_paragraph()
-    heading_run = heading.add_run("❌ Missing Skills (Need to Learn)")
-    heading_run.font.size = Pt(16)
-    heading_run.font.bold = True
-    heading_run.font.color.rgb = RGBColor(44, 62, 80)
-    
-    if gap_analysis['missing']:
-        skills_para = doc.add_paragraph()
-        for skill in sorted(gap_analysis['missing']):
-            run = skills_para.add_run(f" ✗ {skill} ")
-            run.font.size = Pt(10)
-            run.font.color.rgb = RGBColor(114, 28, 36)
-            run.font.bold = True
-            skills_para.add_run(" | ")
-    else:
-        success_para = doc.add_paragraph("You have all the required skills!")
-        success_para.runs[0].font.color.rgb = RGBColor(40, 167, 69)
-        success_para.runs[0].font.bold = True
-    
-    doc.add_paragraph()
-    doc.add_page_break()
-    
-    heading = doc.add_paragraph()
-    heading_run = heading.add_run("📊 Skill Gap Visualization")
-    heading_run.font.size = Pt(16)
-    heading_run.font.bold = True
-    heading_run.font.color.rgb = RGBColor(44, 62, 80)
-    heading.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    
-    chart_buf = create_skill_chart(gap_analysis)
-    doc.add_picture(chart_buf, width=Inches(6))
-    last_paragraph = doc.paragraphs[-1]
-    last_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    
-    doc.add_paragraph()
-    doc.add_page_break()
-    
-    heading = doc.add_paragraph()
-    heading_run = heading.add_run("📚 Learning Recommendations")
-    heading_run.font.size = Pt(16)
-    heading_run.font.bold = True
-    heading_run.font.color.rgb = RGBColor(44, 62, 80)
-    
-    if gap_analysis['missing']:
-        priority_skills = list(gap_analysis['missing'])[:6]
-        for idx, skill in enumerate(priority_skills, 1):
-            skill_heading = doc.add_paragraph()
-            skill_heading_run = skill_heading.add_run(f"{idx}. {skill.title()}")
-            skill_heading_run.font.size = Pt(12)
-            skill_heading_run.font.bold = True
-            skill_heading_run.font.color.rgb = RGBColor(52, 152, 219)
-            
-            resources = get_learning_resources(skill)
-            resource_table = doc.add_table(rows=4, cols=1)
-            resource_table.style = 'Light List Accent 1'
-            resource_data = [
-                f"🎓 Online Courses: {resources['online_courses']}",
-                f"📖 Documentation: {resources['documentation']}",
-                f"💻 Practice: {resources['practice']}",
-                f"👥 Communities: {resources['communities']}"
-            ]
-            
-            for row_idx, resource_text in enumerate(resource_data):
-                cell = resource_table.rows[row_idx].cells[0]
-                cell.text = resource_text
-                cell.paragraphs[0].runs[0].font.size = Pt(10)
-                set_cell_border(cell)
-            doc.add_paragraph()
-        
-        doc.add_paragraph()
-        learning_heading = doc.add_paragraph()
-        learning_heading_run = learning_heading.add_run("📅 Suggested 8-Week Learning Path")
-        learning_heading_run.font.size = Pt(14)
-        learning_heading_run.font.bold = True
-        learning_heading_run.font.color.rgb = RGBColor(102, 126, 234)
-        
-        learning_steps = [
-            "Week 1-2: Focus on the top 2 priority skills",
-            "Week 3-4: Learn the next 2-3 skills",
-            "Week 5-6: Build projects incorporating new skills",
-            "Week 7-8: Refine and add to your resume/portfolio"
-        ]
-        for step in learning_steps:
-            para = doc.add_paragraph(step, style='List Bullet')
-            para.runs[0].font.size = Pt(11)
-    else:
-        success_para = doc.add_paragraph("🌟 Congratulations! You have all the required skills for this position.")
-        success_para.runs[0].font.color.rgb = RGBColor(40, 167, 69)
-        success_para.runs[0].font.bold = True
-        success_para.runs[0].font.size = Pt(12)
-    
-    doc.add_paragraph()
-    doc.add_paragraph()
-    footer = doc.add_paragraph()
-    footer.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    footer_run = footer.add_run("SkillGapAI - Empowering Career Growth Through AI")
-    footer_run.font.size = Pt(10)
-    footer_run.font.color.rgb = RGBColor(128, 128, 128)
-    
-    tip = doc.add_paragraph()
-    tip.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    tip_run = tip.add_run("💡 Keep your resume updated with new skills as you learn them!")
-    tip_run.font.size = Pt(9)
-    tip_run.font.color.rgb = RGBColor(150, 150, 150)
-    
-    doc_io = BytesIO()
-    doc.save(doc_io)
-    doc_io.seek(0)
-    return doc_io
-
 # SIDEBAR
 st.sidebar.title("🎯 SkillGapAI")
 st.sidebar.markdown("---")
@@ -480,6 +77,12 @@ st.sidebar.info("SkillGapAI helps you identify skill gaps between your resume an
 st.sidebar.markdown("---")
 st.sidebar.markdown("### Milestones Overview")
 st.sidebar.markdown("**Milestone 1:** Data Ingestion & Parsing\n\n**Milestone 2:** Skill Extraction\n\n**Milestone 3:** Skill Gap Analysis\n\n**Milestone 4:** Dashboard & Reporting")
+st.sidebar.markdown("---")
+with st.sidebar.expander("🗄️ Cache Statistics"):
+    parse_stats = get_parse_cache().stats()
+    ocr_stats = ocr_cache_stats()
+    st.caption(f"Parsed documents: {parse_stats['hits']} hits / {parse_stats['misses']} misses")
+    st.caption(f"OCR pages: {ocr_stats['hits']} hits / {ocr_stats['misses']} misses ({ocr_stats['hit_rate']:.0%} hit rate)")
 
 # MAIN CONTENT
 if page == "📱 Full Application":
@@ -951,4 +554,7 @@ elif page == "🔸 Milestone 4":
         st.info("💡 Navigate to Milestone 1 → 2 → 3 to complete the analysis pipeline.")
 
 st.markdown("---")
-st.markdown("""<div style='text-align: center; padding: 20px;'><p style='color: #555; font-size: 1rem;'>SkillGapAI - Empowering Career Growth Through AI</p><p style='color: #888; font-size: 0.9rem;'>💡 Tip: Keep your resume updated with new skills as you learn them!</p></div>""", unsafe_allow_html=True)
\ No newline at end of file
+st.markdown("""<div style='text-align: center; padding: 20px;'><p style='color: #555; font-size: 1rem;'>SkillGapAI - Empowering Career Growth Through AI</p><p style='color: #888; font-size: 0.9rem;'>💡 Tip: Keep your resume updated with new skills as you learn them!</p></div>""", unsafe_allow_html=True)
+
+# Waterfall of the last run that did any work (uploads, analysis, reports)
+render_timing_panel(run_trace)
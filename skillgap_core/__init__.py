@@ -0,0 +1,43 @@
+"""SkillGapAI core library.
+
+Parsing, skill extraction, gap analysis and report generation without any
+Streamlit dependency. Importing the package only loads the standard library;
+PyMuPDF, PyPDF2, pytesseract, python-docx, matplotlib, fpdf and
+sentence_transformers are imported the first time a function needs them.
+"""
+
+from .analysis import (
+    calculate_skill_gap,
+    extract_job_title,
+    extract_skills,
+    get_learning_resources,
+)
+from .extraction import (
+    extract_text,
+    extract_text_from_docx,
+    extract_text_from_pdf,
+    extract_text_from_txt,
+)
+from .reports import create_skill_chart, generate_pdf_report, generate_word_report
+from .semantic import classify_matches, load_encoder, match_skills, similarity_matrix
+from .taxonomy import get_taxonomy, load_taxonomy
+
+__all__ = [
+    'calculate_skill_gap',
+    'classify_matches',
+    'create_skill_chart',
+    'extract_job_title',
+    'extract_skills',
+    'extract_text',
+    'extract_text_from_docx',
+    'extract_text_from_pdf',
+    'extract_text_from_txt',
+    'generate_pdf_report',
+    'generate_word_report',
+    'get_learning_resources',
+    'get_taxonomy',
+    'load_encoder',
+    'load_taxonomy',
+    'match_skills',
+    'similarity_matrix',
+]
@@ -0,0 +1,58 @@
+# ==========================================
+# SkillGapAI - Skill Analysis
+# Skill extraction, gap calculation and recommendations
+# ==========================================
+
+from .taxonomy import get_taxonomy
+from .timing import timed
+
+
+@timed("extract_skills")
+def extract_skills(text):
+    """Extract skills from text using the compiled skill taxonomy"""
+    return get_taxonomy().extract(text)
+
+
+@timed("calculate_skill_gap")
+def calculate_skill_gap(resume_skills, job_skills):
+    """Calculate the gap between resume and job description skills"""
+    resume_set = set()
+    for skills in resume_skills.values():
+        resume_set.update([s['skill'] for s in skills])
+    job_set = set()
+    for skills in job_skills.values():
+        job_set.update([s['skill'] for s in skills])
+    matching_skills = resume_set.intersection(job_set)
+    missing_skills = job_set - resume_set
+    additional_skills = resume_set - job_set
+    if len(job_set) > 0:
+        match_percentage = (len(matching_skills) / len(job_set)) * 100
+    else:
+        match_percentage = 0
+    return {
+        'matching': matching_skills,
+        'missing': missing_skills,
+        'additional': additional_skills,
+        'match_percentage': match_percentage
+    }
+
+
+def get_learning_resources(skill):
+    """Get learning resource recommendations for a skill"""
+    return {
+        'online_courses': f"Search for '{skill}' courses on Coursera, Udemy, or edX",
+        'documentation': f"Official {skill} documentation and tutorials",
+        'practice': f"LeetCode, HackerRank, or project-based learning for {skill}",
+        'communities': f"Join {skill} communities on Reddit, Stack Overflow, or Discord"
+    }
+
+
+def extract_job_title(job_text):
+    """Extract job title from job description"""
+    lines = job_text.split('\n')
+    for line in lines[:10]:
+        line = line.strip()
+        if line and len(line) < 100:
+            if any(keyword in line.lower() for keyword in ['engineer', 'developer', 'manager', 'analyst', 'designer', 'architect', 'specialist', 'consultant', 'lead', 'senior', 'junior']):
+                return line
+    return "Job Position"
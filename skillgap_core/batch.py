@@ -0,0 +1,200 @@
+# ==========================================
+# SkillGapAI - Batch Ranking
+# Score many resumes against many job descriptions from the command line
+# ==========================================
+#
+# Usage:
+#   python -m skillgap_core.batch --resumes resumes/ --jobs jobs/ -o ranking.jsonl
+#   python -m skillgap_core.batch --resume-manifest cvs.jsonl --jobs jd/ -o ranking.csv --top 50
+#
+# Every document is parsed and skill-extracted exactly once, in parallel
+# across all cores; the candidate x role matrix is then scored with
+# calculate_skill_gap semantics (matching JD skills / all JD skills) using
+# integer bitsets, so scoring thousands x dozens pairs takes well under a
+# second.
+
+import argparse
+import csv
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from . import settings
+from .analysis import extract_job_title, extract_skills
+from .extraction import EXTRACTORS, extract_text
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_EXTENSIONS = tuple(f".{ext}" for ext in EXTRACTORS)
+
+
+def collect_documents(paths=(), manifests=()):
+    """Return [(doc_id, absolute path)] from directories, files and manifests.
+
+    Directories are walked recursively for PDF/DOCX/TXT files and ids are the
+    path relative to that directory. A manifest lists one document per line,
+    either as a bare path or as JSON ``{"id": ..., "path": ...}``; relative
+    paths are resolved against the manifest's own directory.
+    """
+    documents = []
+    for path in paths:
+        if os.path.isdir(path):
+            for dirpath, _, filenames in os.walk(path):
+                for name in sorted(filenames):
+                    if name.lower().endswith(SUPPORTED_EXTENSIONS):
+                        full = os.path.join(dirpath, name)
+                        documents.append((os.path.relpath(full, path), os.path.abspath(full)))
+        else:
+            documents.append((os.path.basename(path), os.path.abspath(path)))
+
+    for manifest in manifests:
+        base = os.path.dirname(os.path.abspath(manifest))
+        with open(manifest, encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                if line.startswith('{'):
+                    entry = json.loads(line)
+                    doc_path, doc_id = entry['path'], entry.get('id')
+                else:
+                    doc_path, doc_id = line, None
+                doc_path = os.path.join(base, doc_path)
+                documents.append((doc_id or os.path.relpath(doc_path, base), os.path.abspath(doc_path)))
+    return documents
+
+
+def init_worker():
+    # The batch already uses every core, so OCR inside a worker stays in-process
+    settings.OCR_WORKERS = 1
+
+
+def analyze_document(path):
+    """Worker: parse one file and return its canonical skill set and title (or the error)"""
+    try:
+        with open(path, 'rb') as f:
+            text = extract_text(f, os.path.splitext(path)[1])
+        found = extract_skills(text)
+        skills = sorted({s['skill'] for skills in found.values() for s in skills})
+        return {'path': path, 'skills': skills, 'title': extract_job_title(text)}
+    except Exception as e:
+        return {'path': path, 'error': f"{type(e).__name__}: {e}"}
+
+
+def analyze_all(paths, workers):
+    """Parse every distinct path once; returns {path: analysis}"""
+    unique = sorted(set(paths))
+    if workers == 1:
+        return {path: analyze_document(path) for path in unique}
+    chunksize = max(1, len(unique) // (workers * 8))
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as pool:
+        return dict(zip(unique, pool.map(analyze_document, unique, chunksize=chunksize)))
+
+
+def rank(resumes, jobs, top=None):
+    """Yield one ranked row per (job, resume) pair, best candidates first per job.
+
+    ``resumes`` is a list of (doc_id, skill list) and ``jobs`` a list of
+    (doc_id, skill list, role title).
+    """
+    # Give every skill a bit so set intersection becomes one AND + popcount
+    bits = {}
+    def to_mask(skills):
+        mask = 0
+        for skill in skills:
+            mask |= 1 << bits.setdefault(skill, len(bits))
+        return mask
+
+    resume_masks = [(doc_id, to_mask(skills)) for doc_id, skills in resumes]
+
+    for job_id, job_skills, job_title in jobs:
+        job_mask = to_mask(job_skills)
+        job_bits = [(skill, 1 << bits[skill]) for skill in sorted(set(job_skills))]
+        job_count = len(job_bits)
+        scored = []
+        for resume_id, resume_mask in resume_masks:
+            matching = (resume_mask & job_mask).bit_count()
+            match_percentage = matching / job_count * 100 if job_count else 0.0
+            scored.append((-match_percentage, resume_id, resume_mask))
+        scored.sort()
+        if top:
+            scored = scored[:top]
+
+        for position, (neg_score, resume_id, resume_mask) in enumerate(scored, 1):
+            yield {
+                'job': job_id,
+                'job_title': job_title,
+                'resume': resume_id,
+                'rank': position,
+                'match_percentage': round(-neg_score, 2),
+                'matching': [skill for skill, bit in job_bits if resume_mask & bit],
+                'missing': [skill for skill, bit in job_bits if not resume_mask & bit],
+            }
+
+
+def write_rows(rows, output):
+    """Write ranked rows as JSONL or CSV depending on the output extension"""
+    count = 0
+    if output.lower().endswith('.csv'):
+        with open(output, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=['job', 'job_title', 'resume', 'rank', 'match_percentage', 'matching', 'missing'])
+            writer.writeheader()
+            for row in rows:
+                writer.writerow(dict(row, matching=';'.join(row['matching']), missing=';'.join(row['missing'])))
+                count += 1
+    else:
+        with open(output, 'w', encoding='utf-8') as f:
+            for row in rows:
+                f.write(json.dumps(row) + "\n")
+                count += 1
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rank resumes against job descriptions by skill match.")
+    parser.add_argument('--resumes', nargs='*', default=[], help="resume files or directories")
+    parser.add_argument('--resume-manifest', nargs='*', default=[], help="manifest files listing resumes")
+    parser.add_argument('--jobs', nargs='*', default=[], help="job description files or directories")
+    parser.add_argument('--job-manifest', nargs='*', default=[], help="manifest files listing job descriptions")
+    parser.add_argument('-o', '--output', required=True, help="output file (.jsonl or .csv)")
+    parser.add_argument('--top', type=int, default=None, help="keep only the best N candidates per job")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="parser processes (default: all cores)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    resume_docs = collect_documents(args.resumes, args.resume_manifest)
+    job_docs = collect_documents(args.jobs, args.job_manifest)
+    if not resume_docs or not job_docs:
+        parser.error("need at least one resume and one job description")
+
+    started = time.perf_counter()
+    analyses = analyze_all([path for _, path in resume_docs + job_docs], max(1, args.workers))
+    parsed_at = time.perf_counter()
+
+    def usable(docs, label):
+        kept = []
+        for doc_id, path in docs:
+            analysis = analyses[path]
+            if 'error' in analysis:
+                logger.warning("skipping %s %s: %s", label, doc_id, analysis['error'])
+                continue
+            kept.append((doc_id, analysis))
+        return kept
+
+    resumes = [(doc_id, analysis['skills']) for doc_id, analysis in usable(resume_docs, "resume")]
+    jobs = [(doc_id, analysis['skills'], analysis['title']) for doc_id, analysis in usable(job_docs, "job")]
+    count = write_rows(rank(resumes, jobs, args.top), args.output)
+
+    logger.info(
+        "parsed %d document(s) in %.2fs on %d worker(s); wrote %d row(s) for %d resume(s) x %d job(s) to %s in %.2fs",
+        len(analyses), parsed_at - started, args.workers, count, len(resumes), len(jobs),
+        args.output, time.perf_counter() - parsed_at,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,168 @@
+# ==========================================
+# SkillGapAI - Micro-Batching Encoder
+# Coalesces concurrent encode calls from all sessions into larger batches
+# ==========================================
+#
+# Streamlit runs each session's script in its own thread, and every session
+# encodes a handful of skill strings at a time. BatchingEncoder puts those
+# calls on one queue; a single worker thread waits at most
+# ENCODER_BATCH_WINDOW_MS after the first request for others to arrive,
+# runs one forward pass over all of them (up to ENCODER_MAX_BATCH strings)
+# and hands each caller back its own rows. Requests that pass different
+# model options (normalize_embeddings, precision, ...) are encoded in
+# separate passes, one per distinct set of options.
+
+import queue
+import threading
+import time
+from collections import deque
+
+
+# encode() keywords that only concern how a single call is run; the batcher
+# picks its own batch size and always returns NumPy arrays
+SCHEDULING_KWARGS = frozenset(('batch_size', 'show_progress_bar', 'convert_to_numpy', 'convert_to_tensor'))
+
+
+class _Request:
+    __slots__ = ('sentences', 'options', 'enqueued', 'done', 'result', 'error')
+
+    def __init__(self, sentences, options=()):
+        self.sentences = sentences
+        self.options = options
+        self.enqueued = time.monotonic()
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+class BatchingEncoder:
+    """Thread-safe ``encode`` front-end that merges concurrent requests.
+
+    ``encode`` blocks until the caller's rows are ready and returns them as
+    a float32 NumPy array in input order; an exception raised by the model
+    is re-raised in every caller whose strings were in that batch. Other
+    keyword arguments are passed to the model and only requests with equal
+    options share a forward pass; asking for tensors raises TypeError.
+    """
+
+    def __init__(self, encoder, max_batch, window_ms):
+        self.encoder = encoder
+        self.max_batch = max_batch
+        self.window = window_ms / 1000
+        self._queue = queue.Queue()
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self.requests = 0
+        self.batches = 0
+        self.batch_sizes = deque(maxlen=10000)
+        self.queue_waits = deque(maxlen=10000)
+
+    def __getattr__(self, name):
+        return getattr(self.encoder, name)
+
+    def encode(self, sentences, **kwargs):
+        if kwargs.get('convert_to_tensor') or kwargs.get('convert_to_numpy', True) is False:
+            raise TypeError("BatchingEncoder.encode always returns NumPy arrays")
+        options = {name: value for name, value in kwargs.items() if name not in SCHEDULING_KWARGS}
+        try:
+            options = tuple(sorted(options.items()))
+            hash(options)
+        except TypeError:
+            raise TypeError(f"BatchingEncoder.encode options must be hashable: {sorted(options)}") from None
+        single = isinstance(sentences, str)
+        request = _Request([sentences] if single else list(sentences), options)
+        if not request.sentences:
+            return self.encoder.encode([], convert_to_numpy=True, **dict(options))
+
+        self._ensure_worker()
+        self._queue.put(request)
+        request.done.wait()
+        if request.error is not None:
+            raise request.error
+        return request.result[0] if single else request.result
+
+    def _ensure_worker(self):
+        if self._thread is None:
+            with self._start_lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="skillgap-encoder", daemon=True)
+                    self._thread.start()
+
+    def _collect(self):
+        """Block for one request, then gather more until the window closes or the batch is full"""
+        batch = [self._queue.get()]
+        size = len(batch[0].sentences)
+        deadline = time.monotonic() + self.window
+        while size < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                request = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            batch.append(request)
+            size += len(request.sentences)
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            started = time.monotonic()
+            groups = {}
+            for request in batch:
+                groups.setdefault(request.options, []).append(request)
+            sizes = []
+            for options, group in groups.items():
+                sentences = [s for request in group for s in request.sentences]
+                sizes.append(len(sentences))
+                try:
+                    embeddings = self.encoder.encode(sentences, batch_size=self.max_batch, convert_to_numpy=True,
+                                                     **dict(options))
+                    offset = 0
+                    for request in group:
+                        request.result = embeddings[offset:offset + len(request.sentences)]
+                        offset += len(request.sentences)
+                except Exception as e:
+                    for request in group:
+                        request.error = e
+
+            with self._stats_lock:
+                self.requests += len(batch)
+                self.batches += len(sizes)
+                self.batch_sizes.extend(sizes)
+                self.queue_waits.extend(started - request.enqueued for request in batch)
+            for request in batch:
+                request.done.set()
+
+    def stats(self):
+        """Batch-size distribution and queue wait (ms) over recent batches"""
+        with self._stats_lock:
+            sizes = sorted(self.batch_sizes)
+            waits = sorted(w * 1000 for w in self.queue_waits)
+            requests, batches = self.requests, self.batches
+
+        histogram = {}
+        for size in sizes:
+            low = 1 << (size.bit_length() - 1)
+            label = str(low) if low == 1 else f"{low}-{2 * low - 1}"
+            histogram[label] = histogram.get(label, 0) + 1
+        return {
+            'requests': requests,
+            'batches': batches,
+            'mean_batch_size': round(sum(sizes) / len(sizes), 2) if sizes else 0.0,
+            'batch_size_histogram': histogram,
+            'queue_wait_ms': {
+                'mean': round(sum(waits) / len(waits), 3) if waits else 0.0,
+                'p50': round(percentile(waits, 0.5), 3),
+                'p95': round(percentile(waits, 0.95), 3),
+                'max': round(waits[-1], 3) if waits else 0.0,
+            },
+        }
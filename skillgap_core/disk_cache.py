@@ -0,0 +1,143 @@
+# ==========================================
+# SkillGapAI - Disk Cache
+# File-per-entry byte cache shared by all processes on the host
+# ==========================================
+
+import hashlib
+import os
+import tempfile
+import threading
+import time
+
+from . import settings
+
+
+def content_hash(*parts):
+    """SHA-256 hex digest over byte/str parts, used for cache keys"""
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, str):
+            part = part.encode('utf-8')
+        digest.update(part)
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+class DiskCache:
+    """Byte values stored as one file per key under ``CACHE_DIR/<namespace>``.
+
+    Writes go through a temp file and ``os.replace`` so concurrent Streamlit
+    workers never see partial entries, and everything survives restarts.
+    The file mtime records when an entry was written (for ``ttl_seconds``)
+    and the atime is bumped on every hit, so eviction drops the least
+    recently used entries once the directory grows past ``max_bytes``.
+    """
+
+    # Only walk the directory for eviction this often, or when our running
+    # estimate says we are over budget.
+    SWEEP_INTERVAL = 60.0
+
+    def __init__(self, namespace, max_bytes, ttl_seconds=None, root=None):
+        self.directory = os.path.join(root or settings.CACHE_DIR, namespace)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._approx_bytes = None
+        self._last_sweep = 0.0
+        self._lock = threading.Lock()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key)
+
+    def get(self, key):
+        """Return the cached bytes for ``key`` or None on a miss"""
+        path = self._path(key)
+        try:
+            stat = os.stat(path)
+            if self.ttl_seconds and time.time() - stat.st_mtime > self.ttl_seconds:
+                self._remove(path)
+                raise FileNotFoundError(path)
+            with open(path, 'rb') as f:
+                value = f.read()
+            os.utime(path, ns=(time.time_ns(), stat.st_mtime_ns))
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """Store ``value`` (bytes) under ``key``; failures are not fatal"""
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, 'wb') as f:
+                f.write(value)
+            os.replace(tmp_path, path)
+        except OSError:
+            return
+        with self._lock:
+            if self._approx_bytes is not None:
+                self._approx_bytes += len(value)
+            due = time.monotonic() - self._last_sweep > self.SWEEP_INTERVAL
+            over = self._approx_bytes is not None and self._approx_bytes > self.max_bytes
+        if due or over:
+            self.evict()
+
+    def get_text(self, key):
+        value = self.get(key)
+        return None if value is None else value.decode('utf-8')
+
+    def put_text(self, key, text):
+        self.put(key, text.encode('utf-8'))
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'bytes': self._approx_bytes}
+
+    def evict(self):
+        """Drop expired entries, then least recently used ones over budget"""
+        with self._lock:
+            self._last_sweep = time.monotonic()
+            now = time.time()
+            entries = []
+            total = 0
+            for dirpath, _, filenames in os.walk(self.directory):
+                for name in filenames:
+                    path = os.path.join(dirpath, name)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    expired = self.ttl_seconds and now - stat.st_mtime > self.ttl_seconds
+                    # Leftover temp files from a crashed writer are also swept
+                    stale_tmp = name.endswith(".tmp") and now - stat.st_mtime > self.SWEEP_INTERVAL
+                    if expired or stale_tmp:
+                        self._remove(path)
+                        continue
+                    entries.append((stat.st_atime, stat.st_size, path))
+                    total += stat.st_size
+
+            if total > self.max_bytes:
+                # Evict down to 90% so we are not sweeping on every put
+                target = self.max_bytes * 0.9
+                for _, size, path in sorted(entries):
+                    if total <= target:
+                        break
+                    self._remove(path)
+                    total -= size
+            self._approx_bytes = total
+
+    def clear(self):
+        for dirpath, _, filenames in os.walk(self.directory):
+            for name in filenames:
+                self._remove(os.path.join(dirpath, name))
+        self._approx_bytes = 0
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
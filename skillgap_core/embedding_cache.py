@@ -0,0 +1,259 @@
+# ==========================================
+# SkillGapAI - Embedding Cache
+# Memory-mapped store of skill-string embeddings shared by all processes
+# ==========================================
+#
+# Layout under CACHE_DIR/embeddings/<model>/:
+#   keys.npy     uint8 (capacity, 20) SHA-1 of each normalized string, one
+#                per slot (raw bytes: an S20 array would strip trailing NULs)
+#   codes.npy    int8 (capacity, dim) embeddings, code = round(v / scale)
+#   scales.npy   float32 per-slot scale, max|v| / 127
+#   used.npy     float64 last-use time per slot (0 = free)
+#   state.npy    int64 [generation]; bumped on every write so readers
+#                know when to rebuild their key -> slot index
+#
+# All five are .npy memmaps, so every Streamlit worker maps the same pages
+# instead of holding its own copy. int8 codes take a quarter of the fp32
+# size (388 instead of 1,536 bytes per 384-dim slot) and change cosine
+# scores by well under 0.01. Readers and writers serialise on a lock file
+# (another process may reuse a slot between a reader's index refresh and its
+# read); once the store is full the least recently used slots are
+# overwritten.
+
+import contextlib
+import hashlib
+import os
+import re
+import threading
+import time
+
+import numpy as np
+
+from . import settings
+from .skill_matcher import normalize_term
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+@contextlib.contextmanager
+def file_lock(path):
+    """Exclusive inter-process lock held on ``path`` for the with-block"""
+    with open(path, 'a+b') as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def quantize_rows(vectors):
+    """Return (int8 codes, float32 per-row scales) with each row's absolute max at 127"""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    scales = np.maximum(np.abs(vectors).max(axis=1), 1e-12) / 127
+    codes = np.clip(np.rint(vectors / scales[:, None]), -127, 127).astype(np.int8)
+    return codes, scales.astype(np.float32)
+
+
+def dequantize(codes, scales):
+    return codes.astype(np.float32) * scales[:, None]
+
+
+def embedding_key(text):
+    """Slot key for a skill string: SHA-1 of its normalized form"""
+    return hashlib.sha1(normalize_term(text).encode('utf-8')).digest()
+
+
+KEY_BYTES = hashlib.sha1().digest_size
+
+
+class EmbeddingCache:
+    """Fixed-capacity, memory-mapped map from skill strings to vectors."""
+
+    def __init__(self, namespace, dim, capacity, root=None):
+        self.directory = os.path.join(root or settings.CACHE_DIR, "embeddings", namespace)
+        self.dim = dim
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._index = {}
+        self._generation = -1
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+        self._lock_path = os.path.join(self.directory, "lock")
+        with file_lock(self._lock_path):
+            self._open()
+
+    def _path(self, name):
+        return os.path.join(self.directory, name)
+
+    def _open(self):
+        """Map the store files, (re)creating them if missing or mis-sized"""
+        specs = {
+            'keys': (np.uint8, (self.capacity, KEY_BYTES)),
+            'codes': (np.int8, (self.capacity, self.dim)),
+            'scales': (np.float32, (self.capacity,)),
+            'used': (np.float64, (self.capacity,)),
+            'state': (np.int64, (1,)),
+        }
+        arrays = {}
+        try:
+            for name, (dtype, shape) in specs.items():
+                array = np.lib.format.open_memmap(self._path(name + ".npy"), mode='r+')
+                if array.dtype != np.dtype(dtype) or array.shape != shape:
+                    raise ValueError(name)
+                arrays[name] = array
+        except (OSError, ValueError):
+            # First use, or capacity / model dimension / layout changed: start empty
+            legacy = self._path("vectors.npy")
+            if os.path.exists(legacy):
+                # fp32 vectors from before the store was quantized
+                os.remove(legacy)
+            arrays = {
+                name: np.lib.format.open_memmap(self._path(name + ".npy"), mode='w+', dtype=dtype, shape=shape)
+                for name, (dtype, shape) in specs.items()
+            }
+        self._keys = arrays['keys']
+        self._codes = arrays['codes']
+        self._scales = arrays['scales']
+        self._used = arrays['used']
+        self._state = arrays['state']
+        self._generation = -1
+
+    def _refresh(self):
+        """Rebuild the key -> slot index if another process has written"""
+        generation = int(self._state[0])
+        if generation != self._generation:
+            live = np.flatnonzero(self._used > 0)
+            raw = self._keys[live].tobytes()
+            keys = [raw[i:i + KEY_BYTES] for i in range(0, len(raw), KEY_BYTES)]
+            self._index = dict(zip(keys, live.tolist()))
+            self._generation = generation
+
+    def __len__(self):
+        with self._lock:
+            self._refresh()
+            return len(self._index)
+
+    def get_many(self, keys):
+        """Return {key: vector} for the keys that are cached"""
+        with self._lock, file_lock(self._lock_path):
+            self._refresh()
+            found = {key: self._index[key] for key in keys if key in self._index}
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+            if not found:
+                return {}
+            slots = np.fromiter(found.values(), dtype=np.int64, count=len(found))
+            self._used[slots] = time.time()
+            vectors = dequantize(self._codes[slots], self._scales[slots])
+        return dict(zip(found, vectors))
+
+    def put_many(self, keys, vectors):
+        """Store vectors for new keys, overwriting least recently used slots when full"""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        with self._lock, file_lock(self._lock_path):
+            self._refresh()
+            new = [(key, row) for row, key in enumerate(keys) if key not in self._index]
+            if not new:
+                return
+            new = new[-self.capacity:]
+            free = np.flatnonzero(self._used == 0)
+            if len(free) < len(new):
+                # Oldest occupied slots go first
+                needed = len(new) - len(free)
+                occupied = np.flatnonzero(self._used > 0)
+                oldest = occupied[np.argpartition(self._used[occupied], needed - 1)[:needed]]
+                free = np.concatenate([free, oldest])
+            slots = free[:len(new)]
+            rows = [row for _, row in new]
+            self._keys[slots] = np.frombuffer(b"".join(key for key, _ in new), dtype=np.uint8).reshape(-1, KEY_BYTES)
+            self._codes[slots], self._scales[slots] = quantize_rows(vectors[rows])
+            self._used[slots] = time.time()
+            for array in (self._keys, self._codes, self._scales, self._used):
+                array.flush()
+            self._state[0] += 1
+            self._state.flush()
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'entries': len(self), 'capacity': self.capacity}
+
+    def clear(self):
+        with self._lock, file_lock(self._lock_path):
+            self._used[:] = 0
+            self._used.flush()
+            self._state[0] += 1
+            self._state.flush()
+
+
+class CachedEncoder:
+    """Wraps a sentence-transformers model so ``encode`` consults the cache first.
+
+    Inputs are normalized and deduplicated, and only strings that are not in
+    the store are sent to the model, in a single batch. Results always come
+    back as a float32 NumPy array in input order. Fresh embeddings go
+    through the store's int8 round trip before they are returned, so a
+    string gets the same vector on a miss as on every later hit.
+    """
+
+    def __init__(self, encoder, cache):
+        self.encoder = encoder
+        self.cache = cache
+        self.encoded = 0
+
+    def __getattr__(self, name):
+        return getattr(self.encoder, name)
+
+    def encode(self, sentences, batch_size=64, **kwargs):
+        single = isinstance(sentences, str)
+        if single:
+            sentences = [sentences]
+        keys = [embedding_key(s) for s in sentences]
+
+        unique = dict.fromkeys(keys)
+        vectors = self.cache.get_many(list(unique))
+        pending = {key: normalize_term(s) for key, s in zip(keys, sentences) if key not in vectors}
+        if pending:
+            kwargs.pop('convert_to_tensor', None)
+            encoded = self.encoder.encode(list(pending.values()), batch_size=batch_size,
+                                          convert_to_numpy=True, **kwargs)
+            self.encoded += len(pending)
+            encoded = dequantize(*quantize_rows(encoded))
+            self.cache.put_many(list(pending), encoded)
+            vectors.update(zip(pending, encoded))
+
+        dim = self.cache.dim
+        result = np.stack([vectors[key] for key in keys]) if keys else np.empty((0, dim), dtype=np.float32)
+        return result[0] if single else result
+
+    def stats(self):
+        stats = dict(self.cache.stats(), encoded=self.encoded)
+        if hasattr(self.encoder, 'stats'):
+            stats['batching'] = self.encoder.stats()
+        return stats
+
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def get_embedding_cache(model_name, dim):
+    """Process-wide EmbeddingCache for one model (one directory per model name)"""
+    namespace = re.sub(r'[^A-Za-z0-9_.-]+', '_', model_name)
+    with _caches_lock:
+        cache = _caches.get((namespace, dim))
+        if cache is None:
+            cache = _caches[(namespace, dim)] = EmbeddingCache(
+                namespace, dim, settings.EMBEDDING_CACHE_MAX_ENTRIES)
+        return cache
@@ -0,0 +1,151 @@
+# ==========================================
+# SkillGapAI - Encoder Backends
+# PyTorch sentence-transformers or an exported ONNX Runtime model (fp32 / int8)
+# ==========================================
+#
+# SKILLGAP_ENCODER_BACKEND selects the backend:
+#   torch      SentenceTransformer in fp32 PyTorch (default)
+#   onnx       the same network exported to ONNX and run by onnxruntime
+#   onnx-int8  the ONNX export with dynamically quantized int8 weights
+#   auto       onnx-int8 when onnxruntime is installed, else torch
+#
+# The ONNX files are exported once per model into CACHE_DIR/onnx/<model>/
+# (this step still needs torch) and reused by every later process. All
+# backends return float32 NumPy arrays from ``encode``.
+
+import logging
+import os
+import re
+import shutil
+import tempfile
+import threading
+from importlib.util import find_spec
+
+from . import settings
+
+ONNXRUNTIME_AVAILABLE = find_spec("onnxruntime") is not None
+
+BACKENDS = ("torch", "onnx", "onnx-int8")
+
+logger = logging.getLogger(__name__)
+
+
+def resolve_backend(name=None):
+    """Turn the configured backend name (possibly "auto") into one of BACKENDS"""
+    name = name or settings.ENCODER_BACKEND
+    if name == "auto":
+        return "onnx-int8" if ONNXRUNTIME_AVAILABLE else "torch"
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown encoder backend '{name}'. Choose from: auto, {', '.join(BACKENDS)}")
+    if name != "torch" and not ONNXRUNTIME_AVAILABLE:
+        raise RuntimeError(f"Encoder backend '{name}' needs onnxruntime; pip install onnxruntime")
+    return name
+
+
+def onnx_model_dir(model_name):
+    return os.path.join(settings.CACHE_DIR, "onnx", re.sub(r'[^A-Za-z0-9_.-]+', '_', model_name))
+
+
+def export_onnx(model_name, directory):
+    """Export the model's transformer and tokenizer to ``directory``, plus an int8 copy"""
+    import torch
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    from sentence_transformers import SentenceTransformer
+
+    model = SentenceTransformer(model_name, device="cpu")
+    transformer = model[0].auto_model.eval()
+    tokenizer = model.tokenizer
+
+    parent = os.path.dirname(directory)
+    os.makedirs(parent, exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(dir=parent, suffix=".tmp")
+    try:
+        tokenizer.save_pretrained(tmp_dir)
+        sample = tokenizer(["python", "machine learning"], padding=True, return_tensors="pt")
+        input_names = [name for name in ("input_ids", "attention_mask", "token_type_ids") if name in sample]
+        dynamic_axes = {name: {0: "batch", 1: "tokens"} for name in input_names}
+        dynamic_axes["last_hidden_state"] = {0: "batch", 1: "tokens"}
+        with torch.no_grad():
+            torch.onnx.export(
+                transformer, tuple(sample[name] for name in input_names),
+                os.path.join(tmp_dir, "model.onnx"),
+                input_names=input_names, output_names=["last_hidden_state"],
+                dynamic_axes=dynamic_axes, opset_version=14,
+            )
+        quantize_dynamic(os.path.join(tmp_dir, "model.onnx"), os.path.join(tmp_dir, "model-int8.onnx"),
+                         weight_type=QuantType.QInt8)
+        with open(os.path.join(tmp_dir, "max_seq_length"), "w") as f:
+            f.write(str(model.max_seq_length))
+        try:
+            os.replace(tmp_dir, directory)
+        except OSError:
+            # Another process finished the same export first
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+    except Exception:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+
+class OnnxEncoder:
+    """Mean-pooled, L2-normalized sentence embeddings from an ONNX export.
+
+    Mirrors the Transformer -> Pooling(mean) -> Normalize pipeline of
+    all-MiniLM-L6-v2, so scores are comparable with the torch backend.
+    """
+
+    def __init__(self, directory, quantized=True):
+        import onnxruntime
+        from transformers import AutoTokenizer
+
+        self.tokenizer = AutoTokenizer.from_pretrained(directory)
+        options = onnxruntime.SessionOptions()
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        model_file = "model-int8.onnx" if quantized else "model.onnx"
+        self.session = onnxruntime.InferenceSession(
+            os.path.join(directory, model_file), options, providers=["CPUExecutionProvider"])
+        self.input_names = [i.name for i in self.session.get_inputs()]
+        with open(os.path.join(directory, "max_seq_length")) as f:
+            self.max_seq_length = int(f.read())
+        self._dimension = None
+
+    def get_sentence_embedding_dimension(self):
+        if self._dimension is None:
+            self._dimension = int(self.encode(["dimension"]).shape[1])
+        return self._dimension
+
+    def encode(self, sentences, batch_size=64, **kwargs):
+        import numpy as np
+
+        single = isinstance(sentences, str)
+        if single:
+            sentences = [sentences]
+        batches = []
+        for start in range(0, len(sentences), batch_size):
+            tokens = self.tokenizer(list(sentences[start:start + batch_size]), padding=True, truncation=True,
+                                    max_length=self.max_seq_length, return_tensors="np")
+            feeds = {name: tokens[name].astype(np.int64) for name in self.input_names}
+            hidden = self.session.run(None, feeds)[0]
+            mask = tokens["attention_mask"][..., None].astype(np.float32)
+            pooled = (hidden * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1e-9)
+            batches.append(pooled / np.maximum(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12))
+        embeddings = np.concatenate(batches).astype(np.float32) if batches else np.empty((0, 0), dtype=np.float32)
+        return embeddings[0] if single else embeddings
+
+
+_export_lock = threading.Lock()
+
+
+def create_encoder(model_name, backend=None):
+    """Load ``model_name`` on the given (or configured) backend"""
+    backend = resolve_backend(backend)
+    if backend == "torch":
+        from sentence_transformers import SentenceTransformer
+
+        return SentenceTransformer(model_name)
+
+    directory = onnx_model_dir(model_name)
+    with _export_lock:
+        if not os.path.exists(os.path.join(directory, "model-int8.onnx")):
+            logger.info("Exporting %s to ONNX in %s", model_name, directory)
+            export_onnx(model_name, directory)
+    return OnnxEncoder(directory, quantized=backend == "onnx-int8")
@@ -0,0 +1,91 @@
+# ==========================================
+# SkillGapAI - Text Extraction
+# PDF / DOCX / TXT to plain text, with parse caching and selective OCR
+# ==========================================
+#
+# These functions raise on unreadable documents; the Streamlit pages catch
+# the error and show it to the user.
+
+from . import settings
+from .ingest import open_document
+from .ocr import OCR_AVAILABLE, ocr_pages
+from .parse_cache import IncompleteParse, cached_parse
+from .pdf_engines import extract_page_texts
+from .timing import timed
+
+
+def parse_pdf_buffer(buffer):
+    """Extract text from a PDF buffer, running OCR only on pages without a usable text layer.
+
+    Raises IncompleteParse (carrying the text-layer pages) when some scanned
+    pages could not be OCR'd, so the partial text is not cached.
+    """
+    # Fast text-layer extraction (PyMuPDF, falling back to PyPDF2), kept per page
+    page_texts, _ = extract_page_texts(buffer)
+
+    # Pages with (almost) no extractable text are treated as scanned images,
+    # so a typed CV with a scanned appendix gets both parts
+    scanned_pages = [n for n, page_text in enumerate(page_texts) if len(page_text.strip()) < settings.OCR_MIN_PAGE_CHARS]
+    missed = None
+    if scanned_pages and not OCR_AVAILABLE:
+        missed = "OCR is not installed"
+    elif scanned_pages:
+        try:
+            for page_num, page_text in ocr_pages(buffer.source, scanned_pages).items():
+                if page_text.strip():
+                    page_texts[page_num] = page_text
+        except Exception as e:
+            # The text-layer pages are still returned, just not cached
+            missed = f"OCR failed: {e!r}"
+
+    text = "".join(page_text + "\n" for page_text in page_texts if page_text.strip())
+    if missed:
+        raise IncompleteParse(text, f"{len(scanned_pages)} scanned page(s) not OCR'd; {missed}")
+    return text
+
+
+def parse_docx_buffer(buffer):
+    """Extract paragraph text from a Word document buffer"""
+    import docx
+
+    doc = docx.Document(buffer.stream())
+    text = ""
+    for paragraph in doc.paragraphs:
+        text += paragraph.text + "\n"
+    return text
+
+
+@timed("extract_text_from_pdf")
+def extract_text_from_pdf(pdf_file):
+    """Extract text from a PDF file object, reusing cached text for identical uploads"""
+    with open_document(pdf_file) as buffer:
+        return cached_parse('pdf', buffer, parse_pdf_buffer)
+
+
+@timed("extract_text_from_docx")
+def extract_text_from_docx(docx_file):
+    """Extract text from a Word file object, reusing cached text for identical uploads"""
+    with open_document(docx_file) as buffer:
+        return cached_parse('docx', buffer, parse_docx_buffer)
+
+
+@timed("extract_text_from_txt")
+def extract_text_from_txt(txt_file):
+    """Decode a UTF-8 text file object"""
+    txt_file.seek(0)
+    return txt_file.read().decode('utf-8')
+
+
+EXTRACTORS = {
+    'pdf': extract_text_from_pdf,
+    'docx': extract_text_from_docx,
+    'txt': extract_text_from_txt,
+}
+
+
+def extract_text(file_obj, file_type):
+    """Dispatch on a file extension such as 'pdf', 'docx' or 'txt'"""
+    extractor = EXTRACTORS.get(file_type.lower().lstrip('.'))
+    if extractor is None:
+        raise ValueError(f"Unsupported file format: {file_type}")
+    return extractor(file_obj)
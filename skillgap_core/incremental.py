@@ -0,0 +1,131 @@
+# ==========================================
+# SkillGapAI - Incremental Skill Extraction
+# Re-scan only the edited parts of a live text area
+# ==========================================
+#
+# Text is cut into content-defined chunks: a chunk may end after any
+# whitespace character whose preceding CHUNK_WINDOW characters hash to a
+# multiple of CHUNK_DIVISOR (within min / max sizes). Because boundaries
+# depend only on nearby content, typing in one place moves at most the
+# boundaries around the edit, and every other chunk keeps its text and its
+# cached matches.
+#
+# Every chunk ends in whitespace, so a match found inside a chunk is also a
+# whole-word match in the full text. Multi-word skills can still straddle a
+# boundary ("machine | learning"); those are found by re-scanning a small
+# seam window around each boundary, also cached. The merged matches go
+# through Taxonomy.fold_matches, so the result equals taxonomy.find(text).
+
+import re
+import threading
+from collections import OrderedDict
+
+from . import settings
+from .skill_matcher import WORD_CHARS
+from .taxonomy import get_taxonomy
+from .timing import timed
+
+CHUNK_WINDOW = 16
+CHUNK_DIVISOR = 64
+CHUNK_MIN_CHARS = 256
+CHUNK_MAX_CHARS = 4096
+
+_whitespace = re.compile(r'\s')
+
+
+def chunk_boundaries(text):
+    """Offsets where content-defined chunks end (the last one is len(text))"""
+    boundaries = []
+    last = 0
+    # Jump straight to the first whitespace past the minimum chunk size
+    match = _whitespace.search(text, CHUNK_MIN_CHARS - 1)
+    while match:
+        cut = match.end()
+        # str hashes are stable within a process, which is all the in-memory cache needs
+        if cut - last >= CHUNK_MAX_CHARS or hash(text[cut - CHUNK_WINDOW:cut]) % CHUNK_DIVISOR == 0:
+            boundaries.append(cut)
+            last = cut
+            match = _whitespace.search(text, last + CHUNK_MIN_CHARS - 1)
+        else:
+            match = _whitespace.search(text, cut)
+    if not boundaries or boundaries[-1] != len(text):
+        boundaries.append(len(text))
+    return boundaries
+
+
+def is_word_char(text, index):
+    return 0 <= index < len(text) and text[index].lower() in WORD_CHARS
+
+
+class IncrementalExtractor:
+    """taxonomy.find() with per-chunk and per-seam match caches.
+
+    One instance can be shared by all sessions; the LRU holds up to
+    ``max_entries`` chunk / seam results and is keyed by taxonomy version,
+    so a hot-reloaded taxonomy never reuses stale matches.
+    """
+
+    def __init__(self, max_entries=None):
+        self.max_entries = max_entries or settings.INCREMENTAL_CACHE_ENTRIES
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self.last_run = {}
+
+    def _cached(self, key, compute):
+        with self._lock:
+            value = self._cache.get(key)
+            if value is not None:
+                self._cache.move_to_end(key)
+                return value, True
+        value = compute()
+        with self._lock:
+            self._cache[key] = value
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return value, False
+
+    @timed("incremental_find")
+    def find(self, text):
+        """Same result as get_taxonomy().find(text), re-scanning only changed chunks"""
+        taxonomy = get_taxonomy()
+        matcher = taxonomy.matcher
+        version = taxonomy.source_sha256
+        reach = 2 * max((len(term) for term in matcher.terms), default=0)
+
+        matches = []
+        reused = scanned_chars = 0
+        boundaries = chunk_boundaries(text)
+        start = 0
+        for end in boundaries:
+            chunk = text[start:end]
+            chunk_matches, hit = self._cached((version, 'chunk', chunk), lambda: matcher.find_all(chunk))
+            matches.extend((start + s, start + e, term) for s, e, term in chunk_matches)
+            reused += hit
+            scanned_chars += 0 if hit else len(chunk)
+            start = end
+
+        seam_found = False
+        for cut in boundaries[:-1]:
+            lo, hi = max(0, cut - reach), min(len(text), cut + reach)
+            window = text[lo:hi]
+            seam_matches, hit = self._cached(
+                (version, 'seam', cut - lo, window),
+                lambda: [m for m in matcher.find_all(window) if m[0] < cut - lo < m[1]],
+            )
+            for s, e, term in seam_matches:
+                s, e = lo + s, lo + e
+                # The window may start or end mid-word; check against the full text
+                if not is_word_char(text, s - 1) and not is_word_char(text, e):
+                    matches.append((s, e, term))
+                    seam_found = True
+
+        # Chunk matches are already in order; only seam matches need sorting in
+        if seam_found:
+            matches.sort(key=lambda m: (m[0], -m[1]))
+        self.last_run = {
+            'chunks': len(boundaries),
+            'reused_chunks': reused,
+            'scanned_chars': scanned_chars,
+            'total_chars': len(text),
+        }
+        return taxonomy.fold_matches(matches, text)
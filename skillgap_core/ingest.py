@@ -0,0 +1,165 @@
+# ==========================================
+# SkillGapAI - Document Ingestion
+# One shared, read-only buffer per uploaded document
+# ==========================================
+#
+# Every extraction engine (PyPDF2, PyMuPDF, python-docx, the OCR workers)
+# reads from the same DocumentBuffer instead of calling ``file.read()`` again.
+#
+# Peak-memory target, on top of the copy Streamlit already holds for the
+# upload and whatever object graph the parser itself builds:
+#   * uploads below SKILLGAP_INGEST_SPOOL_MB: at most 1 MB per MB of PDF
+#     (one immutable ``bytes`` shared by all engines; BytesIO wrappers over it
+#     do not copy). If scanned pages go to the OCR process pool, the bytes
+#     are first written to a temp file (spooled_path) so workers open it by
+#     path rather than each receiving a pickled copy
+#   * larger uploads: about 1 MB total (the copy chunk), independent of
+#     file size; the document is spooled to a temp file and mmap'd, so its
+#     pages live in the reclaimable page cache, and OCR workers open the file
+#     by path instead of receiving a pickled copy of the bytes.
+
+import hashlib
+import io
+import mmap
+import os
+import tempfile
+from contextlib import contextmanager
+
+from . import settings
+
+COPY_CHUNK_BYTES = 1024 * 1024
+
+
+class DocumentBuffer:
+    """Read-only view of an uploaded document plus its SHA-256.
+
+    Use as a context manager so a spooled temp file is removed afterwards.
+    ``source`` is what PyMuPDF and the OCR workers should open: the bytes
+    themselves for small documents, or the temp file path for spooled ones.
+    """
+
+    def __init__(self, data=None, path=None, sha256=""):
+        self.data = data
+        self.path = path
+        self.sha256 = sha256
+        self._file = None
+        self._mmap = None
+        if path is not None:
+            self._file = open(path, 'rb')
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return len(self._mmap) if self._mmap is not None else len(self.data)
+
+    @property
+    def spooled(self):
+        return self.path is not None
+
+    @property
+    def source(self):
+        return self.path if self.spooled else self.data
+
+    def stream(self):
+        """Seekable file object positioned at the start; never copies the document"""
+        if self._mmap is not None:
+            self._mmap.seek(0)
+            return self._mmap
+        return io.BytesIO(self.data)
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._file.close()
+            self._mmap = self._file = None
+        if self.path is not None:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+            self.path = None
+
+
+def _spool_dir():
+    path = os.path.join(settings.CACHE_DIR, "spool")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+@contextmanager
+def spooled_path(source):
+    """Yield a file path for a DocumentBuffer.source.
+
+    Paths are passed through; bytes are written to a temp file that is
+    removed when the block exits.
+    """
+    if isinstance(source, str):
+        yield source
+        return
+    with tempfile.NamedTemporaryFile(dir=_spool_dir(), suffix=".upload", delete=False) as spool:
+        path = spool.name
+        try:
+            spool.write(source)
+        except Exception:
+            spool.close()
+            os.remove(path)
+            raise
+    try:
+        yield path
+    finally:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _chunks(file_obj):
+    """Yield the upload in COPY_CHUNK_BYTES pieces without a full read()"""
+    if hasattr(file_obj, 'getbuffer'):
+        # BytesIO / Streamlit UploadedFile: slice the existing buffer in place
+        with file_obj.getbuffer() as view:
+            for start in range(0, len(view), COPY_CHUNK_BYTES):
+                with view[start:start + COPY_CHUNK_BYTES] as chunk:
+                    yield chunk
+        return
+    file_obj.seek(0)
+    while True:
+        chunk = file_obj.read(COPY_CHUNK_BYTES)
+        if not chunk:
+            return
+        yield chunk
+
+
+def open_document(file_obj, spool_bytes=None):
+    """Read an uploaded file once into a DocumentBuffer.
+
+    Documents up to ``spool_bytes`` (default SKILLGAP_INGEST_SPOOL_MB) are
+    read into a single ``bytes`` object; larger ones are streamed to a temp
+    file under the cache directory in chunks and memory-mapped.
+    """
+    if spool_bytes is None:
+        spool_bytes = settings.INGEST_SPOOL_MB * 1024 * 1024
+    file_obj.seek(0, io.SEEK_END)
+    size = file_obj.tell()
+    file_obj.seek(0)
+
+    if size <= spool_bytes:
+        data = file_obj.read()
+        return DocumentBuffer(data=data, sha256=hashlib.sha256(data).hexdigest())
+
+    digest = hashlib.sha256()
+    with tempfile.NamedTemporaryFile(dir=_spool_dir(), suffix=".upload", delete=False) as spool:
+        try:
+            for chunk in _chunks(file_obj):
+                digest.update(chunk)
+                spool.write(chunk)
+        except Exception:
+            spool.close()
+            os.remove(spool.name)
+            raise
+    return DocumentBuffer(path=spool.name, sha256=digest.hexdigest())
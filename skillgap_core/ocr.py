@@ -0,0 +1,303 @@
+# ==========================================
+# SkillGapAI - OCR
+# Renders scanned PDF pages and runs Tesseract across a process pool
+# ==========================================
+
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from importlib.util import find_spec
+
+from . import settings
+from .disk_cache import DiskCache, content_hash
+from .ingest import spooled_path
+from .timing import annotate, timed
+
+# OCR libraries are imported on first use; here we only check they are installed
+RENDER_AVAILABLE = find_spec("fitz") is not None and find_spec("PIL") is not None
+TESSEROCR_AVAILABLE = find_spec("tesserocr") is not None
+PYTESSERACT_AVAILABLE = find_spec("pytesseract") is not None
+
+OCR_AVAILABLE = RENDER_AVAILABLE and (TESSEROCR_AVAILABLE or PYTESSERACT_AVAILABLE)
+
+logger = logging.getLogger(__name__)
+
+
+class TesserocrBackend:
+    """Warm Tesseract engine driven through the C API via tesserocr.
+
+    The language model is loaded once when the backend is created and
+    reused for every page, instead of paying for a new ``tesseract``
+    process and temp files per page as pytesseract does.
+    """
+
+    name = "tesserocr"
+
+    def __init__(self, lang):
+        import tesserocr
+
+        self.api = tesserocr.PyTessBaseAPI(lang=lang)
+
+    def recognize(self, image):
+        """Return (text, mean word confidence 0-100)"""
+        self.api.SetImage(image)
+        return self.api.GetUTF8Text(), self.api.MeanTextConf()
+
+
+class PytesseractBackend:
+    """Fallback: one ``tesseract`` subprocess per page"""
+
+    name = "pytesseract"
+
+    def __init__(self, lang):
+        self.lang = lang
+
+    def recognize(self, image):
+        """Return (text, mean word confidence 0-100) from a single tesseract run"""
+        import pytesseract
+
+        data = pytesseract.image_to_data(image, lang=self.lang, output_type=pytesseract.Output.DICT)
+        lines = {}
+        confidences = []
+        for i, word in enumerate(data['text']):
+            conf = float(data['conf'][i])
+            if conf < 0 or not word.strip():
+                continue
+            confidences.append(conf)
+            key = (data['block_num'][i], data['par_num'][i], data['line_num'][i])
+            lines.setdefault(key, []).append(word)
+        text = "\n".join(" ".join(words) for _, words in sorted(lines.items()))
+        confidence = sum(confidences) / len(confidences) if confidences else 0.0
+        return text, confidence
+
+
+def create_ocr_backend(name=None, lang=None):
+    """Build the configured backend; ``auto`` prefers a warm tesserocr engine"""
+    name = name or settings.OCR_BACKEND
+    lang = lang or settings.OCR_LANG
+    if name in ("auto", "tesserocr") and TESSEROCR_AVAILABLE:
+        try:
+            return TesserocrBackend(lang)
+        except RuntimeError:
+            # tessdata missing or unreadable for tesserocr; pytesseract may still work
+            if name == "tesserocr" or not PYTESSERACT_AVAILABLE:
+                raise
+            logger.warning("tesserocr could not initialise, falling back to pytesseract")
+    if name in ("auto", "pytesseract") and PYTESSERACT_AVAILABLE:
+        return PytesseractBackend(lang)
+    raise RuntimeError(f"OCR backend '{name}' is not available")
+
+
+# Tesseract API handles are not thread-safe, so a caller checks an engine
+# out of this process-wide free list for the length of a batch and puts it
+# back afterwards. Engines must outlive the thread that built them:
+# Streamlit runs every rerun in a new script thread, and in-thread
+# (single-page) OCR would otherwise load the model again on each rerun. At
+# most one engine per concurrent OCR call is ever created.
+_idle_backends = []
+_backends_lock = threading.Lock()
+
+
+@contextmanager
+def ocr_backend():
+    """Borrow a warm OCR engine, creating one only when all are in use"""
+    with _backends_lock:
+        backend = _idle_backends.pop() if _idle_backends else None
+    if backend is None:
+        backend = create_ocr_backend()
+    try:
+        yield backend
+    finally:
+        with _backends_lock:
+            _idle_backends.append(backend)
+
+
+def warm_ocr_worker():
+    """Pool initializer: load the Tesseract model before the first page arrives"""
+    with ocr_backend():
+        pass
+
+
+def render_page(page, dpi):
+    """Rasterize a page straight into an 8-bit grayscale PIL image (no PNG round trip)"""
+    import fitz  # PyMuPDF
+    from PIL import Image
+
+    pix = page.get_pixmap(dpi=dpi, colorspace=fitz.csGRAY, alpha=False)
+    return Image.frombuffer("L", (pix.width, pix.height), pix.samples, "raw", "L", pix.stride, 1)
+
+
+def is_blank(image, min_contrast=32):
+    """True for pages with no ink worth re-rendering (e.g. empty backs of scans)"""
+    low, high = image.getextrema()
+    return high - low < min_contrast
+
+
+# Bump when a change to rendering or recognition should invalidate cached text
+OCR_CACHE_VERSION = 1
+
+_ocr_cache = None
+
+# Hit/miss totals for pages OCR'd on behalf of this process (the workers
+# report per page, the counts are aggregated here in the parent)
+OCR_CACHE_STATS = {'hits': 0, 'misses': 0}
+
+
+def get_ocr_cache():
+    """Disk cache of OCR text shared by every worker and Streamlit process"""
+    global _ocr_cache
+    if _ocr_cache is None and settings.OCR_CACHE_MAX_MB > 0:
+        _ocr_cache = DiskCache("ocr", max_bytes=settings.OCR_CACHE_MAX_MB * 1024 * 1024)
+    return _ocr_cache
+
+
+def ocr_cache_key(backend, image):
+    """Key OCR output by the rendered page pixels plus everything that affects recognition"""
+    return content_hash(
+        "ocr", str(OCR_CACHE_VERSION), backend.name, settings.OCR_LANG,
+        f"{settings.OCR_DPI}/{settings.OCR_RETRY_DPI}/{settings.OCR_MIN_CONFIDENCE}",
+        f"{image.width}x{image.height}", image.tobytes(),
+    )
+
+
+def ocr_page(page, backend):
+    """Render one fitz page and OCR it with ``backend``; returns (text, cache_hit).
+
+    Pages are first rendered at ``OCR_DPI`` and looked up in the OCR cache by
+    a hash of those pixels, so a certificate or CV page seen before never
+    reaches Tesseract again. On a miss, the page is only rendered again at
+    ``OCR_RETRY_DPI`` when Tesseract's mean confidence falls below
+    ``OCR_MIN_CONFIDENCE``, and the better-scoring result is kept.
+    """
+    image = render_page(page, settings.OCR_DPI)
+    cache = get_ocr_cache()
+    key = None
+    if cache is not None:
+        key = ocr_cache_key(backend, image)
+        cached = cache.get_text(key)
+        if cached is not None:
+            return cached, True
+
+    text, confidence = backend.recognize(image)
+    if (
+        confidence < settings.OCR_MIN_CONFIDENCE
+        and settings.OCR_RETRY_DPI > settings.OCR_DPI
+        and not is_blank(image)
+    ):
+        retry_text, retry_confidence = backend.recognize(render_page(page, settings.OCR_RETRY_DPI))
+        if retry_confidence > confidence:
+            text = retry_text
+    if cache is not None:
+        cache.put_text(key, text)
+    return text, False
+
+
+def open_pdf(source):
+    """Open a PDF from bytes or from a file path (spooled uploads)"""
+    import fitz  # PyMuPDF
+
+    if isinstance(source, str):
+        return fitz.open(source, filetype="pdf")
+    return fitz.open(stream=source, filetype="pdf")
+
+
+def ocr_page_batch(source, page_nums):
+    """Worker entry point: open the document once and OCR the given pages"""
+    pdf_document = open_pdf(source)
+    try:
+        with ocr_backend() as backend:
+            return [(page_num, *ocr_page(pdf_document[page_num], backend)) for page_num in page_nums]
+    finally:
+        pdf_document.close()
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_ocr_pool():
+    """Long-lived OCR process pool shared by every session in this server.
+
+    Workers are spawned rather than forked because the Streamlit server is
+    multi-threaded by the time the first scanned PDF arrives. Each worker
+    loads its OCR engine once at start-up and keeps it warm for its lifetime.
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=settings.OCR_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=warm_ocr_worker,
+            )
+        return _pool
+
+
+def reset_ocr_pool():
+    """Drop a broken pool so the next call starts fresh workers"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+@timed("ocr_pages")
+def ocr_pages(source, page_nums, workers=None):
+    """OCR ``page_nums`` of a PDF and return {page_num: text}.
+
+    ``source`` is a DocumentBuffer.source: the PDF bytes, or the path of a
+    spooled upload. Pool workers always open the document by path (bytes
+    are spooled to a temp file first), so no copy of it is pickled across
+    the process boundary.
+
+    Pages are dealt round-robin to at most ``workers`` tasks (default
+    ``settings.OCR_WORKERS``) so each worker opens the document only once.
+    Callers reassemble the text in page order from the returned mapping.
+    """
+    page_nums = list(page_nums)
+    if not page_nums:
+        return {}
+    workers = max(1, min(workers or settings.OCR_WORKERS, len(page_nums)))
+    started = time.perf_counter()
+
+    if workers == 1:
+        results = ocr_page_batch(source, page_nums)
+    else:
+        from concurrent.futures.process import BrokenProcessPool
+
+        chunks = [page_nums[i::workers] for i in range(workers)]
+        pool = get_ocr_pool()
+        try:
+            results = []
+            with spooled_path(source) as path:
+                for batch in pool.map(ocr_page_batch, [path] * len(chunks), chunks):
+                    results.extend(batch)
+        except BrokenProcessPool:
+            reset_ocr_pool()
+            raise
+
+    hits = sum(1 for _, _, hit in results if hit)
+    OCR_CACHE_STATS['hits'] += hits
+    OCR_CACHE_STATS['misses'] += len(results) - hits
+
+    annotate(pages=len(page_nums), workers=workers, cores=os.cpu_count() or 1, cache_hits=hits)
+    logger.info(
+        "OCR: %d page(s) on %d worker(s) [%d cores available] in %.2fs; cache %d hit(s), %d miss(es)",
+        len(page_nums), workers, os.cpu_count() or 1, time.perf_counter() - started,
+        hits, len(results) - hits,
+    )
+    return {page_num: text for page_num, text, _ in results}
+
+
+def ocr_cache_stats():
+    """Cumulative OCR cache hits/misses seen by this process"""
+    stats = dict(OCR_CACHE_STATS)
+    total = stats['hits'] + stats['misses']
+    stats['hit_rate'] = stats['hits'] / total if total else 0.0
+    return stats
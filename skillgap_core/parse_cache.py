@@ -0,0 +1,59 @@
+# ==========================================
+# SkillGapAI - Parse Cache
+# Extracted document text keyed by a hash of the uploaded bytes
+# ==========================================
+
+from . import settings
+from .disk_cache import DiskCache, content_hash
+
+# Bump when the extraction logic changes so old cached text is not reused
+PARSER_VERSION = 4
+
+_cache = None
+
+
+class IncompleteParse(Exception):
+    """Raised by a parser whose text is usable but missing parts of the document.
+
+    ``text`` is what was extracted; cached_parse() returns it without caching
+    it, so the full document is parsed again on the next upload.
+    """
+
+    def __init__(self, text, reason=""):
+        super().__init__(reason or "document only partially parsed")
+        self.text = text
+
+
+def get_parse_cache():
+    """Process-wide parse cache; the files underneath are shared by all processes"""
+    global _cache
+    if _cache is None:
+        _cache = DiskCache(
+            "parsed",
+            max_bytes=settings.PARSE_CACHE_MAX_MB * 1024 * 1024,
+            ttl_seconds=settings.PARSE_CACHE_TTL_SECONDS,
+        )
+    return _cache
+
+
+def cached_parse(kind, buffer, parser):
+    """Return ``parser(buffer)``, reusing the text from any earlier identical upload.
+
+    ``buffer`` is an ingest.DocumentBuffer whose SHA-256 was computed while
+    it was read, so the cache lookup never touches the document again.
+    ``kind`` separates formats (e.g. "pdf", "docx") that could share bytes.
+    Empty results, and partial ones (the parser raised IncompleteParse, for
+    example because OCR was not installed yet or failed on a scanned page),
+    are not stored so the document is parsed again next time.
+    """
+    cache = get_parse_cache()
+    key = content_hash(kind, str(PARSER_VERSION), buffer.sha256)
+    text = cache.get_text(key)
+    if text is None:
+        try:
+            text = parser(buffer)
+        except IncompleteParse as e:
+            return e.text
+        if text:
+            cache.put_text(key, text)
+    return text
@@ -0,0 +1,316 @@
+# ==========================================
+# SkillGapAI - Reports
+# Charts, Word and PDF report generation
+# ==========================================
+#
+# matplotlib, python-docx and fpdf are imported inside the functions that
+# need them so importing this module stays cheap.
+
+from datetime import datetime
+from io import BytesIO
+
+from .timing import timed
+
+
+@timed("create_skill_chart")
+def create_skill_chart(gap_analysis):
+    """Create a bar chart for skill analysis"""
+    # Figure (not pyplot) keeps chart rendering free of global state, so it
+    # is safe in headless and multi-threaded use
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
+    categories = ['Matching Skills', 'Missing Skills', 'Additional Skills']
+    values = [len(gap_analysis['matching']), len(gap_analysis['missing']), len(gap_analysis['additional'])]
+    colors = ['#2ecc71', '#e74c3c', '#3498db']
+    bars = ax.bar(categories, values, color=colors, alpha=0.7, edgecolor='black', linewidth=2)
+    for bar in bars:
+        height = bar.get_height()
+        ax.text(bar.get_x() + bar.get_width()/2., height, f'{int(height)}', ha='center', va='bottom', fontsize=12, fontweight='bold')
+    ax.set_ylabel('Number of Skills', fontsize=12, fontweight='bold')
+    ax.set_title('Skill Gap Analysis Overview', fontsize=14, fontweight='bold', pad=20)
+    ax.grid(axis='y', alpha=0.3, linestyle='--')
+    fig.tight_layout()
+    buf = BytesIO()
+    fig.savefig(buf, format='png', dpi=150, bbox_inches='tight')
+    buf.seek(0)
+    return buf
+
+
+def set_cell_border(cell):
+    """Set cell borders in Word document"""
+    from docx.oxml import OxmlElement
+    from docx.oxml.ns import qn
+
+    tc = cell._tc
+    tcPr = tc.get_or_add_tcPr()
+    tcBorders = OxmlElement('w:tcBorders')
+    for edge in ('top', 'left', 'bottom', 'right'):
+        edge_element = OxmlElement(f'w:{edge}')
+        edge_element.set(qn('w:val'), 'single')
+        edge_element.set(qn('w:sz'), '12')
+        edge_element.set(qn('w:space'), '0')
+        edge_element.set(qn('w:color'), '3498db')
+        tcBorders.append(edge_element)
+    tcPr.append(tcBorders)
+
+
+@timed("generate_word_report")
+def generate_word_report(job_title, resume_skills, job_skills, gap_analysis):
+    """Generate Word document report with borders and proper formatting"""
+    from docx import Document
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.shared import Inches, Pt, RGBColor
+
+    doc = Document()
+    sections = doc.sections
+    for section in sections:
+        section.top_margin = Inches(0.75)
+        section.bottom_margin = Inches(0.75)
+        section.left_margin = Inches(0.75)
+        section.right_margin = Inches(0.75)
+    
+    header = doc.add_paragraph()
+    header.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    header_run = header.add_run("🎯 SkillGapAI Analysis Report")
+    header_run.font.size = Pt(24)
+    header_run.font.bold = True
+    header_run.font.color.rgb = RGBColor(102, 126, 234)
+    
+    title_para = doc.add_paragraph()
+    title_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    title_run = title_para.add_run(job_title)
+    title_run.font.size = Pt(18)
+    title_run.font.bold = True
+    title_run.font.color.rgb = RGBColor(118, 75, 162)
+    
+    date_para = doc.add_paragraph()
+    date_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    date_run = date_para.add_run(f"Generated on: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}")
+    date_run.font.size = Pt(10)
+    date_run.font.color.rgb = RGBColor(128, 128, 128)
+    
+    doc.add_paragraph()
+    
+    heading = doc.add_paragraph()
+    heading_run = heading.add_run("📊 Match Score")
+    heading_run.font.size = Pt(16)
+    heading_run.font.bold = True
+    heading_run.font.color.rgb = RGBColor(44, 62, 80)
+    
+    metrics_table = doc.add_table(rows=2, cols=3)
+    metrics_table.style = 'Light Grid Accent 1'
+    headers = ['Overall Match', 'Matching Skills', 'Missing Skills']
+    values = [f"{gap_analysis['match_percentage']:.1f}%", str(len(gap_analysis['matching'])), str(len(gap_analysis['missing']))]
+    
+    for idx, (header, value) in enumerate(zip(headers, values)):
+        cell = metrics_table.rows[0].cells[idx]
+        cell.text = header
+        cell.paragraphs[0].runs[0].font.bold = True
+        cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
+        set_cell_border(cell)
+        
+        cell = metrics_table.rows[1].cells[idx]
+        cell.text = value
+        cell.paragraphs[0].runs[0].font.size = Pt(18)
+        cell.paragraphs[0].runs[0].font.bold = True
+        cell.paragraphs[0].runs[0].font.color.rgb = RGBColor(52, 152, 219)
+        cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
+        set_cell_border(cell)
+    
+    doc.add_paragraph()
+    
+    heading = doc.add_paragraph()
+    heading_run = heading.add_run("📄 Skills in Resume")
+    heading_run.font.size = Pt(16)
+    heading_run.font.bold = True
+    heading_run.font.color.rgb = RGBColor(44, 62, 80)
+    
+    resume_skills_list = []
+    for category, skills in resume_skills.items():
+        for skill_data in skills:
+            resume_skills_list.append(skill_data['skill'])
+    
+    skills_para = doc.add_paragraph()
+    for skill in sorted(resume_skills_list):
+        run = skills_para.add_run(f" {skill} ")
+        run.font.size = Pt(10)
+        run.font.color.rgb = RGBColor(21, 101, 192)
+        skills_para.add_run(" | ")
+    
+    doc.add_paragraph()
+    
+    heading = doc.add_paragraph()
+    heading_run = heading.add_run("💼 Skills Required in Job Description")
+    heading_run.font.size = Pt(16)
+    heading_run.font.bold = True
+    heading_run.font.color.rgb = RGBColor(44, 62, 80)
+    
+    job_skills_list = []
+    for category, skills in job_skills.items():
+        for skill_data in skills:
+            job_skills_list.append(skill_data['skill'])
+    
+    skills_para = doc.add_paragraph()
+    for skill in sorted(job_skills_list):
+        run = skills_para.add_run(f" {skill} ")
+        run.font.size = Pt(10)
+        run.font.color.rgb = RGBColor(230, 81, 0)
+        skills_para.add_run(" | ")
+    
+    doc.add_paragraph()
+    
+    heading = doc.add_paragraph()
+    heading_run = heading.add_run("✅ Matching Skills")
+    heading_run.font.size = Pt(16)
+    heading_run.font.bold = True
+    heading_run.font.color.rgb = RGBColor(44, 62, 80)
+    
+    if gap_analysis['matching']:
+        skills_para = doc.add_paragraph()
+        for skill in sorted(gap_analysis['matching']):
+            run = skills_para.add_run(f" ✓ {skill} ")
+            run.font.size = Pt(10)
+            run.font.color.rgb = RGBColor(21, 87, 36)
+            run.font.bold = True
+            skills_para.add_run(" | ")
+    else:
+        doc.add_paragraph("No matching skills found.")
+    
+    doc.add_paragraph()
+    
+    heading = doc.add_paragraph()
+    heading_run = heading.add_run("❌ Missing Skills (Need to Learn)")
+    heading_run.font.size = Pt(16)
+    heading_run.font.bold = True
+    heading_run.font.color.rgb = RGBColor(44, 62, 80)
+    
+    if gap_analysis['missing']:
+        skills_para = doc.add_paragraph()
+        for skill in sorted(gap_analysis['missing']):
+            run = skills_para.add_run(f" ✗ {skill} ")
+            run.font.size = Pt(10)
+            run.font.color.rgb = RGBColor(114, 28, 36)
+            run.font.bold = True
+            skills_para.add_run(" | ")
+    else:
+        success_para = doc.add_paragraph("You have all the required skills!")
+        success_para.runs[0].font.color.rgb = RGBColor(40, 167, 69)
+        success_para.runs[0].font.bold = True
+    
+    doc.add_paragraph()
+    doc.add_page_break()
+    
+    heading = doc.add_paragraph()
+    heading_run = heading.add_run("📊 Skill Gap Visualization")
+    heading_run.font.size = Pt(16)
+    heading_run.font.bold = True
+    heading_run.font.color.rgb = RGBColor(44, 62, 80)
+    heading.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    
+    chart_buf = create_skill_chart(gap_analysis)
+    doc.add_picture(chart_buf, width=Inches(6))
+    last_paragraph = doc.paragraphs[-1]
+    last_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    
+    doc.add_paragraph()
+    doc.add_page_break()
+    
+    heading = doc.add_paragraph()
+    heading_run = heading.add_run("📚 Learning Recommendations")
+    heading_run.font.size = Pt(16)
+    heading_run.font.bold = True
+    heading_run.font.color.rgb = RGBColor(44, 62, 80)
+    
+    if gap_analysis['missing']:
+        priority_skills = list(gap_analysis['missing'])[:6]
+        for idx, skill in enumerate(priority_skills, 1):
+            skill_heading = doc.add_paragraph()
+            skill_heading_run = skill_heading.add_run(f"{idx}. {skill.title()}")
+            skill_heading_run.font.size = Pt(12)
+            skill_heading_run.font.bold = True
+            skill_heading_run.font.color.rgb = RGBColor(52, 152, 219)
+            
+            resources = get_learning_resources(skill)
+            resource_table = doc.add_table(rows=4, cols=1)
+            resource_table.style = 'Light List Accent 1'
+            resource_data = [
+                f"🎓 Online Courses: {resources['online_courses']}",
+                f"📖 Documentation: {resources['documentation']}",
+                f"💻 Practice: {resources['practice']}",
+                f"👥 Communities: {resources['communities']}"
+            ]
+            
+            for row_idx, resource_text in enumerate(resource_data):
+                cell = resource_table.rows[row_idx].cells[0]
+                cell.text = resource_text
+                cell.paragraphs[0].runs[0].font.size = Pt(10)
+                set_cell_border(cell)
+            doc.add_paragraph()
+        
+        doc.add_paragraph()
+        learning_heading = doc.add_paragraph()
+        learning_heading_run = learning_heading.add_run("📅 Suggested 8-Week Learning Path")
+        learning_heading_run.font.size = Pt(14)
+        learning_heading_run.font.bold = True
+        learning_heading_run.font.color.rgb = RGBColor(102, 126, 234)
+        
+        learning_steps = [
+            "Week 1-2: Focus on the top 2 priority skills",
+            "Week 3-4: Learn the next 2-3 skills",
+            "Week 5-6: Build projects incorporating new skills",
+            "Week 7-8: Refine and add to your resume/portfolio"
+        ]
+        for step in learning_steps:
+            para = doc.add_paragraph(step, style='List Bullet')
+            para.runs[0].font.size = Pt(11)
+    else:
+        success_para = doc.add_paragraph("🌟 Congratulations! You have all the required skills for this position.")
+        success_para.runs[0].font.color.rgb = RGBColor(40, 167, 69)
+        success_para.runs[0].font.bold = True
+        success_para.runs[0].font.size = Pt(12)
+    
+    doc.add_paragraph()
+    doc.add_paragraph()
+    footer = doc.add_paragraph()
+    footer.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    footer_run = footer.add_run("SkillGapAI - Empowering Career Growth Through AI")
+    footer_run.font.size = Pt(10)
+    footer_run.font.color.rgb = RGBColor(128, 128, 128)
+    
+    tip = doc.add_paragraph()
+    tip.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    tip_run = tip.add_run("💡 Keep your resume updated with new skills as you learn them!")
+    tip_run.font.size = Pt(9)
+    tip_run.font.color.rgb = RGBColor(150, 150, 150)
+    
+    doc_io = BytesIO()
+    doc.save(doc_io)
+    doc_io.seek(0)
+    return doc_io
+
+
+@timed("generate_pdf_report")
+def generate_pdf_report(overall_match, matched, missing, skill_rows):
+    """Generate the Milestone 4 PDF summary; ``skill_rows`` yields (skill, resume score, job score)"""
+    from fpdf import FPDF
+
+    pdf = FPDF()
+    pdf.add_page()
+    pdf.set_font("Arial", size=12)
+
+    pdf.cell(200, 10, txt="SkillGapAI - Skill Gap Report", ln=True, align='C')
+    pdf.ln(10)
+
+    pdf.cell(200, 10, txt=f"Overall Match: {overall_match}%", ln=True)
+    pdf.cell(200, 10, txt=f"Matched Skills: {matched}", ln=True)
+    pdf.cell(200, 10, txt=f"Missing Skills: {missing}", ln=True)
+
+    pdf.ln(10)
+    pdf.cell(200, 10, txt="Skill Comparison:", ln=True)
+
+    for skill, resume_score, job_score in skill_rows:
+        pdf.cell(200, 10, txt=f"{skill} - Resume: {resume_score}%, Job: {job_score}%", ln=True)
+
+    return pdf.output(dest='S').encode('latin1')
@@ -0,0 +1,145 @@
+# ==========================================
+# SkillGapAI - Cross-Encoder Re-ranking
+# Second opinion on the borderline "partial" band of the bi-encoder
+# ==========================================
+#
+# Bi-encoder cosines between PARTIAL_THRESHOLD and MATCH_THRESHOLD are where
+# most wrong verdicts are. Only those JD skills are re-scored: each is
+# paired with its RERANK_TOP_K closest resume skills, at most
+# RERANK_MAX_PAIRS pairs in total, and the pairs are sent to the
+# cross-encoder together. Pairs are scored in RERANK_BATCH_SIZE chunks;
+# once RERANK_BUDGET_MS has elapsed the remaining JD skills keep their
+# bi-encoder verdict. The budget is only checked between chunks, so one
+# chunk is the smallest unit it can cut: the default of 16 pairs is a
+# quarter of the default pair cap.
+#
+# Cross-encoder scores are not cosines, so the new verdict uses its own
+# thresholds. The stsb-* cross-encoders regress the STS-B label divided by
+# 5, so a score maps back onto the STS-B annotation scale:
+# RERANK_MATCH_THRESHOLD (0.7, label 3.5) sits between "roughly
+# equivalent" (3) and "mostly equivalent" (4), and RERANK_PARTIAL_THRESHOLD
+# (0.4, label 2) is "not equivalent, but share some details"; anything below
+# is missing. Set both explicitly when switching to a model trained on a
+# different scale.
+
+import time
+
+from . import settings
+from .semantic import MATCH_THRESHOLD, PARTIAL_THRESHOLD
+from .timing import timed
+
+
+@timed("load_cross_encoder")
+def load_cross_encoder(model_name=None):
+    """Load the sentence-transformers CrossEncoder used for re-ranking"""
+    from sentence_transformers import CrossEncoder
+
+    return CrossEncoder(model_name or settings.RERANK_MODEL, device="cpu")
+
+
+def rerank_candidates(similarity, match_threshold=MATCH_THRESHOLD, partial_threshold=PARTIAL_THRESHOLD,
+                      top_k=None, max_pairs=None):
+    """Return [(jd index, [resume indices])] for partial-band JD skills, closest first"""
+    import numpy as np
+
+    top_k = top_k or settings.RERANK_TOP_K
+    max_pairs = max_pairs or settings.RERANK_MAX_PAIRS
+    scores = np.where(np.isnan(similarity), -np.inf, similarity.astype(np.float32))
+    best = scores.max(axis=0)
+    band = np.flatnonzero((best >= partial_threshold) & (best < match_threshold))
+    # The closest calls are the most likely to flip, so they get the budget first
+    band = band[np.argsort(-best[band])]
+
+    candidates = []
+    pairs = 0
+    for j in band.tolist():
+        rows = np.argsort(-scores[:, j])[:top_k].tolist()
+        rows = rows[:max_pairs - pairs]
+        if not rows:
+            break
+        candidates.append((j, rows))
+        pairs += len(rows)
+    return candidates
+
+
+@timed("rerank_partials")
+def rerank_partials(cross_encoder, result, resume_skills, jd_skills,
+                    match_threshold=MATCH_THRESHOLD, partial_threshold=PARTIAL_THRESHOLD,
+                    top_k=None, max_pairs=None, budget_ms=None,
+                    rerank_match_threshold=None, rerank_partial_threshold=None):
+    """Re-score the partial band of a match_skills result with a cross-encoder.
+
+    ``match_threshold`` / ``partial_threshold`` are the cosine thresholds
+    that defined the partial band; the cross-encoder's own score is judged
+    against ``rerank_match_threshold`` / ``rerank_partial_threshold``
+    (default settings.RERANK_MATCH_THRESHOLD / RERANK_PARTIAL_THRESHOLD).
+    Returns a new result with updated matched / partial / missing lists,
+    details and overall_match, plus ``rerank`` statistics. Re-scored rows
+    get a "Re-ranked Score (%)" column and the closest resume skill
+    according to the cross-encoder.
+    """
+    if rerank_match_threshold is None:
+        rerank_match_threshold = settings.RERANK_MATCH_THRESHOLD
+    if rerank_partial_threshold is None:
+        rerank_partial_threshold = settings.RERANK_PARTIAL_THRESHOLD
+    budget = (budget_ms if budget_ms is not None else settings.RERANK_BUDGET_MS) / 1000
+    started = time.perf_counter()
+    candidates = rerank_candidates(result['similarity'], match_threshold, partial_threshold, top_k, max_pairs)
+    pairs = [(jd_skills[j], resume_skills[i]) for j, rows in candidates for i in rows]
+
+    scores = []
+    exhausted = False
+    batch_size = settings.RERANK_BATCH_SIZE
+    for start in range(0, len(pairs), batch_size):
+        if time.perf_counter() - started > budget:
+            exhausted = True
+            break
+        scores.extend(float(s) for s in cross_encoder.predict(pairs[start:start + batch_size]))
+
+    verdicts = {}
+    for bucket in ('matched', 'partial', 'missing'):
+        for skill in result[bucket]:
+            verdicts.setdefault(skill, bucket)
+    verdicts = [verdicts[skill] for skill in jd_skills]
+    details = [dict(row) for row in result['details']]
+
+    rescored = promoted = demoted = 0
+    offset = 0
+    for j, rows in candidates:
+        if offset + len(rows) > len(scores):
+            break  # out of budget: keep the bi-encoder verdict
+        pair_scores = scores[offset:offset + len(rows)]
+        offset += len(rows)
+        best = max(range(len(rows)), key=pair_scores.__getitem__)
+        score = pair_scores[best]
+        if score >= rerank_match_threshold:
+            verdicts[j] = 'matched'
+            promoted += 1
+        elif score < rerank_partial_threshold:
+            verdicts[j] = 'missing'
+            demoted += 1
+        details[j]["Closest Resume Skill"] = resume_skills[rows[best]]
+        details[j]["Re-ranked Score (%)"] = round(score * 100, 2)
+        rescored += 1
+
+    buckets = {'matched': [], 'partial': [], 'missing': []}
+    for skill, verdict in zip(jd_skills, verdicts):
+        buckets[verdict].append(skill)
+    overall_match = round(((len(buckets['matched']) + 0.5 * len(buckets['partial'])) / len(jd_skills)) * 100, 2) \
+        if jd_skills else 0.0
+
+    return dict(
+        result,
+        **buckets,
+        details=details,
+        overall_match=overall_match,
+        rerank={
+            'candidates': len(candidates),
+            'rescored': rescored,
+            'pairs_scored': len(scores),
+            'promoted': promoted,
+            'demoted': demoted,
+            'budget_exhausted': exhausted,
+            'seconds': round(time.perf_counter() - started, 4),
+        },
+    )
@@ -0,0 +1,192 @@
+# ==========================================
+# SkillGapAI - Semantic Skill Matching
+# BERT sentence embeddings and matched / partial / missing classification
+# ==========================================
+#
+# sentence_transformers / torch (or onnxruntime, see encoders.py) is only
+# imported when an encoder is actually loaded. The encoder is wrapped in a
+# CachedEncoder so skill strings seen before (by any worker) are read from
+# the embedding cache.
+
+from . import settings
+from .skill_matcher import normalize_term
+from .taxonomy import get_taxonomy
+from .timing import timed
+
+DEFAULT_MODEL = 'all-MiniLM-L6-v2'
+
+# Cosine similarity thresholds used by Milestone 3
+MATCH_THRESHOLD = 0.8
+PARTIAL_THRESHOLD = 0.5
+
+
+def encoder_namespace(model_name, backend):
+    """Cache namespace for a model on a resolved backend; backends give slightly different vectors"""
+    return model_name if backend == "torch" else f"{model_name}-{backend}"
+
+
+@timed("load_encoder")
+def load_encoder(model_name=DEFAULT_MODEL, backend=None):
+    """Load the model used to embed skill strings on the configured backend"""
+    from .encoders import create_encoder, resolve_backend
+
+    backend = resolve_backend(backend)
+    encoder = create_encoder(model_name, backend)
+    if settings.ENCODER_BATCH_WINDOW_MS > 0:
+        from .batching import BatchingEncoder
+
+        # Shared across sessions, so concurrent cache misses share forward passes
+        encoder = BatchingEncoder(encoder, settings.ENCODER_MAX_BATCH, settings.ENCODER_BATCH_WINDOW_MS)
+    if settings.EMBEDDING_CACHE_MAX_ENTRIES <= 0:
+        return encoder
+
+    from .embedding_cache import CachedEncoder, get_embedding_cache
+
+    # Each backend gets its own cache
+    cache = get_embedding_cache(encoder_namespace(model_name, backend), encoder.get_sentence_embedding_dimension())
+    return CachedEncoder(encoder, cache)
+
+
+@timed("encode_skills")
+def encode_skills(encoder, resume_skills, jd_skills):
+    """L2-normalized float32 embeddings for both skill lists"""
+    import numpy as np
+
+    # One encode call for both lists so shared strings are embedded once
+    embeddings = np.asarray(encoder.encode(list(resume_skills) + list(jd_skills)), dtype=np.float32)
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    embeddings /= np.maximum(norms, 1e-12)
+    return embeddings[:len(resume_skills)], embeddings[len(resume_skills):]
+
+
+def similarity_matrix(encoder, resume_skills, jd_skills, dtype=None):
+    """Cosine similarity of every resume skill (rows) to every JD skill (columns).
+
+    ``dtype`` defaults to ``settings.SIMILARITY_DTYPE``; float16 halves the
+    matrix for very long skill lists.
+    """
+    resume_embeddings, jd_embeddings = encode_skills(encoder, resume_skills, jd_skills)
+    return (resume_embeddings @ jd_embeddings.T).astype(dtype or settings.SIMILARITY_DTYPE, copy=False)
+
+
+def summarize_matches(best, max_sim, resume_skills, jd_skills,
+                      match_threshold=MATCH_THRESHOLD, partial_threshold=PARTIAL_THRESHOLD):
+    """Build the classify_matches result from each JD skill's best resume row and score"""
+    import numpy as np
+
+    max_sim = np.asarray(max_sim, dtype=np.float32)
+    # 0 = matched, 1 = partial, 2 = missing
+    verdict = (max_sim < match_threshold).astype(np.int8) + (max_sim < partial_threshold)
+    buckets = [[jd_skills[j] for j in np.flatnonzero(verdict == v).tolist()] for v in range(3)]
+    matched, partial, missing = buckets
+
+    scores = np.round(max_sim.astype(np.float64) * 100, 2).tolist()
+    details = [
+        {"Job Skill": jd_skill, "Closest Resume Skill": resume_skills[b], "Similarity Score (%)": score}
+        for jd_skill, b, score in zip(jd_skills, np.asarray(best).tolist(), scores)
+    ]
+
+    overall_match = round(((len(matched) + 0.5 * len(partial)) / len(jd_skills)) * 100, 2) if jd_skills else 0.0
+    return {
+        'matched': matched,
+        'partial': partial,
+        'missing': missing,
+        'details': details,
+        'overall_match': overall_match,
+    }
+
+
+@timed("classify_matches")
+def classify_matches(similarity, resume_skills, jd_skills,
+                     match_threshold=MATCH_THRESHOLD, partial_threshold=PARTIAL_THRESHOLD):
+    """Bucket each JD skill by its best resume similarity.
+
+    Returns {'matched', 'partial', 'missing', 'details', 'overall_match'}
+    where ``details`` holds one row per JD skill with its closest resume
+    skill and score, and partial matches count half towards the overall %.
+    """
+    import numpy as np
+
+    if not len(jd_skills):
+        return summarize_matches([], [], resume_skills, jd_skills, match_threshold, partial_threshold)
+    best = similarity.argmax(axis=0)
+    max_sim = similarity[best, np.arange(similarity.shape[1])]
+    return summarize_matches(best, max_sim, resume_skills, jd_skills, match_threshold, partial_threshold)
+
+
+def classify_embeddings(resume_embeddings, jd_embeddings, resume_skills, jd_skills,
+                        match_threshold=MATCH_THRESHOLD, partial_threshold=PARTIAL_THRESHOLD, block_cols=None):
+    """classify_matches straight from normalized embeddings, without the full matrix.
+
+    JD skills are scored ``block_cols`` at a time (``settings.SIMILARITY_BLOCK_COLS``),
+    so memory stays at one resume x block slice for lists of any length.
+    """
+    import numpy as np
+
+    block_cols = block_cols or settings.SIMILARITY_BLOCK_COLS
+    dtype = np.dtype(settings.SIMILARITY_DTYPE)
+    best = np.zeros(len(jd_skills), dtype=np.int64)
+    max_sim = np.zeros(len(jd_skills), dtype=np.float32)
+    for start in range(0, len(jd_skills), block_cols):
+        block = (resume_embeddings @ jd_embeddings[start:start + block_cols].T).astype(dtype, copy=False)
+        best[start:start + block.shape[1]] = block.argmax(axis=0)
+        max_sim[start:start + block.shape[1]] = block.max(axis=0)
+    return summarize_matches(best, max_sim, resume_skills, jd_skills, match_threshold, partial_threshold)
+
+
+def lexical_key(skill, taxonomy):
+    """Canonical taxonomy key for a skill or alias, else its normalized text"""
+    return taxonomy.canonical(skill) or normalize_term(skill)
+
+
+@timed("match_skills")
+def match_skills(encoder, resume_skills, jd_skills,
+                 match_threshold=MATCH_THRESHOLD, partial_threshold=PARTIAL_THRESHOLD):
+    """classify_matches with a lexical first stage in front of the encoder.
+
+    JD skills equal to a resume skill after normalization and alias folding
+    ("JS" vs "JavaScript") are matched at 100% without touching the model.
+    Only the remaining JD skills, together with the resume skills they are
+    compared against, are encoded. The result has the classify_matches
+    keys plus ``similarity`` (resume x JD, NaN where a column was settled
+    lexically) and ``cascade`` counts with the fraction of encodes skipped.
+    """
+    import numpy as np
+
+    taxonomy = get_taxonomy()
+    resume_rows = {}
+    for i, skill in enumerate(resume_skills):
+        resume_rows.setdefault(lexical_key(skill, taxonomy), i)
+
+    best = np.zeros(len(jd_skills), dtype=np.int64)
+    max_sim = np.zeros(len(jd_skills), dtype=np.float32)
+    similarity = np.full((len(resume_skills), len(jd_skills)), np.nan, dtype=settings.SIMILARITY_DTYPE)
+    leftover = []
+    for j, skill in enumerate(jd_skills):
+        row = resume_rows.get(lexical_key(skill, taxonomy))
+        if row is None:
+            leftover.append(j)
+        else:
+            best[j], max_sim[j] = row, 1.0
+            similarity[row, j] = 1.0
+
+    encoded = 0
+    if leftover and resume_skills:
+        leftover_skills = [jd_skills[j] for j in leftover]
+        resume_embeddings, jd_embeddings = encode_skills(encoder, resume_skills, leftover_skills)
+        block = resume_embeddings @ jd_embeddings.T
+        similarity[:, leftover] = block
+        best[leftover] = block.argmax(axis=0)
+        max_sim[leftover] = block.max(axis=0)
+        encoded = len(resume_skills) + len(leftover)
+
+    result = summarize_matches(best, max_sim, resume_skills, jd_skills, match_threshold, partial_threshold)
+    total = len(resume_skills) + len(jd_skills)
+    result['similarity'] = similarity
+    result['cascade'] = {
+        'lexical_matches': len(jd_skills) - len(leftover),
+        'encoded': encoded,
+        'total': total,
+        'skipped_fraction': round(1 - encoded / total, 4) if total else 0.0,
+    }
+    return result
@@ -0,0 +1,101 @@
+# ==========================================
+# SkillGapAI - Runtime Settings
+# Values can be overridden through environment variables
+# ==========================================
+
+import os
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.dirname(PACKAGE_DIR)
+
+
+def env_float(name, default):
+    """Read a float setting from the environment"""
+    value = os.environ.get(name)
+    return float(value) if value else default
+
+
+def env_int(name, default):
+    """Read an integer setting from the environment"""
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+
+# Directory shared by every on-disk cache (taxonomy snapshots, parse results...)
+CACHE_DIR = os.environ.get("SKILLGAP_CACHE_DIR", os.path.join(PROJECT_DIR, ".skillgap_cache"))
+
+# Skill taxonomy source (JSON or YAML) and how often it is checked for changes
+TAXONOMY_PATH = os.environ.get("SKILLGAP_TAXONOMY", os.path.join(PACKAGE_DIR, "skills_taxonomy.json"))
+TAXONOMY_RELOAD_SECONDS = env_float("SKILLGAP_TAXONOMY_RELOAD_SECONDS", 2.0)
+
+# Parse cache for extracted resume / job description text
+PARSE_CACHE_MAX_MB = env_int("SKILLGAP_PARSE_CACHE_MAX_MB", 256)
+PARSE_CACHE_TTL_SECONDS = env_float("SKILLGAP_PARSE_CACHE_TTL_SECONDS", 7 * 24 * 3600)
+
+# Number of processes used to OCR scanned PDF pages in parallel
+OCR_WORKERS = max(1, env_int("SKILLGAP_OCR_WORKERS", min(4, os.cpu_count() or 1)))
+
+# A PDF page whose text layer has fewer characters than this is OCR'd
+OCR_MIN_PAGE_CHARS = env_int("SKILLGAP_OCR_MIN_PAGE_CHARS", 25)
+
+# Uploads larger than this are spooled to disk and mmap'd instead of held in RAM
+INGEST_SPOOL_MB = env_int("SKILLGAP_INGEST_SPOOL_MB", 8)
+
+# PDF text-layer engine: "auto" (PyMuPDF, then PyPDF2), "pymupdf" or "pypdf2"
+PDF_ENGINE = os.environ.get("SKILLGAP_PDF_ENGINE", "auto")
+# Optional JSONL file receiving one timing record per document and engine
+PDF_ENGINE_TIMING_LOG = os.environ.get("SKILLGAP_PDF_ENGINE_TIMING_LOG", "")
+
+# OCR engine: "auto" (warm tesserocr engines, else pytesseract), "tesserocr" or "pytesseract"
+OCR_BACKEND = os.environ.get("SKILLGAP_OCR_BACKEND", "auto")
+OCR_LANG = os.environ.get("SKILLGAP_OCR_LANG", "eng")
+
+# OCR render resolution; pages scoring below the confidence threshold are re-rendered at OCR_RETRY_DPI.
+# 120 dpi is below the old fixed 2x zoom (144 dpi), so clean pages render and OCR faster
+OCR_DPI = env_int("SKILLGAP_OCR_DPI", 120)
+OCR_RETRY_DPI = env_int("SKILLGAP_OCR_RETRY_DPI", 300)
+OCR_MIN_CONFIDENCE = env_float("SKILLGAP_OCR_MIN_CONFIDENCE", 70.0)
+
+# Disk cache of OCR text per rendered page, shared by all processes (0 disables it)
+OCR_CACHE_MAX_MB = env_int("SKILLGAP_OCR_CACHE_MAX_MB", 512)
+
+# Memory-mapped cache of skill-string embeddings (384 int8 codes + a scale per slot; 0 disables it)
+EMBEDDING_CACHE_MAX_ENTRIES = env_int("SKILLGAP_EMBEDDING_CACHE_MAX_ENTRIES", 100_000)
+
+# Taxonomy rows scored per block by the semantic skill index's top-k search
+SKILL_INDEX_BLOCK_ROWS = env_int("SKILLGAP_SKILL_INDEX_BLOCK_ROWS", 8192)
+
+# Resume x JD similarity matrices: "float32" or "float16" (half the memory), and
+# how many JD skills classify_embeddings scores per block
+SIMILARITY_DTYPE = os.environ.get("SKILLGAP_SIMILARITY_DTYPE", "float32")
+SIMILARITY_BLOCK_COLS = env_int("SKILLGAP_SIMILARITY_BLOCK_COLS", 1024)
+
+# Sentence encoder runtime: "torch", "onnx", "onnx-int8" or "auto" (onnx-int8 if onnxruntime is installed)
+ENCODER_BACKEND = os.environ.get("SKILLGAP_ENCODER_BACKEND", "torch")
+
+# Micro-batching of encode calls across sessions: how long the first request
+# waits for others (0 disables batching) and the largest combined batch
+ENCODER_BATCH_WINDOW_MS = env_float("SKILLGAP_ENCODER_BATCH_WINDOW_MS", 5.0)
+ENCODER_MAX_BATCH = env_int("SKILLGAP_ENCODER_MAX_BATCH", 128)
+
+# Optional cross-encoder re-ranking of "partial" matches: model, resume
+# candidates per JD skill, total pair cap, chunk size and latency budget
+# (checked between chunks, so keep the chunk well below the pair cap)
+RERANK_MODEL = os.environ.get("SKILLGAP_RERANK_MODEL", "cross-encoder/stsb-TinyBERT-L-4")
+RERANK_TOP_K = env_int("SKILLGAP_RERANK_TOP_K", 3)
+RERANK_MAX_PAIRS = env_int("SKILLGAP_RERANK_MAX_PAIRS", 64)
+RERANK_BATCH_SIZE = env_int("SKILLGAP_RERANK_BATCH_SIZE", 16)
+RERANK_BUDGET_MS = env_float("SKILLGAP_RERANK_BUDGET_MS", 250.0)
+
+# Cross-encoder score needed to promote a partial match, and below which it is
+# demoted to missing; on the STS-B / 5 scale of the stsb-* models (see rerank.py)
+RERANK_MATCH_THRESHOLD = env_float("SKILLGAP_RERANK_MATCH_THRESHOLD", 0.7)
+RERANK_PARTIAL_THRESHOLD = env_float("SKILLGAP_RERANK_PARTIAL_THRESHOLD", 0.4)
+
+# Chunk / seam results kept by the incremental extractor behind Milestone 2's live text areas
+INCREMENTAL_CACHE_ENTRIES = env_int("SKILLGAP_INCREMENTAL_CACHE_ENTRIES", 20_000)
+
+# Stage timing export: a JSONL file that gets one line per traced analysis
+# (empty = logger only) and the port serving Prometheus /metrics (0 = off)
+TIMING_LOG = os.environ.get("SKILLGAP_TIMING_LOG", "")
+METRICS_PORT = env_int("SKILLGAP_METRICS_PORT", 0)
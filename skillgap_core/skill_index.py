@@ -0,0 +1,200 @@
+# ==========================================
+# SkillGapAI - Semantic Skill Index
+# Precomputed taxonomy embeddings with top-k nearest-skill search
+# ==========================================
+#
+# Every canonical skill and alias in the taxonomy is embedded once and the
+# L2-normalized matrix is saved as a .npy file next to the taxonomy
+# snapshot, keyed by model name, encoder backend and taxonomy hash.
+# Processes load it with mmap_mode='r', so the matrix is shared and only
+# built again when the taxonomy, the model or the backend changes.
+#
+# Search is an exact blocked matrix product: the taxonomy is scanned in
+# SKILL_INDEX_BLOCK_ROWS slices and a running top-k is kept per phrase, so
+# the score buffer stays small however large the taxonomy grows. The cost
+# is one streaming pass over the matrix per batch of phrases (77 MB at 50k
+# skills x 384 dims), so batch phrases rather than searching one at a time.
+
+import json
+import os
+import re
+import tempfile
+import threading
+
+import numpy as np
+
+from . import settings
+from .taxonomy import get_taxonomy
+
+INDEX_FORMAT = 1
+
+
+def normalize_rows(matrix):
+    """L2-normalize each row so dot products are cosine similarities"""
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.maximum(norms, 1e-12)
+
+
+def blocked_top_k(queries, matrix, k, block_rows=None, row_scales=None):
+    """Return (scores, rows), each (len(queries), k), best first.
+
+    ``queries`` and ``matrix`` must already be normalized. The matrix is
+    processed ``block_rows`` rows at a time, keeping only the best k
+    candidates per query from each block. ``row_scales`` multiplies each
+    row's scores, for matrices stored as scaled integer codes.
+    """
+    block_rows = block_rows or settings.SKILL_INDEX_BLOCK_ROWS
+    k = min(k, len(matrix))
+    if k == 0:
+        return np.empty((len(queries), 0), dtype=np.float32), np.empty((len(queries), 0), dtype=np.int64)
+    candidate_scores, candidate_rows = [], []
+
+    for start in range(0, len(matrix), block_rows):
+        block = np.asarray(matrix[start:start + block_rows], dtype=np.float32)
+        scores = queries @ block.T
+        if row_scales is not None:
+            scores *= row_scales[start:start + block_rows]
+        if scores.shape[1] > k:
+            keep = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            scores = np.take_along_axis(scores, keep, axis=1)
+        else:
+            keep = np.broadcast_to(np.arange(scores.shape[1]), scores.shape)
+        candidate_scores.append(scores)
+        candidate_rows.append(keep + start)
+
+    scores = np.concatenate(candidate_scores, axis=1)
+    rows = np.concatenate(candidate_rows, axis=1)
+    if scores.shape[1] > k:
+        keep = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        scores = np.take_along_axis(scores, keep, axis=1)
+        rows = np.take_along_axis(rows, keep, axis=1)
+    order = np.argsort(-scores, axis=1)
+    return np.take_along_axis(scores, order, axis=1), np.take_along_axis(rows, order, axis=1)
+
+
+class SkillIndex:
+    """Embedding matrix over a taxonomy's skill terms.
+
+    Row ``i`` of ``matrix`` embeds ``terms[i]`` (a canonical skill or one of
+    its aliases) and ``owners[i]`` is the index of its canonical skill in
+    ``skills``, so alias hits are reported under the skill they belong to.
+    """
+
+    def __init__(self, matrix, terms, owners, skills):
+        self.matrix = matrix
+        self.terms = terms
+        self.owners = np.asarray(owners, dtype=np.int64)
+        self.skills = skills
+
+    def __len__(self):
+        return len(self.matrix)
+
+    def search(self, encoder, phrases, k=5, min_score=None, block_rows=None):
+        """Return, per phrase, up to k [(canonical skill, score)] pairs, best first"""
+        if not phrases or not len(self.matrix):
+            return [[] for _ in phrases]
+        queries = normalize_rows(encoder.encode(list(phrases)))
+
+        # Over-fetch so folding several aliases of one skill still leaves k skills
+        scores, rows = blocked_top_k(queries, self.matrix, k * 4, block_rows)
+        owners = self.owners[rows]
+
+        results = []
+        for phrase_scores, phrase_owners in zip(scores.tolist(), owners.tolist()):
+            hits = {}
+            for score, owner in zip(phrase_scores, phrase_owners):
+                if min_score is not None and score < min_score:
+                    break
+                if owner not in hits:
+                    hits[owner] = score
+                    if len(hits) == k:
+                        break
+            results.append([(self.skills[owner], score) for owner, score in hits.items()])
+        return results
+
+
+def index_paths(namespace, taxonomy):
+    """Matrix and metadata paths for an encoder namespace (see semantic.encoder_namespace)"""
+    slug = re.sub(r'[^A-Za-z0-9_.-]+', '_', namespace)
+    base = os.path.join(settings.CACHE_DIR, "skill_index", f"{slug}-{taxonomy.source_sha256[:24]}-v{INDEX_FORMAT}")
+    return base + ".npy", base + ".json"
+
+
+def build_skill_index(encoder, taxonomy):
+    """Embed every skill term of ``taxonomy`` (not saved)"""
+    keys = sorted(taxonomy.skill_categories)
+    skills = [taxonomy.skill_categories[key][0][1] for key in keys]
+    owner_of = {key: i for i, key in enumerate(keys)}
+    terms = sorted(taxonomy.aliases)
+    owners = [owner_of[taxonomy.aliases[term]] for term in terms]
+    matrix = normalize_rows(encoder.encode(terms, batch_size=256))
+    return SkillIndex(matrix, terms, owners, skills)
+
+
+def save_skill_index(index, matrix_path, meta_path):
+    """Atomically write the matrix and term metadata; failures are not fatal"""
+    directory = os.path.dirname(matrix_path)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        for path, write in (
+            (meta_path, lambda f: f.write(json.dumps(
+                {'terms': index.terms, 'owners': index.owners.tolist(), 'skills': index.skills}).encode('utf-8'))),
+            (matrix_path, lambda f: np.save(f, index.matrix)),
+        ):
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, 'wb') as f:
+                write(f)
+            os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def load_skill_index(matrix_path, meta_path):
+    """Memory-map a saved index, or return None if it is missing"""
+    try:
+        with open(meta_path, encoding='utf-8') as f:
+            meta = json.load(f)
+        matrix = np.load(matrix_path, mmap_mode='r')
+    except (OSError, ValueError):
+        return None
+    if len(matrix) != len(meta['terms']):
+        return None
+    return SkillIndex(matrix, meta['terms'], meta['owners'], meta['skills'])
+
+
+_indexes = {}
+_lock = threading.Lock()
+
+
+def get_skill_index(encoder, model_name=None, backend=None):
+    """Index for the current taxonomy, model and backend, loading or building it once per process.
+
+    ``model_name`` and ``backend`` must be the ones ``encoder`` was loaded
+    with (semantic.load_encoder defaults).
+    """
+    from .encoders import resolve_backend
+    from .semantic import DEFAULT_MODEL, encoder_namespace
+
+    namespace = encoder_namespace(model_name or DEFAULT_MODEL, resolve_backend(backend))
+    taxonomy = get_taxonomy()
+    cache_key = (namespace, taxonomy.source_sha256)
+    index = _indexes.get(cache_key)
+    if index is not None:
+        return index
+
+    with _lock:
+        index = _indexes.get(cache_key)
+        if index is None:
+            matrix_path, meta_path = index_paths(namespace, taxonomy)
+            index = load_skill_index(matrix_path, meta_path)
+            if index is None:
+                index = build_skill_index(encoder, taxonomy)
+                save_skill_index(index, matrix_path, meta_path)
+            _indexes[cache_key] = index
+        return index
+
+
+def nearest_skills(encoder, phrases, k=5, min_score=None, model_name=None, backend=None):
+    """Map free-text phrases onto canonical taxonomy skills by embedding similarity"""
+    return get_skill_index(encoder, model_name, backend).search(encoder, phrases, k, min_score)
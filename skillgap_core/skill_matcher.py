@@ -0,0 +1,234 @@
+# ==========================================
+# SkillGapAI - Skill Matcher
+# Aho-Corasick automaton for single-pass skill lookup
+# ==========================================
+
+from array import array
+from collections import deque
+
+# Characters that make a match part of a longer word. A skill only counts
+# when the characters on both sides of it are outside this set, so "java"
+# is not found inside "javascript" and "r" is not found inside "rust".
+WORD_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789_")
+
+# Single-character terms ("r") need stricter boundaries: only whitespace,
+# the text edges, these marks, or a full stop that ends a sentence may sit
+# next to them, so "R&D", "C-level", "A/B testing" and "e.g." do not count.
+SINGLE_CHAR_NEIGHBOURS = frozenset(",;:!?()[]{}\"'")
+
+
+def normalize_term(term):
+    """Lower-case a skill term and collapse internal whitespace"""
+    return " ".join(term.lower().split())
+
+
+class _LazyRows(dict):
+    """state -> row, unpacked from flat CSR arrays the first time a state is visited.
+
+    A matcher restored from a snapshot only pays for the states its texts
+    actually reach instead of rebuilding every trie node up front.
+    """
+
+    def __init__(self, offsets, values, keys=None):
+        super().__init__()
+        self._offsets = offsets
+        self._values = values
+        self._keys = keys
+
+    def __missing__(self, state):
+        lo, hi = self._offsets[state], self._offsets[state + 1]
+        if self._keys is None:
+            row = self._values[lo:hi].tolist()
+        else:
+            row = dict(zip(map(chr, self._keys[lo:hi]), self._values[lo:hi]))
+        self[state] = row
+        return row
+
+
+class SkillMatcher:
+    """Compiled multi-pattern matcher for skill terms.
+
+    Every term is added to a trie, failure links are computed once, and
+    ``find_all`` then walks the text a single time regardless of how many
+    terms are loaded. Text is lower-cased and runs of whitespace are treated
+    as one space, so "Machine\\nLearning" matches "machine learning". Any
+    character is allowed inside a term, which covers skills such as
+    "ci/cd", "c++", "node.js" and "test-driven development".
+    """
+
+    def __init__(self, terms=()):
+        # goto[state] maps a character to the next state, fail[state] is the
+        # failure link and output[state] lists the term ids ending there.
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        self._terms = []
+        self._term_ids = {}
+        self._compiled = False
+        for term in terms:
+            self.add(term)
+
+    def __len__(self):
+        return len(self._terms)
+
+    def __getstate__(self):
+        """Flat layout for pickling: CSR transition / output arrays, no per-state objects"""
+        if not self._compiled:
+            self.compile()
+        edge_offsets, edge_chars, edge_targets = array('i', [0]), array('i'), array('i')
+        output_offsets, output_terms = array('i', [0]), array('i')
+        for state in range(len(self._fail)):
+            row = self._goto[state]
+            edge_chars.extend(map(ord, row))
+            edge_targets.extend(row.values())
+            edge_offsets.append(len(edge_chars))
+            output_terms.extend(self._output[state])
+            output_offsets.append(len(output_terms))
+        return {
+            # Normalized terms never contain a newline
+            'terms': "\n".join(self._terms),
+            'fail': array('i', self._fail),
+            'edges': (edge_offsets, edge_chars, edge_targets),
+            'outputs': (output_offsets, output_terms),
+        }
+
+    def __setstate__(self, state):
+        self._terms = state['terms'].split("\n") if state['terms'] else []
+        self._term_ids = {term: i for i, term in enumerate(self._terms)}
+        self._fail = state['fail'].tolist()
+        edge_offsets, edge_chars, edge_targets = state['edges']
+        self._goto = _LazyRows(edge_offsets, edge_targets, edge_chars)
+        self._output = _LazyRows(*state['outputs'])
+        self._compiled = True
+
+    def _materialize(self):
+        """Unpack every lazily restored state so the trie can be extended"""
+        if isinstance(self._goto, _LazyRows):
+            states = range(len(self._fail))
+            self._goto = [self._goto[s] for s in states]
+            self._output = [self._output[s] for s in states]
+            self._fail = list(self._fail)
+
+    def __contains__(self, term):
+        return normalize_term(term) in self._term_ids
+
+    @property
+    def terms(self):
+        return list(self._terms)
+
+    def add(self, term):
+        """Add a term to the trie and return its normalized form"""
+        key = normalize_term(term)
+        if not key or key in self._term_ids:
+            return key
+        self._materialize()
+        term_id = len(self._terms)
+        self._terms.append(key)
+        self._term_ids[key] = term_id
+
+        state = 0
+        for ch in key:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][ch] = nxt
+            state = nxt
+        self._output[state].append(term_id)
+        self._compiled = False
+        return key
+
+    def compile(self):
+        """Build failure links breadth-first; called lazily before matching"""
+        goto, fail, output = self._goto, self._fail, self._output
+        queue = deque()
+        for state in goto[0].values():
+            fail[state] = 0
+            queue.append(state)
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                link = fail[state]
+                while link and ch not in goto[link]:
+                    link = fail[link]
+                candidate = goto[link].get(ch, 0)
+                fail[nxt] = candidate if candidate != nxt else 0
+                output[nxt] = output[nxt] + output[fail[nxt]]
+        self._compiled = True
+        return self
+
+    def find_all(self, text):
+        """Return (start, end, term) for every whole-word match in ``text``.
+
+        Offsets index into the original ``text`` so callers can slice or
+        highlight it directly. Overlapping matches are all reported, e.g.
+        "react native" yields both "react native" and "react".
+        """
+        if not self._compiled:
+            self.compile()
+        goto, fail, output, terms = self._goto, self._fail, self._output, self._terms
+
+        matches = []
+        # positions[k] is the index in ``text`` of the k-th normalized char
+        positions = []
+        state = 0
+        prev_space = True
+        for i, raw in enumerate(text):
+            if raw.isspace():
+                if prev_space:
+                    continue
+                chars = " "
+                prev_space = True
+            else:
+                chars = raw.lower()
+                prev_space = False
+            for ch in chars:
+                positions.append(i)
+                while state and ch not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(ch, 0)
+                for term_id in output[state]:
+                    term = terms[term_id]
+                    start_idx = len(positions) - len(term)
+                    start = positions[start_idx]
+                    if start_idx > 0 and self._is_word_char(text, positions[start_idx - 1]):
+                        continue
+                    if self._is_word_char(text, i + 1):
+                        continue
+                    if len(term) == 1 and not self._stands_alone(text, start, i + 1):
+                        continue
+                    matches.append((start, i + 1, term))
+        matches.sort(key=lambda m: (m[0], -m[1]))
+        return matches
+
+    def count(self, text):
+        """Return {term: {'count': n, 'offsets': [(start, end), ...]}}"""
+        found = {}
+        for start, end, term in self.find_all(text):
+            entry = found.setdefault(term, {'count': 0, 'offsets': []})
+            entry['count'] += 1
+            entry['offsets'].append((start, end))
+        return found
+
+    @staticmethod
+    def _stands_alone(text, start, end):
+        """True if text[start:end] is delimited the way a single-character term must be"""
+        for index in (start - 1, end):
+            if index < 0 or index >= len(text):
+                continue
+            ch = text[index]
+            if ch.isspace() or ch in SINGLE_CHAR_NEIGHBOURS:
+                continue
+            if ch == '.' and index == end and (index + 1 == len(text) or text[index + 1].isspace()):
+                continue
+            return False
+        return True
+
+    @staticmethod
+    def _is_word_char(text, index):
+        if index < 0 or index >= len(text):
+            return False
+        return text[index].lower() in WORD_CHARS
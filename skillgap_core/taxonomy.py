@@ -0,0 +1,223 @@
+# ==========================================
+# SkillGapAI - Skill Taxonomy
+# Loads the external taxonomy file, compiles it into a SkillMatcher
+# and keeps a versioned binary snapshot for fast cold starts
+# ==========================================
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+import time
+from importlib.util import find_spec
+
+from . import settings
+from .skill_matcher import SkillMatcher, normalize_term
+
+YAML_AVAILABLE = find_spec("yaml") is not None
+
+# Bump whenever the pickled layout of Taxonomy or SkillMatcher changes so that
+# stale snapshots are recompiled instead of loaded. The matcher pickles as
+# flat arrays (SkillMatcher.__getstate__), and trie states are unpacked
+# lazily as texts reach them.
+SNAPSHOT_FORMAT = 3
+SNAPSHOT_MAGIC = b"SGTAXv"
+
+
+class Taxonomy:
+    """Compiled skill taxonomy: categories, aliases and one shared matcher.
+
+    Source file layout (JSON or YAML)::
+
+        version: 1
+        soft_categories: [soft_skills]
+        categories:
+          programming:
+            - python
+            - {name: javascript, aliases: [js, ecmascript]}
+        synonyms:
+          amazon web services: aws
+
+    ``aliases`` belong to a single skill while ``synonyms`` is a flat
+    alias -> canonical map that may point at any skill in any category.
+    """
+
+    def __init__(self, data, source_sha256=""):
+        self.version = data.get('version', 1)
+        self.source_sha256 = source_sha256
+        self.soft_categories = set(data.get('soft_categories', []))
+        self.categories = {}
+        # canonical key -> [(category, display name), ...]
+        self.skill_categories = {}
+        # any matchable key (canonical or alias) -> canonical key
+        self.aliases = {}
+
+        for category, entries in data.get('categories', {}).items():
+            names = []
+            for entry in entries:
+                if isinstance(entry, str):
+                    name, aliases = entry, []
+                else:
+                    name, aliases = entry['name'], entry.get('aliases', [])
+                key = normalize_term(name)
+                names.append(name)
+                self.skill_categories.setdefault(key, []).append((category, name))
+                self.aliases[key] = key
+                for alias in aliases:
+                    self.aliases.setdefault(normalize_term(alias), key)
+            self.categories[category] = names
+
+        for alias, canonical in data.get('synonyms', {}).items():
+            canonical_key = normalize_term(canonical)
+            if canonical_key not in self.skill_categories:
+                raise ValueError(f"Synonym '{alias}' points at unknown skill '{canonical}'")
+            self.aliases.setdefault(normalize_term(alias), canonical_key)
+
+        self.matcher = SkillMatcher(self.aliases).compile()
+
+    def __len__(self):
+        return len(self.skill_categories)
+
+    def canonical(self, term):
+        """Return the canonical key for a skill or alias, or None"""
+        return self.aliases.get(normalize_term(term))
+
+    def is_soft(self, term):
+        """True if the skill belongs to any soft-skill category"""
+        key = self.canonical(term)
+        return any(category in self.soft_categories for category, _ in self.skill_categories.get(key, []))
+
+    def find(self, text):
+        """Return {canonical key: {'count', 'offsets'}} with aliases folded in"""
+        return self.fold_matches(self.matcher.find_all(text), text)
+
+    def fold_matches(self, matches, text):
+        """Group sorted (start, end, term) matcher output for ``text`` by canonical skill"""
+        found = {}
+        # Earlier matches that may still contain the current one
+        enclosing = []
+        for start, end, term in matches:
+            enclosing = [m for m in enclosing if m[1] > start]
+            # "js" inside "node.js" is glued to the rest of the longer term by
+            # a non-space character, so it is part of that skill, not its own
+            # mention; "react" inside "react native" stands alone and is kept.
+            if any((m[0] < start and not text[start - 1].isspace()) or (end < m[1] and not text[end].isspace())
+                   for m in enclosing if m[0] <= start and end <= m[1]):
+                continue
+            enclosing.append((start, end))
+            key = self.aliases[term]
+            offsets = found.setdefault(key, {'count': 0, 'offsets': []})['offsets']
+            # "google cloud platform" and "google cloud" both fire on the same
+            # mention; matches arrive longest-first per start, so skip the
+            # shorter ones nested inside a span already recorded for this skill.
+            if offsets and offsets[-1][0] <= start and end <= offsets[-1][1]:
+                continue
+            offsets.append((start, end))
+        for hit in found.values():
+            hit['count'] = len(hit['offsets'])
+        return found
+
+    def extract(self, text):
+        """Return {category: [{'skill', 'count', 'offsets'}, ...]} for the text"""
+        found_skills = {category: [] for category in self.categories}
+        for key, hit in self.find(text).items():
+            for category, skill in self.skill_categories[key]:
+                found_skills[category].append({'skill': skill, 'count': hit['count'], 'offsets': hit['offsets']})
+        return {k: v for k, v in found_skills.items() if v}
+
+
+def parse_taxonomy_source(raw, path):
+    """Decode taxonomy file bytes as YAML or JSON depending on extension"""
+    if path.lower().endswith(('.yaml', '.yml')):
+        if not YAML_AVAILABLE:
+            raise ImportError("PyYAML is required to load YAML taxonomies")
+        import yaml
+        return yaml.safe_load(raw)
+    return json.loads(raw)
+
+
+def snapshot_path(source_sha256):
+    return os.path.join(settings.CACHE_DIR, "taxonomy", f"{source_sha256[:24]}.snapshot")
+
+
+def read_snapshot(path, source_sha256):
+    """Load a compiled taxonomy snapshot, or return None if missing or stale"""
+    try:
+        with open(path, 'rb') as f:
+            header = f.read(len(SNAPSHOT_MAGIC) + 4)
+            if header[:len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC:
+                return None
+            if int.from_bytes(header[len(SNAPSHOT_MAGIC):], 'little') != SNAPSHOT_FORMAT:
+                return None
+            taxonomy = pickle.load(f)
+    except Exception:
+        return None
+    if getattr(taxonomy, 'source_sha256', None) != source_sha256:
+        return None
+    return taxonomy
+
+
+def write_snapshot(path, taxonomy):
+    """Atomically persist a compiled taxonomy so other processes can reuse it"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(SNAPSHOT_MAGIC + SNAPSHOT_FORMAT.to_bytes(4, 'little'))
+            pickle.dump(taxonomy, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError:
+        # A read-only cache directory only costs us the snapshot, not the load
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def load_taxonomy(path=None):
+    """Load a taxonomy from its snapshot, compiling and saving it on a miss"""
+    path = path or settings.TAXONOMY_PATH
+    with open(path, 'rb') as f:
+        raw = f.read()
+    source_sha256 = hashlib.sha256(raw).hexdigest()
+
+    snap = snapshot_path(source_sha256)
+    taxonomy = read_snapshot(snap, source_sha256)
+    if taxonomy is None:
+        taxonomy = Taxonomy(parse_taxonomy_source(raw, path), source_sha256)
+        write_snapshot(snap, taxonomy)
+    return taxonomy
+
+
+_loaded = {}
+_lock = threading.Lock()
+
+
+def get_taxonomy(path=None):
+    """Return the current taxonomy, hot-reloading it when the file changes.
+
+    The file is stat'ed at most once every ``TAXONOMY_RELOAD_SECONDS`` so the
+    check is effectively free on Streamlit reruns. A file that fails to parse
+    keeps the last good taxonomy in service.
+    """
+    path = os.path.abspath(path or settings.TAXONOMY_PATH)
+    now = time.monotonic()
+    entry = _loaded.get(path)
+    if entry and now - entry['checked'] < settings.TAXONOMY_RELOAD_SECONDS:
+        return entry['taxonomy']
+
+    with _lock:
+        entry = _loaded.get(path)
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if entry is None or entry['signature'] != signature:
+            try:
+                taxonomy = load_taxonomy(path)
+            except Exception:
+                if entry is None:
+                    raise
+                taxonomy = entry['taxonomy']
+            entry = {'taxonomy': taxonomy, 'signature': signature}
+            _loaded[path] = entry
+        entry['checked'] = now
+        return entry['taxonomy']
@@ -0,0 +1,282 @@
+# ==========================================
+# SkillGapAI - Stage Timing
+# Per-run timing spans, a waterfall view and Prometheus / JSON-line export
+# ==========================================
+#
+# Pipeline stages are wrapped in span(name) (or decorated with
+# @timed(name)). Every span feeds a process-wide histogram per stage, and,
+# when an analysis is being traced, is also recorded on that run's Trace:
+#
+#     trace = begin_trace("skillgap_app")
+#     ...                      # extraction, matching, charts, reports
+#     finish_trace(trace)      # one JSON line per traced analysis
+#
+# Code inside a span can attach attributes to it with annotate(key=value),
+# e.g. how many pages and workers an OCR call used; they are exported with
+# the span and shown next to its name in the waterfall.
+#
+# The current trace lives in a ContextVar, so each Streamlit session (its
+# own script thread) records only its own spans. A span costs two
+# perf_counter() calls and a locked histogram update, cheap enough to leave
+# on everywhere.
+#
+# Export surfaces:
+#   * finish_trace() logs one JSON line through the "skillgap_core.timing"
+#     logger and, if SKILLGAP_TIMING_LOG is set, appends it to that file
+#   * prometheus_text() renders the histograms in the Prometheus text
+#     format; start_metrics_server() serves it on SKILLGAP_METRICS_PORT
+
+import contextvars
+import functools
+import html
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+from . import settings
+
+logger = logging.getLogger(__name__)
+
+# Histogram bucket upper bounds in seconds
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_current = contextvars.ContextVar('skillgap_trace', default=None)
+
+
+class Histogram:
+    """Cumulative count / sum / bucket counts of durations, in seconds"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.buckets = [0] * len(BUCKETS)
+
+    def observe(self, seconds):
+        self.count += 1
+        self.total += seconds
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                self.buckets[i] += 1
+                break
+
+
+_lock = threading.Lock()
+STAGE_HISTOGRAMS = {}
+ANALYSIS_HISTOGRAMS = {}
+
+
+def _observe(histograms, name, seconds):
+    with _lock:
+        histogram = histograms.get(name)
+        if histogram is None:
+            histogram = histograms[name] = Histogram()
+        histogram.observe(seconds)
+
+
+class Trace:
+    """Spans recorded during one analysis run.
+
+    Each span is a dict with ``stage``, ``start_ms`` (from the start of the
+    trace), ``duration_ms`` and ``depth`` (nesting level), in the order the
+    spans started, plus ``attrs`` when annotate() was called inside it.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.started_at = datetime.now(timezone.utc)
+        self.started = time.perf_counter()
+        self.total_ms = None
+        self.spans = []
+        self.depth = 0
+        self.open = []
+
+    def elapsed_ms(self):
+        if self.total_ms is not None:
+            return self.total_ms
+        return (time.perf_counter() - self.started) * 1000
+
+    def stage_totals(self):
+        """Total milliseconds per stage name (repeated stages are summed)"""
+        totals = {}
+        for span in self.spans:
+            totals[span['stage']] = totals.get(span['stage'], 0.0) + span['duration_ms']
+        return {stage: round(ms, 3) for stage, ms in totals.items()}
+
+    def as_dict(self):
+        return {
+            'trace': self.name,
+            'started': self.started_at.isoformat(timespec='milliseconds'),
+            'total_ms': round(self.elapsed_ms(), 3),
+            'stages': self.stage_totals(),
+            'spans': self.spans,
+        }
+
+
+@contextmanager
+def span(name):
+    """Time the enclosed block as stage ``name``"""
+    trace = _current.get()
+    record = None
+    if trace is not None:
+        record = {'stage': name, 'start_ms': 0.0, 'duration_ms': 0.0, 'depth': trace.depth}
+        # Appended up front so spans stay in start order when they nest
+        trace.spans.append(record)
+        trace.open.append(record)
+        trace.depth += 1
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        finished = time.perf_counter()
+        _observe(STAGE_HISTOGRAMS, name, finished - started)
+        if record is not None:
+            trace.open.pop()
+            trace.depth -= 1
+            record['start_ms'] = round((started - trace.started) * 1000, 3)
+            record['duration_ms'] = round((finished - started) * 1000, 3)
+
+
+def timed(name):
+    """Decorator form of span()"""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def annotate(**attrs):
+    """Attach ``attrs`` to the innermost open span of the current trace (no-op when not tracing)"""
+    trace = _current.get()
+    if trace is not None and trace.open:
+        trace.open[-1].setdefault('attrs', {}).update(attrs)
+
+
+def begin_trace(name):
+    """Start recording spans for one run of ``name`` in the current context"""
+    trace = Trace(name)
+    _current.set(trace)
+    return trace
+
+
+def current_trace():
+    return _current.get()
+
+
+def finish_trace(trace):
+    """Stop ``trace`` and export it; runs that recorded no spans are not exported"""
+    if _current.get() is trace:
+        _current.set(None)
+    if trace.total_ms is not None:
+        return trace
+    trace.total_ms = (time.perf_counter() - trace.started) * 1000
+    if not trace.spans:
+        return trace
+
+    _observe(ANALYSIS_HISTOGRAMS, trace.name, trace.total_ms / 1000)
+    line = json.dumps(trace.as_dict(), separators=(',', ':'))
+    logger.info(line)
+    if settings.TIMING_LOG:
+        try:
+            with _lock, open(settings.TIMING_LOG, 'a', encoding='utf-8') as f:
+                f.write(line + "\n")
+        except OSError as e:
+            logger.warning("could not write timing log %s: %s", settings.TIMING_LOG, e)
+    return trace
+
+
+def _label(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _histogram_lines(metric, label, histograms):
+    lines = [f"# TYPE {metric} histogram"]
+    for name, histogram in sorted(histograms.items()):
+        key = f'{label}="{_label(name)}"'
+        cumulative = 0
+        for bound, count in zip(BUCKETS, histogram.buckets):
+            cumulative += count
+            lines.append(f'{metric}_bucket{{{key},le="{bound}"}} {cumulative}')
+        lines.append(f'{metric}_bucket{{{key},le="+Inf"}} {histogram.count}')
+        lines.append(f'{metric}_sum{{{key}}} {histogram.total:.6f}')
+        lines.append(f'{metric}_count{{{key}}} {histogram.count}')
+    return lines
+
+
+def prometheus_text():
+    """Stage and per-analysis duration histograms in the Prometheus text format"""
+    with _lock:
+        lines = ["# HELP skillgap_stage_duration_seconds Time spent in each pipeline stage"]
+        lines += _histogram_lines('skillgap_stage_duration_seconds', 'stage', STAGE_HISTOGRAMS)
+        lines.append("# HELP skillgap_analysis_duration_seconds Wall time of traced analysis runs")
+        lines += _histogram_lines('skillgap_analysis_duration_seconds', 'trace', ANALYSIS_HISTOGRAMS)
+    return "\n".join(lines) + "\n"
+
+
+_server = None
+
+
+def start_metrics_server(port=None):
+    """Serve prometheus_text() at /metrics from a daemon thread (once per process).
+
+    ``port`` defaults to settings.METRICS_PORT; 0 disables the server.
+    Returns the server, or None when disabled or the port is taken.
+    """
+    global _server
+    port = settings.METRICS_PORT if port is None else port
+    with _lock:
+        if _server is not None or port <= 0:
+            return _server
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = prometheus_text().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        try:
+            _server = ThreadingHTTPServer(('', port), MetricsHandler)
+        except OSError as e:
+            logger.warning("metrics server not started on port %d: %s", port, e)
+            return None
+        threading.Thread(target=_server.serve_forever, name='skillgap-metrics', daemon=True).start()
+        return _server
+
+
+def waterfall_html(trace):
+    """HTML waterfall of a trace's spans: one row per span, bars on a shared time axis"""
+    total = max(trace.elapsed_ms(), max((s['start_ms'] + s['duration_ms'] for s in trace.spans), default=0), 1e-6)
+    rows = []
+    for s in trace.spans:
+        label = html.escape(s['stage'])
+        if s.get('attrs'):
+            details = " ".join(f"{key}={value}" for key, value in s['attrs'].items())
+            label += f" <span style='color:#888'>{html.escape(details)}</span>"
+        left = 100 * s['start_ms'] / total
+        width = max(100 * s['duration_ms'] / total, 0.5)
+        rows.append(
+            "<div style='display:flex;align-items:center;font-size:12px;margin:2px 0'>"
+            f"<div style='width:45%;padding-left:{8 * s['depth']}px;overflow:hidden;white-space:nowrap'>"
+            f"{label}</div>"
+            "<div style='width:35%;position:relative;height:10px;background:#eee;border-radius:2px'>"
+            f"<div style='position:absolute;left:{left:.2f}%;width:{width:.2f}%;height:10px;"
+            "background:#1E3D59;border-radius:2px'></div></div>"
+            f"<div style='width:20%;text-align:right'>{s['duration_ms']:.1f} ms</div></div>"
+        )
+    header = f"<div style='font-size:12px;margin-bottom:4px'><b>{html.escape(trace.name)}</b> — {total:.1f} ms total</div>"
+    return header + "".join(rows)
@@ -0,0 +1,167 @@
+# ==========================================
+# SkillGapAI - Quantized Vector Store
+# int8 embeddings on memory-mapped segments, searched without decompressing
+# ==========================================
+#
+# Each L2-normalized vector is stored as int8 codes plus one float32 scale
+# (code = round(v / scale), scale = max|v| / 127): 388 bytes for a 384-dim
+# MiniLM embedding instead of 1,536. A store is a directory of append-only
+# segments under CACHE_DIR/vectors/<name>/:
+#
+#   seg-000001.ids.json    the caller's ids, in row order
+#   seg-000001.scales.npy  float32 (n,)
+#   seg-000001.codes.npy   int8 (n, dim); written last, so a segment only
+#                          becomes visible once it is complete
+#
+# Segments are mmap'd, so every worker shares the same pages. Cosine
+# search multiplies the query with the int8 codes block by block and
+# rescales per row (skill_index.blocked_top_k), so the fp32 matrix is never
+# built. measure_recall() compares the results with exact fp32 search.
+
+import glob
+import json
+import os
+import re
+import tempfile
+import threading
+
+import numpy as np
+
+from . import settings
+from .embedding_cache import file_lock, quantize_rows
+from .skill_index import blocked_top_k, normalize_rows
+
+
+def quantize(vectors):
+    """Return (int8 codes, float32 per-row scales) for L2-normalized vectors"""
+    return quantize_rows(normalize_rows(vectors))
+
+
+class Segment:
+    def __init__(self, prefix):
+        self.prefix = prefix
+        with open(prefix + ".ids.json", encoding='utf-8') as f:
+            self.ids = json.load(f)
+        # Built once so search() can fancy-index ids without a per-query copy
+        self.id_array = np.asarray(self.ids, dtype=object)
+        self.scales = np.load(prefix + ".scales.npy", mmap_mode='r')
+        self.codes = np.load(prefix + ".codes.npy", mmap_mode='r')
+
+    def __len__(self):
+        return len(self.codes)
+
+
+class QuantizedVectorStore:
+    """Append-only int8 vector store with top-k cosine search."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.segments = []
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self.refresh()
+
+    def refresh(self):
+        """Pick up segments written by other processes"""
+        with self._lock:
+            known = {segment.prefix for segment in self.segments}
+            for codes_path in sorted(glob.glob(os.path.join(self.directory, "seg-*.codes.npy"))):
+                prefix = codes_path[:-len(".codes.npy")]
+                if prefix not in known:
+                    self.segments.append(Segment(prefix))
+
+    def __len__(self):
+        return sum(len(segment) for segment in self.segments)
+
+    @property
+    def dim(self):
+        return self.segments[0].codes.shape[1] if self.segments else None
+
+    def add(self, ids, vectors):
+        """Quantize ``vectors`` and write them, with their ids, as a new segment"""
+        ids = [str(i) for i in ids]
+        if len(ids) != len(vectors):
+            raise ValueError("ids and vectors must have the same length")
+        if not ids:
+            return
+        codes, scales = quantize(vectors)
+        if self.dim is not None and codes.shape[1] != self.dim:
+            raise ValueError(f"Expected {self.dim}-dim vectors, got {codes.shape[1]}")
+
+        with file_lock(os.path.join(self.directory, "lock")):
+            numbers = [int(re.search(r'seg-(\d+)', p).group(1))
+                       for p in glob.glob(os.path.join(self.directory, "seg-*.codes.npy"))]
+            prefix = os.path.join(self.directory, f"seg-{max(numbers, default=0) + 1:06d}")
+            for suffix, write in (
+                (".ids.json", lambda f: f.write(json.dumps(ids).encode('utf-8'))),
+                (".scales.npy", lambda f: np.save(f, scales)),
+                (".codes.npy", lambda f: np.save(f, codes)),
+            ):
+                fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+                with os.fdopen(fd, 'wb') as f:
+                    write(f)
+                os.replace(tmp_path, prefix + suffix)
+        self.refresh()
+
+    def search(self, queries, k=10, block_rows=None):
+        """Return, per query vector, up to k [(id, cosine)] pairs, best first"""
+        queries = normalize_rows(np.atleast_2d(queries))
+        merged_scores, merged_ids = [], []
+        for segment in self.segments:
+            scores, rows = blocked_top_k(queries, segment.codes, k, block_rows, row_scales=segment.scales)
+            merged_scores.append(scores)
+            merged_ids.append(segment.id_array[rows])
+        if not merged_scores:
+            return [[] for _ in queries]
+
+        scores = np.concatenate(merged_scores, axis=1)
+        ids = np.concatenate(merged_ids, axis=1)
+        order = np.argsort(-scores, axis=1)[:, :k]
+        return [
+            list(zip(row_ids.tolist(), row_scores.tolist()))
+            for row_ids, row_scores in zip(np.take_along_axis(ids, order, axis=1),
+                                           np.take_along_axis(scores, order, axis=1))
+        ]
+
+    def memory_report(self):
+        """On-disk / mapped bytes versus the same vectors in fp32"""
+        vectors = len(self)
+        code_bytes = sum(segment.codes.nbytes for segment in self.segments)
+        scale_bytes = sum(segment.scales.nbytes for segment in self.segments)
+        fp32_bytes = vectors * (self.dim or 0) * 4
+        return {
+            'vectors': vectors,
+            'dim': self.dim,
+            'segments': len(self.segments),
+            'code_bytes': code_bytes,
+            'scale_bytes': scale_bytes,
+            'fp32_bytes': fp32_bytes,
+            'compression': round(fp32_bytes / (code_bytes + scale_bytes), 2) if vectors else 0.0,
+        }
+
+    def clear(self):
+        with self._lock, file_lock(os.path.join(self.directory, "lock")):
+            for path in glob.glob(os.path.join(self.directory, "seg-*")):
+                os.remove(path)
+            self.segments = []
+
+
+def measure_recall(store, queries, vectors, ids, k=10):
+    """Mean recall@k of the store against exact fp32 search over ``vectors``"""
+    exact_scores, exact_rows = blocked_top_k(normalize_rows(queries), normalize_rows(vectors), k)
+    ids = np.asarray([str(i) for i in ids], dtype=object)
+    approx = store.search(queries, k)
+    hits = [len(set(ids[rows].tolist()) & {i for i, _ in found}) / len(rows)
+            for rows, found in zip(exact_rows, approx)]
+    return float(np.mean(hits)) if hits else 0.0
+
+
+_stores = {}
+
+
+def get_vector_store(name):
+    """Process-wide store under CACHE_DIR/vectors/<name>"""
+    store = _stores.get(name)
+    if store is None:
+        store = _stores[name] = QuantizedVectorStore(os.path.join(settings.CACHE_DIR, "vectors", name))
+    return store
@@ -5,7 +5,10 @@
  
 import streamlit as st
 import docx2txt
-import PyPDF2
+from skillgap_core.ingest import open_document
+from skillgap_core.pdf_engines import extract_page_texts
+from skillgap_core.timing import timed
+from ui_timing import render_timing_panel, start_page_trace
 import re
  
 # ------------------------------------------
@@ -13,6 +16,8 @@ import re
 # ------------------------------------------
 st.set_page_config(page_title="SkillGapAI - Milestone 1", layout="wide")
  
+run_trace = start_page_trace("milestone1")
+ 
 st.markdown(
     """
     <h2 style='color:white; background-color:#1E3D59; padding:15px; border-radius:10px'>
@@ -33,14 +38,15 @@ def clean_text(text):
     text = text.replace('\r', '').replace('\n', ' ')
     return text.strip()
  
+@timed("extract_text")
 def extract_text(uploaded_file):
     """Extract plain text from PDF, DOCX, or TXT"""
     text = ""
     try:
         if uploaded_file.name.lower().endswith(".pdf"):
-            pdf_reader = PyPDF2.PdfReader(uploaded_file)
-            for page in pdf_reader.pages:
-                content = page.extract_text()
+            with open_document(uploaded_file) as buffer:
+                page_texts, _ = extract_page_texts(buffer)
+            for content in page_texts:
                 if content:
                     text += content + "\n"
         elif uploaded_file.name.lower().endswith(".docx"):
@@ -117,4 +123,9 @@ st.markdown("---")
 st.markdown(
     "<p style='text-align:center; color:gray;'>Milestone 1 • Data Ingestion & Parsing • SkillGapAI Project • Developed by Suriya Varshan</p>",
     unsafe_allow_html=True
-)
\ No newline at end of file
+)
+ 
+# ------------------------------------------
+# STAGE TIMINGS
+# ------------------------------------------
+render_timing_panel(run_trace)
@@ -0,0 +1,50 @@
+import random
+
+import pytest
+
+from skillgap_core import settings
+from skillgap_core.incremental import IncrementalExtractor, chunk_boundaries
+from skillgap_core.taxonomy import get_taxonomy
+
+FILLER = ("worked on", "delivered", "with a focus on", "and", "using", "e.g.", "(", ")", ",", ";", "-", "/")
+EDITS = ("machine learning", "React Native", "Node.js", " R ", "R&D", "", "  ", ".", "data\nscience")
+
+
+@pytest.fixture
+def taxonomy(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "CACHE_DIR", str(tmp_path))
+    return get_taxonomy()
+
+
+def long_text(taxonomy, words, seed):
+    rng = random.Random(seed)
+    terms = sorted(taxonomy.aliases)
+    parts = []
+    for _ in range(words):
+        parts.append(rng.choice(terms) if rng.random() < 0.4 else rng.choice(FILLER))
+        parts.append(rng.choice((" ", " ", " ", "\n", ", ")))
+    return "".join(parts)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_matches_taxonomy_find_on_long_text(taxonomy, seed):
+    text = long_text(taxonomy, 3000, seed)
+    assert len(chunk_boundaries(text)) > 5
+    assert IncrementalExtractor().find(text) == taxonomy.find(text)
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+def test_matches_taxonomy_find_after_edits_near_chunk_boundaries(taxonomy, seed):
+    rng = random.Random(seed)
+    extractor = IncrementalExtractor()
+    text = long_text(taxonomy, 3000, seed)
+    assert extractor.find(text) == taxonomy.find(text)
+
+    for _ in range(40):
+        cut = rng.choice(chunk_boundaries(text)[:-1])
+        # Straddle the boundary, or land just before / after it
+        start = max(0, cut + rng.randint(-12, 4))
+        end = min(len(text), start + rng.randint(0, 16))
+        text = text[:start] + rng.choice(EDITS) + text[end:]
+        assert extractor.find(text) == taxonomy.find(text)
+        assert extractor.last_run['reused_chunks'] > 0
@@ -0,0 +1,35 @@
+import pytest
+
+from skillgap_core import settings
+from skillgap_core.taxonomy import load_taxonomy
+
+
+@pytest.fixture
+def taxonomy(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "CACHE_DIR", str(tmp_path))
+    return load_taxonomy()
+
+
+def test_js_alias_not_found_inside_dotted_frameworks(taxonomy):
+    assert set(taxonomy.find("Python, SQL and Node.js")) == {"python", "sql", "node.js"}
+    found = taxonomy.find("Vue.js and Express.js")
+    assert "javascript" not in found
+    assert found["vue"]["count"] == 1
+    assert found["express"]["count"] == 1
+
+
+def test_bare_js_alias_still_matches(taxonomy):
+    assert taxonomy.find("JS and TypeScript")["javascript"]["count"] == 1
+
+
+def test_overlapping_multi_word_skills_both_found(taxonomy):
+    found = taxonomy.find("Built apps in React Native")
+    assert {"react native", "react"} <= set(found)
+
+
+def test_single_letter_skill_needs_clear_boundaries(taxonomy):
+    for text in ("Led R&D for the platform team", "Ran A/B tests on R/Shiny apps", "C-level reporting, e.g. R-squared"):
+        assert "r" not in taxonomy.find(text), text
+    assert taxonomy.find("Python, R and SQL")["r"]["count"] == 1
+    assert taxonomy.find("Statistics in R.")["r"]["count"] == 1
+    assert taxonomy.find("Languages: (R)")["r"]["count"] == 1
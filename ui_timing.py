@@ -0,0 +1,34 @@
+# ==========================================
+# SkillGapAI - Stage Timing Panel
+# Streamlit side of skillgap_core.timing, shared by every page
+# ==========================================
+#
+# A page calls start_page_trace() right after st.set_page_config() and
+# render_timing_panel() at the very end. Everything timed in between
+# (skillgap_core stages and the page's own span() blocks) lands on one
+# trace. That trace is exported as a JSON line and shown as a sidebar
+# waterfall on request. Kept out of skillgap_core so the core stays
+# Streamlit-free.
+
+import streamlit as st
+
+from skillgap_core.timing import begin_trace, finish_trace, start_metrics_server, waterfall_html
+
+
+def start_page_trace(name):
+    """Start timing this script run (and the /metrics server, if configured)"""
+    start_metrics_server()
+    return begin_trace(name)
+
+
+def render_timing_panel(trace):
+    """Finish ``trace`` and offer a sidebar waterfall of the last run that did any work"""
+    finish_trace(trace)
+    if trace.spans:
+        st.session_state['last_trace'] = trace
+    if st.sidebar.checkbox("🐞 Show stage timings", value=False):
+        last_trace = st.session_state.get('last_trace')
+        if last_trace is None:
+            st.sidebar.caption("Nothing has been timed in this session yet.")
+        else:
+            st.sidebar.markdown(waterfall_html(last_trace), unsafe_allow_html=True)